@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the StorageScaleClient request path.
+
+Isolates the per-call stages of utils/client.py against the mock Storage Scale
+REST server running in-process over TLS:
+
+- config_read: reading scale_config.ini
+- async_client_init: constructing an httpx.AsyncClient (SSL context setup)
+- scale_client_init: constructing a StorageScaleClient (config + client)
+- connect_request: first request on a fresh client (TCP connect, TLS
+  handshake and request)
+- keepalive_request: request on an already connected client
+- call_path: what every *_api function does per call, i.e. open a
+  StorageScaleClient on the shared connection pool, issue one GET and close it
+- call_path_private: the same with a private client and connection per call
+- client_overhead / error_wrapping: the client's own success and error
+  handling with the network replaced by httpx.MockTransport
+- response_json_<n> / list_filesets_<n>: JSON decode of n-fileset listings,
+  in memory and end-to-end over a kept-alive connection
+
+Every stage reports min/median/mean/p95 and operations per second. Results
+are written as a JSON report that can be compared between commits with
+--compare.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+
+from mock_scale_server import MockScaleServer, SyntheticCluster
+from scale_mcp_server.utils.client import (
+    StorageScaleAPIError,
+    StorageScaleClient,
+    close_shared_clients,
+)
+from scale_mcp_server.utils.helpers import percentile
+from scale_mcp_server.utils.read_config import read_config, scale_config_path
+
+VERSION_ENDPOINT = "/scalemgmt/v3/version"
+FILESETS_ENDPOINT = "/scalemgmt/v3/filesystems/fs0/filesets"
+
+
+class Bench:
+    """Run stages and collect their timings."""
+
+    def __init__(self, iterations: int, max_seconds: float, only: list[str]):
+        self.iterations = iterations
+        self.max_seconds = max_seconds
+        self.only = only
+        self.results: dict[str, dict[str, Any]] = {}
+
+    def selected(self, name: str) -> bool:
+        return not self.only or any(name.startswith(prefix) for prefix in self.only)
+
+    async def measure(
+        self,
+        name: str,
+        body: Callable[[Any], Awaitable[Any]],
+        setup: Optional[Callable[[], Awaitable[Any]]] = None,
+        teardown: Optional[Callable[[Any], Awaitable[None]]] = None,
+        warmup: int = 3,
+        **extra: Any,
+    ) -> None:
+        """Time body(state) repeatedly; setup and teardown are not timed.
+
+        Stops after the configured iterations or max_seconds, whichever comes
+        first, but always collects at least five samples.
+        """
+        if not self.selected(name):
+            return
+        samples: list[float] = []
+        deadline = time.monotonic() + self.max_seconds
+        for i in range(warmup + self.iterations):
+            state = await setup() if setup else None
+            started = time.perf_counter()
+            await body(state)
+            elapsed = (time.perf_counter() - started) * 1000
+            if teardown:
+                await teardown(state)
+            if i >= warmup:
+                samples.append(elapsed)
+                if len(samples) >= 5 and time.monotonic() > deadline:
+                    break
+
+        median = percentile(samples, 50)
+        self.results[name] = {
+            "samples": len(samples),
+            "min_ms": round(min(samples), 4),
+            "median_ms": round(median, 4),
+            "mean_ms": round(sum(samples) / len(samples), 4),
+            "p95_ms": round(percentile(samples, 95), 4),
+            "ops_per_s": round(1000 / median, 1) if median else 0.0,
+            **extra,
+        }
+        print(
+            f"{name:<28} median {median:10.4f} ms   p95 "
+            f"{self.results[name]['p95_ms']:10.4f} ms   ({len(samples)} samples)",
+            file=sys.stderr,
+        )
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _mock_client(handler: Callable[[httpx.Request], httpx.Response]) -> Any:
+    """Create a StorageScaleClient whose session never touches the network."""
+    client = StorageScaleClient(shared=False)
+    client.session = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Start the mock server and run all selected stages."""
+    sizes = sorted(set(args.sizes))
+    cluster = SyntheticCluster(
+        nodes=4,
+        filesystems=1,
+        filesets=max(sizes),
+        snapshots=0,
+        quotas=0,
+        seed=args.seed,
+    )
+    mock = MockScaleServer(cluster, seed=args.seed)
+    await mock.start("127.0.0.1")
+    workdir = Path(tempfile.mkdtemp(prefix="bench-client-"))
+    config_path = mock.write_config(workdir / "scale_config.ini")
+    os.environ["SCALE_CONFIG_PATH"] = str(config_path)
+    base_url = f"https://127.0.0.1:{mock.ports['v3']}"
+
+    bench = Bench(args.iterations, args.max_seconds, args.stage)
+
+    async def close(client: Any) -> None:
+        if isinstance(client, StorageScaleClient):
+            await client.session.aclose()
+        else:
+            await client.aclose()
+
+    try:
+        # Configuration and client construction
+
+        async def config_read(state: Any) -> None:
+            read_config(config_path=scale_config_path())
+
+        await bench.measure("config_read", config_read)
+
+        clients: list[Any] = []
+
+        async def async_client_init(state: Any) -> None:
+            clients.append(
+                httpx.AsyncClient(
+                    base_url=base_url,
+                    auth=("admin", "admin"),
+                    timeout=httpx.Timeout(timeout=30.0),
+                    verify=False,
+                )
+            )
+
+        async def async_client_init_verify(state: Any) -> None:
+            clients.append(
+                httpx.AsyncClient(
+                    base_url=base_url,
+                    auth=("admin", "admin"),
+                    timeout=httpx.Timeout(timeout=30.0),
+                    verify=True,
+                )
+            )
+
+        async def scale_client_init(state: Any) -> None:
+            clients.append(StorageScaleClient(shared=False))
+
+        async def close_last(state: Any) -> None:
+            await close(clients.pop())
+
+        await bench.measure("async_client_init", async_client_init, teardown=close_last)
+        await bench.measure(
+            "async_client_init_verify", async_client_init_verify, teardown=close_last
+        )
+        await bench.measure("scale_client_init", scale_client_init, teardown=close_last)
+
+        # Connection setup versus a kept-alive connection
+
+        async def fresh_client() -> StorageScaleClient:
+            return StorageScaleClient(shared=False)
+
+        async def get_version(client: StorageScaleClient) -> None:
+            await client.get(VERSION_ENDPOINT)
+
+        await bench.measure(
+            "connect_request", get_version, setup=fresh_client, teardown=close
+        )
+
+        persistent = StorageScaleClient(shared=False)
+        await persistent.get(VERSION_ENDPOINT)
+
+        async def keepalive_request(state: Any) -> None:
+            await persistent.get(VERSION_ENDPOINT)
+
+        await bench.measure("keepalive_request", keepalive_request)
+
+        async def call_path(state: Any) -> None:
+            async with StorageScaleClient() as client:
+                await client.get(VERSION_ENDPOINT)
+
+        async def call_path_private(state: Any) -> None:
+            async with StorageScaleClient(shared=False) as client:
+                await client.get(VERSION_ENDPOINT)
+
+        await bench.measure("call_path", call_path)
+        await bench.measure("call_path_private", call_path_private)
+        await close_shared_clients()
+
+        # Client-side success and error handling without the network
+
+        version_body = json.dumps({"serverVersion": "6.0.0.0"}).encode()
+        error_body = json.dumps({"code": 404, "message": "Resource not found"}).encode()
+        ok_client = _mock_client(
+            lambda request: httpx.Response(200, content=version_body)
+        )
+        error_client = _mock_client(
+            lambda request: httpx.Response(404, content=error_body)
+        )
+
+        async def client_overhead(state: Any) -> None:
+            await ok_client.get(VERSION_ENDPOINT)
+
+        async def error_wrapping(state: Any) -> None:
+            try:
+                await error_client.get(VERSION_ENDPOINT)
+            except StorageScaleAPIError:
+                pass
+
+        await bench.measure("client_overhead", client_overhead)
+        await bench.measure("error_wrapping", error_wrapping)
+        await close(ok_client)
+        await close(error_client)
+
+        # JSON decode of large listings
+
+        filesets = list(cluster.data["filesets"]["fs0"].values())
+        for size in sizes:
+            payload = json.dumps(
+                {"filesets": filesets[:size], "next_page_token": ""}
+            ).encode()
+
+            async def make_response(payload: bytes = payload) -> httpx.Response:
+                return httpx.Response(200, content=payload)
+
+            async def decode(response: httpx.Response) -> None:
+                response.json()
+
+            async def list_filesets(state: Any, size: int = size) -> None:
+                await persistent.get(FILESETS_ENDPOINT, params={"page_size": size})
+
+            await bench.measure(
+                f"response_json_{size}",
+                decode,
+                setup=make_response,
+                warmup=1,
+                payload_bytes=len(payload),
+            )
+            await bench.measure(
+                f"list_filesets_{size}",
+                list_filesets,
+                warmup=1,
+                payload_bytes=len(payload),
+            )
+
+        await close(persistent)
+    finally:
+        await mock.stop()
+
+    results = bench.results
+    derived: dict[str, float] = {}
+    if "connect_request" in results and "keepalive_request" in results:
+        derived["connection_setup_ms"] = round(
+            results["connect_request"]["median_ms"]
+            - results["keepalive_request"]["median_ms"],
+            4,
+        )
+    if "error_wrapping" in results and "client_overhead" in results:
+        derived["error_overhead_ms"] = round(
+            results["error_wrapping"]["median_ms"]
+            - results["client_overhead"]["median_ms"],
+            4,
+        )
+
+    return {
+        "revision": _git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": sys.version.split()[0],
+        "httpx": httpx.__version__,
+        "parameters": {
+            "iterations": args.iterations,
+            "max_seconds": args.max_seconds,
+            "sizes": sizes,
+        },
+        "stages": results,
+        "derived": derived,
+    }
+
+
+def compare(old_path: Path, new_path: Path) -> None:
+    """Print the relative change of the median of every stage of two reports."""
+    old = json.loads(old_path.read_text())
+    new = json.loads(new_path.read_text())
+    print(f"{'stage':<28} {old['revision']:>12} {new['revision']:>12} {'change':>9}")
+    for stage in sorted(set(old["stages"]) & set(new["stages"])):
+        a = old["stages"][stage]["median_ms"]
+        b = new["stages"][stage]["median_ms"]
+        change = f"{(b - a) / a * 100:+.1f}%" if a else "n/a"
+        print(f"{stage:<28} {a:>12} {b:>12} {change:>9}")
+
+
+def main():
+    """Run the micro-benchmarks or compare two reports."""
+    parser = argparse.ArgumentParser(
+        description="StorageScaleClient request path micro-benchmarks",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Run all stages and write a report
+  python bench_client.py --output client.json
+
+  # Only the JSON decode stages, up to 100k filesets
+  python bench_client.py --stage response_json list_filesets --sizes 10000 100000
+
+  # Compare two reports, e.g. before and after a change
+  python bench_client.py --compare base.json client.json
+        """,
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=200, help="Samples per stage (default: 200)"
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=5.0,
+        help="Time budget per stage in seconds (default: 5)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 50000],
+        help="Fileset counts for the JSON decode stages",
+    )
+    parser.add_argument(
+        "--stage", nargs="+", default=[], help="Only run stages with these prefixes"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to a file")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        type=Path,
+        metavar=("OLD", "NEW"),
+        help="Compare two JSON reports instead of running",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    # Keep the client's log records but do not spend time writing them out
+    for name in ("fastmcp", "scale_mcp_server"):
+        logger = logging.getLogger(name)
+        logger.handlers = [logging.NullHandler()]
+        logger.propagate = False
+
+    report = asyncio.run(run(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""HTTP/1.1 versus HTTP/2 fan-out benchmark for StorageScaleClient.
+
+Starts the mock Storage Scale REST server in-process with HTTP/2 enabled and
+issues bursts of concurrent GET requests the way the fan-out tools do, one
+StorageScaleClient per request. Three client modes are compared:
+
+- per_call: a private httpx client per request (no connection reuse)
+- pooled_http1: the shared connection pool over HTTP/1.1
+- pooled_http2: the shared connection pool over HTTP/2
+
+For every mode the benchmark reports the number of TCP/TLS connections the
+mock accepted, wall time, throughput and per-request latency percentiles.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from mock_scale_server import MockScaleServer, SyntheticCluster
+from scale_mcp_server.utils.client import (
+    HTTP2_AVAILABLE,
+    StorageScaleClient,
+    close_shared_clients,
+)
+from scale_mcp_server.utils.helpers import percentile
+
+MODES = {
+    "per_call": {"shared": False, "http2": False},
+    "pooled_http1": {"shared": True, "http2": False},
+    "pooled_http2": {"shared": True, "http2": True},
+}
+
+
+async def run_mode(
+    name: str, mock: MockScaleServer, args: argparse.Namespace
+) -> dict[str, Any]:
+    """Issue args.rounds bursts of args.requests concurrent GETs in one mode."""
+    options = MODES[name]
+    rng = random.Random(args.seed)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def request(endpoint: str) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                async with StorageScaleClient(**options) as client:
+                    await client.get(endpoint)
+            except Exception:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    connections_before = mock.connections
+    started = time.perf_counter()
+    for _ in range(args.rounds):
+        endpoints = [
+            f"/scalemgmt/v3/filesystems/fs0/filesets/fset{rng.randrange(1, args.filesets + 1):06d}"
+            for _ in range(args.requests)
+        ]
+        await asyncio.gather(*(request(endpoint) for endpoint in endpoints))
+    duration = time.perf_counter() - started
+    await close_shared_clients()
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "connections": mock.connections - connections_before,
+        "duration_s": round(duration, 3),
+        "throughput_per_s": round(len(latencies) / duration, 1),
+        "latency": {
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+        },
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Start the mock server and run the selected modes."""
+    cluster = SyntheticCluster(
+        nodes=4, filesystems=1, filesets=args.filesets, snapshots=0, quotas=0
+    )
+    mock = MockScaleServer(cluster, latency=args.latency, seed=args.seed, http2=True)
+    await mock.start("127.0.0.1")
+    workdir = Path(tempfile.mkdtemp(prefix="bench-http2-"))
+    os.environ["SCALE_CONFIG_PATH"] = str(
+        mock.write_config(workdir / "scale_config.ini")
+    )
+    try:
+        results = {}
+        for name in args.mode:
+            print(f"Running mode '{name}'...", file=sys.stderr)
+            results[name] = await run_mode(name, mock, args)
+        return {
+            "parameters": {
+                "requests": args.requests,
+                "rounds": args.rounds,
+                "concurrency": args.concurrency,
+                "latency": args.latency,
+            },
+            "modes": results,
+        }
+    finally:
+        await mock.stop()
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(
+        description="StorageScaleClient HTTP/1.1 versus HTTP/2 fan-out benchmark",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # 10 bursts of 500 concurrent requests with ~5 ms upstream latency
+  python bench_http2.py --requests 500 --rounds 10 --latency uniform:2:8
+        """,
+    )
+    parser.add_argument(
+        "--requests", type=int, default=200, help="Requests per burst (default: 200)"
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="Number of bursts (default: 5)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=100,
+        help="Maximum requests in flight (default: 100)",
+    )
+    parser.add_argument(
+        "--filesets", type=int, default=1000, help="Filesets in the mock cluster"
+    )
+    parser.add_argument(
+        "--latency",
+        default="uniform:2:8",
+        help="Mock latency distribution (default: uniform:2:8)",
+    )
+    parser.add_argument(
+        "--mode",
+        nargs="+",
+        choices=list(MODES),
+        default=list(MODES),
+        help="Client modes to run (default: all)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to a file")
+    args = parser.parse_args()
+
+    if "pooled_http2" in args.mode and not HTTP2_AVAILABLE:
+        parser.error("pooled_http2 requires the h2 package (pip install h2)")
+
+    report = asyncio.run(run(args))
+    print(
+        f"{'mode':<14} {'conns':>6} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'errors':>6}"
+    )
+    for name, result in report["modes"].items():
+        latency = result["latency"]
+        print(
+            f"{name:<14} {result['connections']:>6} {result['throughput_per_s']:>9} "
+            f"{latency['p50_ms']:>8} {latency['p95_ms']:>8} {latency['p99_ms']:>8} "
+            f"{result['errors']:>6}"
+        )
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Throughput benchmark for the -Y output parser of utils/mmparse.py.
+
+Generates mmlsfileset -Y output with the full set of columns and
+percent-encoded paths and creation times, then parses it with a few
+selected columns and with all columns. Reports rows per second and the
+memory held by the resulting tables.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Optional
+
+from scale_mcp_server.utils.mmparse import parse_mm_output
+
+# Leading columns of mmlsfileset -Y, followed by the AFM attributes
+COLUMNS = [
+    "version",
+    "reserved",
+    "reserved",
+    "filesystemName",
+    "filesetName",
+    "id",
+    "rootInode",
+    "status",
+    "path",
+    "parentId",
+    "created",
+    "inodes",
+    "dataInKB",
+    "comment",
+    "filesetMode",
+] + [f"afmAttribute{index}" for index in range(80)]
+
+SELECTED = ["filesetName", "id", "path"]
+
+
+def generate(rows: int) -> list[str]:
+    """Generate mmlsfileset -Y output lines."""
+    empty = ":" * (len(COLUMNS) - 13)
+    lines = ["mmlsfileset::HEADER:" + ":".join(COLUMNS) + ":"]
+    for index in range(rows):
+        lines.append(
+            f"mmlsfileset::0:1:::gpfs0:fset{index:07d}:{index}:{index}:Linked:"
+            f"%2Fgpfs%2Fgpfs0%2Ffset{index:07d}:0:"
+            f"Mon Jan  1 10%3A00%3A00 2024:0:0:{empty}"
+        )
+    return lines
+
+
+def bench(lines: list[str], columns: Optional[list[str]]) -> dict[str, Any]:
+    """Parse the lines and measure throughput and table memory."""
+    started = time.perf_counter()
+    tables = parse_mm_output(lines, columns)
+    duration = time.perf_counter() - started
+    del tables
+
+    # Tracing slows parsing down, so memory is measured in a second pass
+    tracemalloc.start()
+    tables = parse_mm_output(lines, columns)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rows = tables["mmlsfileset"].rows
+    return {
+        "rows": rows,
+        "columns": len(tables["mmlsfileset"].columns),
+        "duration_s": round(duration, 3),
+        "rows_per_s": round(rows / duration),
+        "table_mb": round(memory / 2**20, 1),
+    }
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(
+        description="Throughput benchmark for the -Y output parser",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python bench_mmparse.py --rows 2000000 --output mmparse.json
+        """,
+    )
+    parser.add_argument(
+        "--rows", type=int, default=1000000, help="Rows to parse (default: 1000000)"
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report to a file")
+    args = parser.parse_args()
+
+    print(f"Generating {args.rows} rows...", file=sys.stderr)
+    lines = generate(args.rows)
+    report = {
+        "parameters": {"rows": args.rows, "line_columns": len(COLUMNS)},
+        "selected": bench(lines, SELECTED),
+        "all": bench(lines, None),
+    }
+
+    print(f"{'columns':<10} {'rows/s':>12} {'seconds':>9} {'table MB':>9}")
+    for name in ("selected", "all"):
+        result = report[name]
+        print(
+            f"{name:<10} {result['rows_per_s']:>12} {result['duration_s']:>9} "
+            f"{result['table_mb']:>9}"
+        )
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""TLS setup cost benchmark for StorageScaleClient.
+
+Starts the mock Storage Scale REST server in-process with a self-signed
+certificate and verifies it through ca_bundle, as with a private CA. Three
+stages are measured:
+
+- context: building an SSLContext per client the way httpx does by default,
+  versus fetching the shared context of utils/tls.py
+- construct: constructing a StorageScaleClient with a private connection
+  pool, once with a context per client and once with the shared context
+- handshake: the first request of a fresh client, alternating between the
+  v3 and v2 ports, which pays for TCP connect and the TLS handshake, versus
+  a request on a pooled connection. Resumed TLS sessions are counted.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import httpx
+
+from mock_scale_server import MockScaleServer, SyntheticCluster, self_signed_context
+from scale_mcp_server.utils import tls
+from scale_mcp_server.utils.client import StorageScaleClient, close_shared_clients
+from scale_mcp_server.utils.helpers import percentile
+
+ENDPOINTS = {
+    "v3": "/scalemgmt/v3/filesystems",
+    "v2": "/scalemgmt/v2/nodes/node1/health/states",
+}
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Reduce durations in milliseconds to mean and percentiles."""
+    return {
+        "mean_ms": round(sum(samples) / len(samples), 3),
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+    }
+
+
+def timed(run: Callable[[], Any], iterations: int) -> list[float]:
+    """Time a synchronous callable."""
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def bench_context(ca_bundle: str, iterations: int) -> dict[str, Any]:
+    """Compare building a context per client with the shared context."""
+    tls.clear_contexts()
+    return {
+        "per_client_certifi": summarize(
+            timed(lambda: httpx.create_ssl_context(verify=True), iterations)
+        ),
+        "per_client_ca_bundle": summarize(
+            timed(lambda: tls._create_context(True, ca_bundle), iterations)
+        ),
+        "shared": summarize(
+            timed(lambda: tls.ssl_context(True, ca_bundle), iterations)
+        ),
+    }
+
+
+def bench_construct(iterations: int) -> dict[str, Any]:
+    """Compare client construction with a context per client and shared."""
+
+    def construct_fresh() -> None:
+        tls.clear_contexts()
+        StorageScaleClient(shared=False)
+
+    private = timed(construct_fresh, iterations)
+    tls.clear_contexts()
+    shared = timed(lambda: StorageScaleClient(shared=False), iterations)
+    return {"per_client_context": summarize(private), "shared": summarize(shared)}
+
+
+async def first_request(client: StorageScaleClient, endpoint: str) -> bool:
+    """Send a request and report whether its connection resumed a session."""
+    upstream = next(iter(client.upstreams.values()))
+    async with upstream.session.stream("GET", endpoint) as response:
+        await response.aread()
+        stream = response.extensions.get("network_stream")
+        ssl_object = stream.get_extra_info("ssl_object") if stream else None
+        response.raise_for_status()
+        return bool(ssl_object and ssl_object.session_reused)
+
+
+async def bench_handshake(mock: MockScaleServer, iterations: int) -> dict[str, Any]:
+    """Compare fresh connections on both ports with pooled requests."""
+    results: dict[str, Any] = {}
+    for name, fresh_context in (
+        ("per_client_context", True),
+        ("shared_context", False),
+    ):
+        tls.clear_contexts()
+        samples, resumed = [], 0
+        connections_before = mock.connections
+        for i in range(iterations):
+            api_version = "v2" if i % 2 else "v3"
+            started = time.perf_counter()
+            if fresh_context:
+                tls.clear_contexts()
+            async with StorageScaleClient(
+                shared=False, api_version=api_version
+            ) as client:
+                resumed += await first_request(client, ENDPOINTS[api_version])
+            samples.append((time.perf_counter() - started) * 1000)
+        results[name] = {
+            **summarize(samples),
+            "connections": mock.connections - connections_before,
+            "resumed_sessions": resumed,
+        }
+
+    samples = []
+    connections_before = mock.connections
+    async with StorageScaleClient(shared=False) as client:
+        await first_request(client, ENDPOINTS["v3"])
+        for _ in range(iterations):
+            started = time.perf_counter()
+            await first_request(client, ENDPOINTS["v3"])
+            samples.append((time.perf_counter() - started) * 1000)
+    results["pooled"] = {
+        **summarize(samples),
+        "connections": mock.connections - connections_before,
+    }
+    return results
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Start the mock server and run the stages."""
+    context = self_signed_context()
+    ca_bundle = context.cert_file  # type: ignore[attr-defined]
+    mock = MockScaleServer(SyntheticCluster(filesystems=1, filesets=0), seed=args.seed)
+    await mock.start("127.0.0.1", ssl_context=context)
+    workdir = Path(tempfile.mkdtemp(prefix="bench-tls-"))
+    config = mock.write_config(workdir / "scale_config.ini")
+    config.write_text(
+        config.read_text().replace(
+            "allow_insecure = true", f"allow_insecure = false\nca_bundle = {ca_bundle}"
+        )
+    )
+    os.environ["SCALE_CONFIG_PATH"] = str(config)
+    try:
+        print("Running stage 'context'...", file=sys.stderr)
+        context_results = bench_context(ca_bundle, args.iterations)
+        print("Running stage 'construct'...", file=sys.stderr)
+        construct_results = bench_construct(args.iterations)
+        print("Running stage 'handshake'...", file=sys.stderr)
+        handshake_results = await bench_handshake(mock, args.connections)
+        await close_shared_clients()
+        return {
+            "parameters": {
+                "iterations": args.iterations,
+                "connections": args.connections,
+            },
+            "context": context_results,
+            "construct": construct_results,
+            "handshake": handshake_results,
+        }
+    finally:
+        await mock.stop()
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(
+        description="StorageScaleClient TLS setup cost benchmark",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python bench_tls.py --iterations 200 --connections 100 --output tls.json
+        """,
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=100,
+        help="Contexts and clients built per variant (default: 100)",
+    )
+    parser.add_argument(
+        "--connections",
+        type=int,
+        default=50,
+        help="Fresh connections per variant (default: 50)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to a file")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(f"{'stage':<10} {'variant':<22} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    for stage in ("context", "construct", "handshake"):
+        for variant, result in report[stage].items():
+            print(
+                f"{stage:<10} {variant:<22} {result['mean_ms']:>9} "
+                f"{result['p50_ms']:>9} {result['p95_ms']:>9}"
+            )
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
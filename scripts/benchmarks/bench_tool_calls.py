@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""End-to-end tool-call throughput benchmark over the HTTP transport.
+
+Starts the mock Storage Scale REST server in-process, launches
+scale-mcp-server --transport http against it and drives concurrent MCP
+clients through representative tool mixes. For every mix the benchmark
+reports p50/p95/p99 latency, throughput, upstream REST requests per tool call
+and the server's resident memory, and writes everything to a JSON report
+that can be compared between commits with --compare.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import httpx
+from fastmcp.client import Client
+from fastmcp.client.transports.http import StreamableHttpTransport
+
+from mock_scale_server import build_parser, server_from_args
+from scale_mcp_server.utils.helpers import percentile
+
+
+def _fileset(rng: random.Random, args: argparse.Namespace) -> str:
+    return f"fset{rng.randrange(1, args.filesets + 1):06d}"
+
+
+def _filesystem(rng: random.Random, args: argparse.Namespace) -> str:
+    return f"fs{rng.randrange(args.filesystems)}"
+
+
+# Tool mixes: weighted lists of (tool name, argument factory)
+MIXES: dict[str, list[tuple[int, str, Callable[..., dict]]]] = {
+    "list_heavy": [
+        (4, "list_filesets", lambda rng, a: {"filesystem": _filesystem(rng, a)}),
+        (
+            3,
+            "list_filesystem_snapshots",
+            lambda rng, a: {"filesystem": _filesystem(rng, a)},
+        ),
+        (2, "list_quotas", lambda rng, a: {"filesystem": _filesystem(rng, a)}),
+        (1, "list_nsds", lambda rng, a: {}),
+        (1, "get_nodes_status", lambda rng, a: {}),
+        (
+            2,
+            "get_fileset",
+            lambda rng, a: {
+                "filesystem": _filesystem(rng, a),
+                "fileset_name": _fileset(rng, a),
+            },
+        ),
+    ],
+    "mutation_heavy": [
+        (
+            3,
+            "create_filesystem_snapshot",
+            lambda rng, a: {
+                "filesystem": _filesystem(rng, a),
+                "snapshot_data": {"snapshotName": f"bench-{rng.getrandbits(48):x}"},
+            },
+        ),
+        (
+            2,
+            "update_fileset",
+            lambda rng, a: {
+                "filesystem": _filesystem(rng, a),
+                "fileset_name": _fileset(rng, a),
+                "fileset_data": {"comment": "benchmark"},
+            },
+        ),
+        (
+            2,
+            "set_quota",
+            lambda rng, a: {
+                "filesystem": _filesystem(rng, a),
+                "quota_data": {
+                    "objectName": _fileset(rng, a),
+                    "quotaType": "FILESET",
+                    "blockQuota": "10G",
+                },
+            },
+        ),
+        (
+            1,
+            "get_fileset",
+            lambda rng, a: {
+                "filesystem": _filesystem(rng, a),
+                "fileset_name": _fileset(rng, a),
+            },
+        ),
+    ],
+    "health_polling": [
+        (4, "get_node_health_states", lambda rng, a: {"name": ":all:"}),
+        (2, "get_node_health_events", lambda rng, a: {"name": ":all:"}),
+        (
+            2,
+            "get_filesystem_health_states",
+            lambda rng, a: {"filesystem": _filesystem(rng, a)},
+        ),
+        (2, "get_health_event_changes", lambda rng, a: {}),
+    ],
+}
+
+
+async def _ignore_log(message: Any) -> None:
+    """Drop server log notifications instead of printing them."""
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _memory_kb(pid: int) -> dict[str, int]:
+    """Read the current and peak resident set size of a process in KiB."""
+    memory = {}
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith(("VmRSS:", "VmHWM:")):
+                key, value = line.split(":", 1)
+                memory["rss_kb" if key == "VmRSS" else "peak_rss_kb"] = int(
+                    value.split()[0]
+                )
+    except OSError:
+        pass
+    return memory
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _server_command(port: int) -> list[str]:
+    args = ["--transport", "http", "--port", str(port), "--log-level", "WARNING"]
+    executable = shutil.which("scale-mcp-server")
+    if executable:
+        return [executable] + args
+    return [sys.executable, "-c", "from scale_mcp_server import main; main()"] + args
+
+
+async def _wait_ready(url: str, process: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"MCP server exited with code {process.returncode}")
+        try:
+            async with Client(StreamableHttpTransport(url)) as client:
+                await client.ping()
+                return
+        except Exception:
+            await asyncio.sleep(0.2)
+    raise TimeoutError(f"MCP server at {url} did not become ready")
+
+
+async def _upstream_requests(mock_url: str) -> int:
+    async with httpx.AsyncClient(verify=False) as client:
+        response = await client.get(f"{mock_url}/__mock__/stats")
+        return response.json()["requests"].get("total", 0)
+
+
+async def run_mix(
+    name: str,
+    url: str,
+    mock_url: str,
+    pid: int,
+    args: argparse.Namespace,
+) -> dict[str, Any]:
+    """Drive args.clients concurrent MCP sessions through one tool mix."""
+    weighted = [
+        (tool, factory) for weight, tool, factory in MIXES[name] for _ in range(weight)
+    ]
+    latencies: list[float] = []
+    errors: dict[str, int] = {}
+    per_tool: dict[str, list[float]] = {}
+    calls_left = [args.calls]
+
+    async def worker(index: int) -> None:
+        rng = random.Random(args.seed * 1000 + index)
+        transport = StreamableHttpTransport(url)
+        async with Client(transport, log_handler=_ignore_log) as client:
+            while calls_left[0] > 0:
+                calls_left[0] -= 1
+                tool, factory = rng.choice(weighted)
+                started = time.perf_counter()
+                try:
+                    result = await client.call_tool(
+                        tool, factory(rng, args), raise_on_error=False
+                    )
+                    if result.is_error:
+                        errors["tool_error"] = errors.get("tool_error", 0) + 1
+                except Exception as e:
+                    errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+                elapsed = (time.perf_counter() - started) * 1000
+                latencies.append(elapsed)
+                per_tool.setdefault(tool, []).append(elapsed)
+
+    upstream_before = await _upstream_requests(mock_url)
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(args.clients)))
+    duration = time.perf_counter() - started
+    upstream = await _upstream_requests(mock_url) - upstream_before
+
+    def summary(values: list[float]) -> dict[str, float]:
+        return {
+            "p50_ms": round(percentile(values, 50), 2),
+            "p95_ms": round(percentile(values, 95), 2),
+            "p99_ms": round(percentile(values, 99), 2),
+            "mean_ms": round(sum(values) / len(values), 2) if values else 0.0,
+        }
+
+    return {
+        "calls": len(latencies),
+        "errors": errors,
+        "duration_s": round(duration, 3),
+        "throughput_per_s": round(len(latencies) / duration, 2) if duration else 0.0,
+        "latency": summary(latencies),
+        "upstream_requests": upstream,
+        "upstream_per_call": round(upstream / len(latencies), 3) if latencies else 0.0,
+        "server_memory": _memory_kb(pid),
+        "tools": {tool: summary(values) for tool, values in sorted(per_tool.items())},
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Start the mock and the MCP server and run the selected mixes."""
+    mock = server_from_args(args)
+    await mock.start(args.host, args.v3_port, args.v2_port)
+    mock_url = f"https://{args.host}:{mock.ports['v3']}"
+
+    workdir = Path(tempfile.mkdtemp(prefix="bench-tool-calls-"))
+    config_path = mock.write_config(workdir / "scale_config.ini")
+    port = args.server_port or _free_port()
+    url = f"http://127.0.0.1:{port}/mcp"
+
+    env = dict(os.environ, SCALE_CONFIG_PATH=str(config_path))
+    process = subprocess.Popen(
+        _server_command(port),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL if not args.server_output else None,
+    )
+    try:
+        await _wait_ready(url, process, timeout=30.0)
+        report: dict[str, Any] = {
+            "revision": _git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "parameters": {
+                "clients": args.clients,
+                "calls": args.calls,
+                "nodes": args.nodes,
+                "filesystems": args.filesystems,
+                "filesets": args.filesets,
+                "snapshots": args.snapshots,
+                "quotas": args.quotas,
+                "latency": args.latency,
+                "error_rate": args.error_rate,
+            },
+            "server_memory_start": _memory_kb(process.pid),
+            "mixes": {},
+        }
+        for name in args.mix:
+            print(
+                f"Running mix '{name}' with {args.clients} clients...", file=sys.stderr
+            )
+            report["mixes"][name] = await run_mix(
+                name, url, mock_url, process.pid, args
+            )
+        return report
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        await mock.stop()
+
+
+def compare(old_path: Path, new_path: Path) -> None:
+    """Print the relative change of the headline metrics of two reports."""
+    old = json.loads(old_path.read_text())
+    new = json.loads(new_path.read_text())
+    print(
+        f"{'mix':<16} {'metric':<20} {old['revision']:>12} {new['revision']:>12} {'change':>9}"
+    )
+    for mix in sorted(set(old["mixes"]) & set(new["mixes"])):
+        before, after = old["mixes"][mix], new["mixes"][mix]
+        metrics = {
+            "throughput_per_s": (before["throughput_per_s"], after["throughput_per_s"]),
+            "upstream_per_call": (
+                before["upstream_per_call"],
+                after["upstream_per_call"],
+            ),
+            "peak_rss_kb": (
+                before["server_memory"].get("peak_rss_kb", 0),
+                after["server_memory"].get("peak_rss_kb", 0),
+            ),
+        }
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            metrics[key] = (before["latency"][key], after["latency"][key])
+        for metric, (a, b) in metrics.items():
+            change = f"{(b - a) / a * 100:+.1f}%" if a else "n/a"
+            print(f"{mix:<16} {metric:<20} {a:>12} {b:>12} {change:>9}")
+
+
+def main():
+    """Run the benchmark or compare two reports."""
+    parser = build_parser()
+    parser.description = "End-to-end MCP tool-call throughput benchmark"
+    parser.epilog = """
+Examples:
+  # Run all mixes with 16 clients and 2000 calls per mix
+  python bench_tool_calls.py --clients 16 --calls 2000 --output report.json
+
+  # Larger cluster with realistic latency
+  python bench_tool_calls.py --filesets 20000 --latency lognormal:15:0.4 --mix list_heavy
+
+  # Compare two reports, e.g. before and after a change
+  python bench_tool_calls.py --compare base.json report.json
+    """
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent MCP clients")
+    parser.add_argument("--calls", type=int, default=500, help="Tool calls per mix")
+    parser.add_argument(
+        "--mix",
+        nargs="+",
+        choices=sorted(MIXES),
+        default=sorted(MIXES),
+        help="Tool mixes to run (default: all)",
+    )
+    parser.add_argument("--server-port", type=int, default=0, help="MCP server port")
+    parser.add_argument(
+        "--server-output", action="store_true", help="Show the MCP server's stderr"
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report to a file")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        type=Path,
+        metavar=("OLD", "NEW"),
+        help="Compare two JSON reports instead of running",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    report = asyncio.run(run(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1144 @@
+#!/usr/bin/env python3
+"""Mock IBM Storage Scale REST server for load and latency testing.
+
+Serves the /scalemgmt/v3 and /scalemgmt/v2 endpoints used by the MCP server
+from a deterministic synthetic cluster, so tools can be benchmarked and
+regression-tested without a live cluster. The cluster size, the latency
+distribution, the error rate and the pagination behaviour are configurable.
+
+The server speaks HTTP/1.1 over TLS with a generated self-signed certificate,
+and HTTP/2 as well with --http2 (requires the h2 package). It listens on two
+localhost ports, one for the v3 API and one for the v2 API,
+matching the v3_port and v2_port settings of scale_config.ini. Use
+--write-config to generate a scale_config.ini pointing at the mock and start
+the MCP server with SCALE_CONFIG_PATH set to it.
+
+Request counters per endpoint are available at GET /__mock__/stats and can be
+cleared with POST /__mock__/reset.
+
+With --token-ttl, POST /scalemgmt/v3/auth/token exchanges valid basic auth
+credentials for a bearer token valid for that many seconds. Requests are
+accepted with either; the 'auth basic' and 'auth token' counters show how
+many credential checks were made. POST /__mock__/revoke invalidates all
+tokens.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import re
+import ssl
+import sys
+import secrets
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+try:
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data)
+
+except ImportError:
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+
+# Fixed reference time so that generated snapshot timestamps are reproducible
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+REASONS = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class LatencyModel:
+    """Per-request latency distribution.
+
+    Specifications (all values in milliseconds):
+        none                      no added latency
+        fixed:<ms>                constant latency
+        uniform:<min>:<max>       uniformly distributed latency
+        normal:<mean>:<stddev>    normally distributed latency, clipped at 0
+        lognormal:<median>:<sigma> log-normally distributed latency
+    """
+
+    def __init__(self, spec: str = "none", rng: Optional[random.Random] = None):
+        self.spec = spec
+        self.rng = rng or random.Random(0)
+        kind, *params = spec.split(":")
+        values = [float(p) for p in params]
+        samplers: dict[str, Callable[[], float]] = {
+            "none": lambda: 0.0,
+            "fixed": lambda: values[0],
+            "uniform": lambda: self.rng.uniform(values[0], values[1]),
+            "normal": lambda: max(0.0, self.rng.gauss(values[0], values[1])),
+            "lognormal": lambda: values[0] * self.rng.lognormvariate(0.0, values[1]),
+        }
+        if kind not in samplers:
+            raise ValueError(f"Unknown latency distribution '{spec}'")
+        self._sample = samplers[kind]
+
+    def sample(self) -> float:
+        """Sample a latency in seconds."""
+        return self._sample() / 1000
+
+
+@dataclass
+class SyntheticCluster:
+    """Deterministic synthetic Storage Scale cluster.
+
+    Attributes:
+        nodes: Number of nodes
+        filesystems: Number of filesystems
+        filesets: Number of filesets per filesystem (besides root)
+        independent_ratio: Fraction of filesets owning their inode space
+        snapshots: Number of snapshots per independent fileset and filesystem
+        quotas: Number of quota entries per filesystem
+        nsds_per_filesystem: Number of NSDs per filesystem
+        unhealthy_ratio: Fraction of nodes reporting a degraded component
+        seed: Random seed for the generated attributes
+    """
+
+    nodes: int = 8
+    filesystems: int = 2
+    filesets: int = 100
+    independent_ratio: float = 0.5
+    snapshots: int = 4
+    quotas: int = 100
+    nsds_per_filesystem: int = 4
+    unhealthy_ratio: float = 0.1
+    seed: int = 0
+    data: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        rng = random.Random(self.seed)
+        nodes = [f"node{i:04d}.scale.example.com" for i in range(self.nodes)]
+        self.data["nodes"] = [
+            {
+                "nodeName": name,
+                "adminNodeName": name,
+                "nodeNumber": i + 1,
+                "roles": "quorum,manager" if i < 3 else "client",
+                "ipAddress": f"10.0.{i // 250}.{i % 250 + 1}",
+            }
+            for i, name in enumerate(nodes)
+        ]
+        self.data["node_status"] = [
+            {"nodeName": name, "state": "active", "gpfsState": "HEALTHY"}
+            for name in nodes
+        ]
+
+        states, events = [], []
+        for name in nodes:
+            degraded = rng.random() < self.unhealthy_ratio
+            for component in ("GPFS", "NETWORK", "FILESYSTEM", "DISK"):
+                state = "DEGRADED" if degraded and component == "NETWORK" else "HEALTHY"
+                states.append(
+                    {
+                        "node": name,
+                        "component": component,
+                        "entityType": "NODE",
+                        "entityName": name,
+                        "state": state,
+                    }
+                )
+            if degraded:
+                events.append(
+                    {
+                        "node": name,
+                        "component": "NETWORK",
+                        "entityType": "NODE",
+                        "entityName": name,
+                        "event": "network_link_down",
+                        "severity": "WARNING",
+                        "activeSince": BASE_TIME.isoformat(),
+                    }
+                )
+        self.data["health_states"] = states
+        self.data["health_events"] = events
+
+        self.data["filesystems"] = {}
+        self.data["filesets"] = {}
+        self.data["snapshots"] = {}
+        self.data["quotas"] = {}
+        self.data["nsds"] = []
+        for f in range(self.filesystems):
+            fs = f"fs{f}"
+            self.data["filesystems"][fs] = {
+                "filesystemName": fs,
+                "mountPoint": f"/gpfs/{fs}",
+                "blockSize": 4194304,
+                "storagePools": ["system", "data"],
+            }
+            for d in range(self.nsds_per_filesystem):
+                self.data["nsds"].append(
+                    {
+                        "nsdName": f"{fs}_nsd{d:03d}",
+                        "filesystem": fs,
+                        "storagePool": "system" if d == 0 else "data",
+                        "servers": nodes[d % len(nodes)] if nodes else "",
+                    }
+                )
+
+            filesets = {"root": self._fileset(fs, "root", 0, True)}
+            for i in range(1, self.filesets + 1):
+                name = f"fset{i:06d}"
+                independent = rng.random() < self.independent_ratio
+                filesets[name] = self._fileset(fs, name, i, independent)
+            self.data["filesets"][fs] = filesets
+
+            snapshots = {}
+            for owner, fileset in filesets.items():
+                if not fileset["config"]["isInodeSpaceOwner"]:
+                    continue
+                for s in range(self.snapshots):
+                    created = BASE_TIME - timedelta(hours=6 * s)
+                    snapshot = {
+                        "snapshotName": f"snap-{created:%Y%m%d-%H%M}",
+                        "filesetName": owner,
+                        "created": created.isoformat(),
+                        "status": "Valid",
+                    }
+                    snapshots[(owner, snapshot["snapshotName"])] = snapshot
+            self.data["snapshots"][fs] = snapshots
+
+            self.data["quotas"][fs] = [
+                {
+                    "quotaId": q,
+                    "quotaType": "FILESET",
+                    "objectName": f"fset{q % max(self.filesets, 1) + 1:06d}",
+                    "blockUsage": rng.randrange(1 << 30),
+                    "blockQuota": 1 << 30,
+                    "blockLimit": 2 << 30,
+                    "filesUsage": rng.randrange(100000),
+                    "filesQuota": 100000,
+                    "filesLimit": 200000,
+                }
+                for q in range(self.quotas)
+            ]
+
+    @staticmethod
+    def _fileset(fs: str, name: str, fileset_id: int, independent: bool) -> dict:
+        return {
+            "filesystemName": fs,
+            "config": {
+                "filesetName": name,
+                "id": fileset_id,
+                "path": f"/gpfs/{fs}" + ("" if name == "root" else f"/{name}"),
+                "isInodeSpaceOwner": independent,
+                "inodeSpace": fileset_id if independent else 0,
+                "status": "Linked",
+                "comment": "",
+            },
+            "afm": {"afmMode": None, "afmTarget": None},
+            "usage": {"usedBytes": 0, "usedInodes": 0},
+        }
+
+
+class MockScaleServer:
+    """Asyncio HTTP/1.1 server implementing the mocked REST endpoints."""
+
+    def __init__(
+        self,
+        cluster: SyntheticCluster,
+        latency: str = "none",
+        slow_latency: str = "none",
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        default_page_size: int = 0,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        seed: int = 0,
+        http2: bool = False,
+        capacity: int = 0,
+        token_ttl: float = 0.0,
+    ):
+        """Initialize the mock server.
+
+        Args:
+            cluster: Synthetic cluster to serve
+            latency: Latency distribution for regular requests
+            slow_latency: Latency distribution for long-running operations
+                (mount, unmount, node start/stop and batch operations)
+            error_rate: Fraction of requests answered with error_status
+            error_status: HTTP status used for injected errors
+            default_page_size: Page size for list requests without page_size
+                (0 returns everything)
+            username: Expected basic auth user (None accepts any credentials)
+            password: Expected basic auth password
+            seed: Random seed for latency and error injection
+            http2: Offer HTTP/2 through ALPN in addition to HTTP/1.1
+            capacity: Requests processed concurrently; further requests wait,
+                and once as many are waiting they are answered with 503
+                (0 is unlimited)
+            token_ttl: Lifetime of bearer tokens in seconds (0 disables the
+                token endpoint)
+        """
+        self.cluster = cluster
+        self.rng = random.Random(seed)
+        self.latency = LatencyModel(latency, self.rng)
+        self.slow_latency = LatencyModel(slow_latency, self.rng)
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.default_page_size = default_page_size
+        self.username = username
+        self.password = password
+        self.http2 = http2
+        self.capacity = capacity
+        self.token_ttl = token_ttl
+        self.tokens: dict[str, float] = {}
+        self.active = 0
+        self.workers = asyncio.Semaphore(capacity) if capacity else None
+        self.stats: Counter = Counter()
+        self.connections = 0
+        self.servers: list[asyncio.base_events.Server] = []
+        self.ports: dict[str, int] = {}
+        self.routes = self._routes()
+
+    # Routing
+
+    def _routes(self) -> list[tuple[str, re.Pattern, str, Callable]]:
+        v3 = "/scalemgmt/v3"
+        v2 = "/scalemgmt/v2"
+        fs = r"/filesystems/(?P<fs>[^/:]+)"
+        table = [
+            ("GET", f"{v3}/clusters", self.list_clusters),
+            ("GET", f"{v3}/clusters/remote", self.list_remote_clusters),
+            ("GET", f"{v3}/clusters/remote/(?P<name>[^/]+)", self.not_found),
+            ("GET", f"{v3}/clusters/trust", self.empty("trusts")),
+            ("GET", f"{v3}/config/admin", self.admin_config),
+            ("PATCH", f"{v3}/config/admin:batchUpdate", self.accepted),
+            ("GET", f"{v3}/version", self.version),
+            ("GET", f"{v3}/nodes/config", self.nodes_config),
+            ("GET", f"{v3}/nodes/status", self.nodes_status),
+            ("GET", f"{v3}/nodes/(?P<node>[^/]+)/diagnostics/version", self.version),
+            ("POST", f"{v3}/nodes", self.accepted),
+            ("POST", f"{v3}/nodes:batchAdd", self.slow(self.accepted)),
+            ("POST", f"{v3}/nodes:start", self.slow(self.accepted)),
+            ("POST", f"{v3}/nodes:stop", self.slow(self.accepted)),
+            ("GET", f"{v3}/nsds", self.list_nsds),
+            ("GET", f"{v3}/nsds/(?P<nsd>[^/]+)", self.get_nsd),
+            ("POST", f"{v3}/nsds:batchCreate", self.slow(self.accepted)),
+            ("POST", f"{v3}/nsds:batchDelete", self.slow(self.accepted)),
+            ("GET", f"{v3}/filesystems", self.list_filesystems),
+            ("POST", f"{v3}/filesystems:mount", self.slow(self.accepted)),
+            ("POST", f"{v3}/filesystems:unmount", self.slow(self.accepted)),
+            ("GET", f"{v3}{fs}", self.get_filesystem),
+            ("DELETE", f"{v3}{fs}", self.accepted),
+            ("POST", f"{v3}{fs}:mount", self.slow(self.accepted)),
+            ("POST", f"{v3}{fs}:unmount", self.slow(self.accepted)),
+            ("GET", f"{v3}{fs}/storagepools", self.list_pools),
+            ("GET", f"{v3}{fs}/storagepools/(?P<pool>[^/]+)", self.get_pool),
+            ("GET", f"{v3}{fs}/policy", self.policy),
+            ("PATCH", f"{v3}{fs}/policy", self.accepted),
+            ("GET", f"{v3}{fs}/quotas", self.list_quotas),
+            ("PUT", f"{v3}{fs}/quotas", self.accepted),
+            ("GET", f"{v3}{fs}/snapshots", self.list_snapshots),
+            ("POST", f"{v3}{fs}/snapshots", self.create_snapshot),
+            ("POST", f"{v3}{fs}/snapshots:batchDelete", self.batch_delete_snapshots),
+            ("GET", f"{v3}{fs}/snapshots:snapdir", self.snapdir),
+            ("GET", f"{v3}{fs}/snapshots/(?P<snap>[^/]+)", self.get_snapshot),
+            ("DELETE", f"{v3}{fs}/snapshots/(?P<snap>[^/]+)", self.delete_snapshot),
+            ("GET", f"{v3}{fs}/filesets", self.list_filesets),
+            ("POST", f"{v3}{fs}/filesets", self.accepted),
+            (
+                "POST",
+                f"{v3}{fs}/filesets/snapshots:batchCreate",
+                self.slow(self.batch_create_fileset_snapshots),
+            ),
+            (
+                "POST",
+                f"{v3}{fs}/filesets/snapshots:batchDelete",
+                self.batch_delete_snapshots,
+            ),
+            ("GET", f"{v3}{fs}/filesets/(?P<fset>[^/:]+)", self.get_fileset),
+            ("PATCH", f"{v3}{fs}/filesets/(?P<fset>[^/:]+)", self.accepted),
+            ("DELETE", f"{v3}{fs}/filesets/(?P<fset>[^/:]+)", self.accepted),
+            ("GET", f"{v3}{fs}/filesets/(?P<fset>[^/:]+)/usage", self.fileset_usage),
+            ("POST", f"{v3}{fs}/filesets/(?P<fset>[^/:]+):link", self.accepted),
+            ("POST", f"{v3}{fs}/filesets/(?P<fset>[^/:]+):unlink", self.accepted),
+            (
+                "GET",
+                f"{v3}{fs}/filesets/(?P<fset>[^/:]+)/snapshots",
+                self.list_fileset_snapshots,
+            ),
+            (
+                "POST",
+                f"{v3}{fs}/filesets/(?P<fset>[^/:]+)/snapshots",
+                self.create_snapshot,
+            ),
+            (
+                "GET",
+                f"{v3}{fs}/filesets/(?P<fset>[^/:]+)/snapshots/(?P<snap>[^/]+)",
+                self.get_snapshot,
+            ),
+            (
+                "DELETE",
+                f"{v3}{fs}/filesets/(?P<fset>[^/:]+)/snapshots/(?P<snap>[^/]+)",
+                self.delete_snapshot,
+            ),
+            ("GET", f"{v2}/nodes/(?P<node>[^/]+)/health/states", self.health_states),
+            ("GET", f"{v2}/nodes/(?P<node>[^/]+)/health/events", self.health_events),
+            (
+                "GET",
+                f"{v2}/cluster{fs}/health/state",
+                self.filesystem_health_state,
+            ),
+            ("GET", f"{v2}/cluster{fs}/health/events", self.empty("events")),
+        ]
+        routes = []
+        for method, pattern, handler in table:
+            template = re.sub(r"\(\?P<(\w+)>[^)]+\)", r"{\1}", pattern)
+            routes.append((method, re.compile(f"^{pattern}$"), template, handler))
+        return routes
+
+    def match(self, method: str, path: str) -> tuple[Optional[Callable], dict, str]:
+        """Find the handler for a request."""
+        allowed = False
+        for route_method, pattern, template, handler in self.routes:
+            found = pattern.match(path)
+            if found:
+                if route_method == method:
+                    params = {k: unquote(v) for k, v in found.groupdict().items()}
+                    return handler, params, template
+                allowed = True
+        return None, {}, "405" if allowed else "404"
+
+    # Handler helpers
+
+    def slow(self, handler: Callable) -> Callable:
+        """Mark a handler as a long-running operation."""
+
+        def handler_slow(**kw: Any) -> tuple[int, dict]:
+            return handler(**kw)
+
+        handler_slow.slow = True  # type: ignore[attr-defined]
+        return handler_slow
+
+    def empty(self, key: str) -> Callable:
+        """Handler returning an empty list under key."""
+        return lambda **kw: (200, {key: []})
+
+    def paginate(self, key: str, items: list, query: dict) -> tuple[int, dict]:
+        """Return one page of items with a next_page_token."""
+        page_size = int(query.get("page_size", [self.default_page_size])[0] or 0)
+        token = query.get("page_token", [""])[0]
+        start = int(base64.urlsafe_b64decode(token).decode()) if token else 0
+        if page_size <= 0:
+            return 200, {key: items[start:], "next_page_token": ""}
+        end = start + page_size
+        next_token = (
+            base64.urlsafe_b64encode(str(end).encode()).decode()
+            if end < len(items)
+            else ""
+        )
+        return 200, {key: items[start:end], "next_page_token": next_token}
+
+    def not_found(self, **kw: Any) -> tuple[int, dict]:
+        return 404, {"code": 404, "message": "Resource not found"}
+
+    def accepted(self, **kw: Any) -> tuple[int, dict]:
+        return 200, {
+            "status": {"code": 200, "message": "The request finished successfully."}
+        }
+
+    def _filesystem(self, fs: str) -> Optional[dict]:
+        return self.cluster.data["filesystems"].get(fs)
+
+    # Handlers
+
+    def list_clusters(self, query: dict, **kw: Any) -> tuple[int, dict]:
+        return 200, {
+            "clusters": [
+                {
+                    "clusterName": "mock.scale.example.com",
+                    "clusterId": "1000000000000000001",
+                    "nodeCount": self.cluster.nodes,
+                }
+            ]
+        }
+
+    def list_remote_clusters(self, query: dict, **kw: Any) -> tuple[int, dict]:
+        return self.paginate("remoteClusters", [], query)
+
+    def admin_config(self, **kw: Any) -> tuple[int, dict]:
+        return 200, {"adminConfig": {"adminMode": "central"}}
+
+    def version(self, **kw: Any) -> tuple[int, dict]:
+        return 200, {"version": "5.2.3.0", "build": "mock"}
+
+    def nodes_config(self, query: dict, **kw: Any) -> tuple[int, dict]:
+        return self.paginate("nodes", self.cluster.data["nodes"], query)
+
+    def nodes_status(self, query: dict, **kw: Any) -> tuple[int, dict]:
+        return self.paginate("nodes", self.cluster.data["node_status"], query)
+
+    def list_nsds(self, query: dict, **kw: Any) -> tuple[int, dict]:
+        return self.paginate("nsds", self.cluster.data["nsds"], query)
+
+    def get_nsd(self, nsd: str, **kw: Any) -> tuple[int, dict]:
+        for entry in self.cluster.data["nsds"]:
+            if entry["nsdName"] == nsd:
+                return 200, entry
+        return self.not_found()
+
+    def list_filesystems(self, query: dict, **kw: Any) -> tuple[int, dict]:
+        items = list(self.cluster.data["filesystems"].values())
+        return self.paginate("filesystems", items, query)
+
+    def get_filesystem(self, fs: str, **kw: Any) -> tuple[int, dict]:
+        filesystem = self._filesystem(fs)
+        return (200, filesystem) if filesystem else self.not_found()
+
+    def list_pools(self, fs: str, query: dict, **kw: Any) -> tuple[int, dict]:
+        filesystem = self._filesystem(fs)
+        if not filesystem:
+            return self.not_found()
+        pools = [
+            {"storagePoolName": name, "filesystemName": fs}
+            for name in filesystem["storagePools"]
+        ]
+        return self.paginate("storagePools", pools, query)
+
+    def get_pool(self, fs: str, pool: str, **kw: Any) -> tuple[int, dict]:
+        filesystem = self._filesystem(fs)
+        if not filesystem or pool not in filesystem["storagePools"]:
+            return self.not_found()
+        return 200, {"storagePoolName": pool, "filesystemName": fs}
+
+    def policy(self, fs: str, **kw: Any) -> tuple[int, dict]:
+        return 200, {"policy": "RULE 'default' SET POOL 'system'"}
+
+    def list_quotas(self, fs: str, query: dict, **kw: Any) -> tuple[int, dict]:
+        if not self._filesystem(fs):
+            return self.not_found()
+        return self.paginate("quotas", self.cluster.data["quotas"][fs], query)
+
+    def list_filesets(self, fs: str, query: dict, **kw: Any) -> tuple[int, dict]:
+        if not self._filesystem(fs):
+            return self.not_found()
+        items = list(self.cluster.data["filesets"][fs].values())
+        return self.paginate("filesets", items, query)
+
+    def get_fileset(self, fs: str, fset: str, **kw: Any) -> tuple[int, dict]:
+        fileset = self.cluster.data["filesets"].get(fs, {}).get(fset)
+        return (200, fileset) if fileset else self.not_found()
+
+    def fileset_usage(self, fs: str, fset: str, **kw: Any) -> tuple[int, dict]:
+        fileset = self.cluster.data["filesets"].get(fs, {}).get(fset)
+        return (200, fileset["usage"]) if fileset else self.not_found()
+
+    def list_snapshots(self, fs: str, query: dict, **kw: Any) -> tuple[int, dict]:
+        if not self._filesystem(fs):
+            return self.not_found()
+        items = list(self.cluster.data["snapshots"][fs].values())
+        return self.paginate("snapshots", items, query)
+
+    def list_fileset_snapshots(
+        self, fs: str, fset: str, query: dict, **kw: Any
+    ) -> tuple[int, dict]:
+        if not self._filesystem(fs):
+            return self.not_found()
+        items = [
+            s
+            for (owner, _), s in self.cluster.data["snapshots"][fs].items()
+            if owner == fset
+        ]
+        return self.paginate("snapshots", items, query)
+
+    def get_snapshot(
+        self, fs: str, snap: str, fset: str = "root", **kw: Any
+    ) -> tuple[int, dict]:
+        snapshot = self.cluster.data["snapshots"].get(fs, {}).get((fset, snap))
+        return (200, snapshot) if snapshot else self.not_found()
+
+    def _add_snapshot(self, fs: str, fset: str, name: str) -> dict:
+        snapshot = {
+            "snapshotName": name,
+            "filesetName": fset,
+            "created": datetime.now(timezone.utc).isoformat(),
+            "status": "Valid",
+        }
+        self.cluster.data["snapshots"][fs][(fset, name)] = snapshot
+        return snapshot
+
+    def create_snapshot(
+        self, fs: str, body: Any, fset: str = "root", **kw: Any
+    ) -> tuple[int, dict]:
+        if not self._filesystem(fs):
+            return self.not_found()
+        name = (body or {}).get("snapshotName") or f"snap-{time.time_ns()}"
+        return 200, self._add_snapshot(fs, fset, name)
+
+    def delete_snapshot(
+        self, fs: str, snap: str, fset: str = "root", **kw: Any
+    ) -> tuple[int, dict]:
+        if self.cluster.data["snapshots"].get(fs, {}).pop((fset, snap), None) is None:
+            return self.not_found()
+        return self.accepted()
+
+    def batch_create_fileset_snapshots(
+        self, fs: str, body: Any, **kw: Any
+    ) -> tuple[int, dict]:
+        if not self._filesystem(fs):
+            return self.not_found()
+        created = [
+            self._add_snapshot(
+                fs, entry.get("filesetName", "root"), entry["snapshotName"]
+            )
+            for entry in (body or {}).get("snapshots", [])
+        ]
+        return 200, {"snapshots": created}
+
+    def batch_delete_snapshots(self, fs: str, body: Any, **kw: Any) -> tuple[int, dict]:
+        snapshots = self.cluster.data["snapshots"].get(fs)
+        if snapshots is None:
+            return self.not_found()
+        deleted = 0
+        for entry in (body or {}).get("snapshots", []):
+            key = (entry.get("filesetName", "root"), entry.get("snapshotName"))
+            deleted += snapshots.pop(key, None) is not None
+        return 200, {"deleted": deleted}
+
+    def snapdir(self, fs: str, **kw: Any) -> tuple[int, dict]:
+        return 200, {"snapdir": ".snapshots", "showSnapdirInAllDirectories": False}
+
+    def health_states(self, node: str, query: dict, **kw: Any) -> tuple[int, dict]:
+        states = self.cluster.data["health_states"]
+        if node != ":all:":
+            states = [s for s in states if s["node"] == node]
+        return self.paginate("states", states, query)
+
+    def health_events(self, node: str, query: dict, **kw: Any) -> tuple[int, dict]:
+        events = self.cluster.data["health_events"]
+        if node != ":all:":
+            events = [e for e in events if e["node"] == node]
+        return self.paginate("events", events, query)
+
+    def filesystem_health_state(self, fs: str, **kw: Any) -> tuple[int, dict]:
+        if not self._filesystem(fs):
+            return self.not_found()
+        return 200, {
+            "states": [
+                {"entityName": fs, "component": "FILESYSTEM", "state": "HEALTHY"}
+            ]
+        }
+
+    # HTTP handling
+
+    def _authorized(self, headers: dict) -> bool:
+        authorization = headers.get("authorization", "")
+        if authorization.startswith("Bearer "):
+            self.stats["auth token"] += 1
+            expires = self.tokens.get(authorization[len("Bearer ") :])
+            return expires is not None and expires > time.monotonic()
+        self.stats["auth basic"] += 1
+        if self.username is None:
+            return True
+        expected = base64.b64encode(
+            f"{self.username}:{self.password or ''}".encode()
+        ).decode()
+        return authorization == f"Basic {expected}"
+
+    def issue_token(self, headers: dict) -> tuple[int, bytes, dict]:
+        """Exchange basic auth credentials for a bearer token."""
+        if not self.token_ttl:
+            return 404, _dumps({"code": 404, "message": REASONS[404]}), {}
+        if headers.get("authorization", "").startswith("Bearer ") or (
+            not self._authorized(headers)
+        ):
+            return 401, _dumps({"code": 401, "message": "Unauthorized"}), {}
+        token = secrets.token_urlsafe(24)
+        self.tokens[token] = time.monotonic() + self.token_ttl
+        self.stats["tokens issued"] += 1
+        return 200, _dumps({"token": token, "expires_in": self.token_ttl}), {}
+
+    async def dispatch(
+        self, method: str, target: str, headers: dict, body: bytes
+    ) -> tuple[int, bytes, dict]:
+        """Handle one request and return status, body and extra headers."""
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+
+        if url.path == "/__mock__/stats":
+            return 200, _dumps(self.snapshot_stats()), {}
+        if url.path == "/__mock__/reset":
+            self.stats.clear()
+            return 200, _dumps({"reset": True}), {}
+        if url.path == "/__mock__/revoke":
+            self.tokens.clear()
+            return 200, _dumps({"revoked": True}), {}
+        if url.path == "/scalemgmt/v3/auth/token" and method == "POST":
+            return self.issue_token(headers)
+
+        handler, params, template = self.match(method, url.path)
+        self.stats[f"{method} {template}"] += 1
+        self.stats["total"] += 1
+        if handler is None:
+            status = int(template)
+            return status, _dumps({"code": status, "message": REASONS[status]}), {}
+
+        if not self._authorized(headers):
+            return 401, _dumps({"code": 401, "message": "Unauthorized"}), {}
+
+        if self.workers is not None:
+            if self.active >= 2 * self.capacity:
+                self.stats["overloaded"] += 1
+                return (
+                    503,
+                    _dumps({"code": 503, "message": REASONS[503]}),
+                    {"Retry-After": "1"},
+                )
+            self.active += 1
+            try:
+                async with self.workers:
+                    await self._delay(handler)
+            finally:
+                self.active -= 1
+        else:
+            await self._delay(handler)
+
+        if self.error_rate and self.rng.random() < self.error_rate:
+            self.stats["errors"] += 1
+            extra = {"Retry-After": "1"} if self.error_status in (429, 503) else {}
+            status = self.error_status
+            return (
+                status,
+                _dumps({"code": status, "message": REASONS.get(status, "")}),
+                extra,
+            )
+
+        payload = json.loads(body) if body else None
+        status, data = handler(query=query, body=payload, **params)
+        return status, _dumps(data), {}
+
+    async def _delay(self, handler: Callable) -> None:
+        model = self.slow_latency if getattr(handler, "slow", False) else self.latency
+        delay = model.sample()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def snapshot_stats(self) -> dict:
+        """Get the request counters."""
+        return {"connections": self.connections, "requests": dict(self.stats)}
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve HTTP/1.1 requests on one connection until it is closed."""
+        self.connections += 1
+        ssl_object = writer.get_extra_info("ssl_object")
+        if ssl_object and ssl_object.selected_alpn_protocol() == "h2":
+            await self.handle_h2_connection(reader, writer)
+            return
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload, extra = await self.dispatch(
+                    method, target, headers, body
+                )
+                close = headers.get("connection", "").lower() == "close"
+                head = [
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+                    "Content-Type: application/json",
+                    f"Content-Length: {len(payload)}",
+                    f"Connection: {'close' if close else 'keep-alive'}",
+                ] + [f"{k}: {v}" for k, v in extra.items()]
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + payload)
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ssl.SSLError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_h2_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve HTTP/2 streams on one connection until it is closed.
+
+        Every stream is dispatched in its own task, so concurrent requests are
+        multiplexed over the connection like on a real HTTP/2 server.
+        """
+        from h2.config import H2Configuration
+        from h2.connection import H2Connection
+        from h2.events import (
+            ConnectionTerminated,
+            DataReceived,
+            RequestReceived,
+            StreamEnded,
+            StreamReset,
+            WindowUpdated,
+        )
+        from h2.exceptions import H2Error
+
+        conn = H2Connection(
+            config=H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        requests: dict[int, tuple[dict, bytearray]] = {}
+        window_open: dict[int, asyncio.Event] = {}
+        tasks: set[asyncio.Task] = set()
+
+        async def respond(stream_id: int, headers: dict, body: bytes) -> None:
+            status, payload, extra = await self.dispatch(
+                headers[":method"], headers[":path"], headers, body
+            )
+            try:
+                conn.send_headers(
+                    stream_id,
+                    [
+                        (":status", str(status)),
+                        ("content-type", "application/json"),
+                        ("content-length", str(len(payload))),
+                    ]
+                    + [(k.lower(), v) for k, v in extra.items()],
+                )
+                offset = 0
+                while True:
+                    size = min(
+                        len(payload) - offset,
+                        conn.local_flow_control_window(stream_id),
+                        conn.max_outbound_frame_size,
+                    )
+                    if size <= 0 and offset < len(payload):
+                        event = window_open.setdefault(stream_id, asyncio.Event())
+                        event.clear()
+                        await event.wait()
+                        continue
+                    end = offset + size >= len(payload)
+                    conn.send_data(
+                        stream_id, payload[offset : offset + size], end_stream=end
+                    )
+                    offset += size
+                    writer.write(conn.data_to_send())
+                    await writer.drain()
+                    if end:
+                        break
+            except (H2Error, ConnectionError):
+                pass
+            finally:
+                window_open.pop(stream_id, None)
+
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                for event in conn.receive_data(data):
+                    if isinstance(event, RequestReceived):
+                        requests[event.stream_id] = (dict(event.headers), bytearray())
+                    elif isinstance(event, DataReceived):
+                        requests[event.stream_id][1].extend(event.data)
+                        conn.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id
+                        )
+                    elif isinstance(event, StreamEnded):
+                        headers, body = requests.pop(event.stream_id)
+                        task = asyncio.create_task(
+                            respond(event.stream_id, headers, bytes(body))
+                        )
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                    elif isinstance(event, WindowUpdated):
+                        for stream_id, waiter in window_open.items():
+                            if event.stream_id in (0, stream_id):
+                                waiter.set()
+                    elif isinstance(event, StreamReset):
+                        requests.pop(event.stream_id, None)
+                    elif isinstance(event, ConnectionTerminated):
+                        return
+                writer.write(conn.data_to_send())
+                await writer.drain()
+        except (ConnectionError, ssl.SSLError, H2Error):
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def start(
+        self,
+        host: str = "127.0.0.1",
+        v3_port: int = 0,
+        v2_port: int = 0,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ) -> None:
+        """Start listening on the v3 and v2 ports.
+
+        Args:
+            host: Address to bind to
+            v3_port: Port for the v3 API (0 picks a free port)
+            v2_port: Port for the v2 API (0 picks a free port)
+            ssl_context: Server TLS context (default: self-signed certificate)
+        """
+        context = ssl_context or self_signed_context()
+        if self.http2:
+            context.set_alpn_protocols(["h2", "http/1.1"])
+        for name, port in (("v3", v3_port), ("v2", v2_port)):
+            server = await asyncio.start_server(
+                self.handle_connection, host, port, ssl=context
+            )
+            self.servers.append(server)
+            self.ports[name] = server.sockets[0].getsockname()[1]
+        self.host = host
+
+    async def stop(self) -> None:
+        """Stop listening and close the servers."""
+        for server in self.servers:
+            server.close()
+            await server.wait_closed()
+        self.servers.clear()
+
+    def write_config(self, path: Path, timeout: float = 30.0) -> Path:
+        """Write a scale_config.ini pointing at this mock server.
+
+        Args:
+            path: Destination file
+            timeout: Request timeout to configure
+
+        Returns:
+            The written path
+        """
+        path.write_text(
+            "[scale_api]\n"
+            f"hostname = {self.host}\n"
+            f"v2_port = {self.ports['v2']}\n"
+            f"v3_port = {self.ports['v3']}\n"
+            f"timeout = {timeout}\n\n"
+            "[authorization]\n"
+            f"username = {self.username or 'admin'}\n"
+            f"password = {self.password or 'admin'}\n"
+            "allow_insecure = true\n\n"
+            "[domain]\n"
+            "domain = StorageScaleDomain\n\n"
+            "[ssh]\n"
+            f"hostname = {self.host}\n"
+            "port = 22\n"
+            "username = root\n"
+            "password = unused\n"
+        )
+        return path
+
+
+def self_signed_context(hostname: str = "localhost") -> ssl.SSLContext:
+    """Create a server TLS context with a freshly generated self-signed certificate.
+
+    Requires the cryptography package.
+    """
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+    import ipaddress
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, hostname)])
+    now = datetime.now(timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=30))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [
+                    x509.DNSName(hostname),
+                    x509.IPAddress(ipaddress.ip_address("127.0.0.1")),
+                ]
+            ),
+            critical=False,
+        )
+        .sign(key, hashes.SHA256())
+    )
+
+    directory = Path(tempfile.mkdtemp(prefix="mock-scale-"))
+    cert_file = directory / "cert.pem"
+    key_file = directory / "key.pem"
+    cert_file.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_file, key_file)
+    context.cert_file = str(cert_file)  # type: ignore[attr-defined]
+    return context
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser shared by the benchmark scripts."""
+    parser = argparse.ArgumentParser(
+        description="Mock IBM Storage Scale REST server",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Small cluster on random ports, write a matching scale_config.ini
+  python mock_scale_server.py --write-config /tmp/scale_config.ini
+
+  # 50k filesets with log-normal latency around 20 ms and 1% 503 errors
+  python mock_scale_server.py --filesets 50000 --latency lognormal:20:0.5 \\
+      --error-rate 0.01 --v3-port 46443 --v2-port 8443
+
+  # Run the MCP server against it
+  SCALE_CONFIG_PATH=/tmp/scale_config.ini scale-mcp-server --transport http
+        """,
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--v3-port", type=int, default=0, help="v3 API port (0: any)")
+    parser.add_argument("--v2-port", type=int, default=0, help="v2 API port (0: any)")
+    parser.add_argument("--nodes", type=int, default=8, help="Number of nodes")
+    parser.add_argument(
+        "--filesystems", type=int, default=2, help="Number of filesystems"
+    )
+    parser.add_argument(
+        "--filesets", type=int, default=100, help="Filesets per filesystem"
+    )
+    parser.add_argument(
+        "--independent-ratio",
+        type=float,
+        default=0.5,
+        help="Fraction of independent filesets (default: 0.5)",
+    )
+    parser.add_argument(
+        "--snapshots", type=int, default=4, help="Snapshots per independent fileset"
+    )
+    parser.add_argument("--quotas", type=int, default=100, help="Quotas per filesystem")
+    parser.add_argument(
+        "--latency", default="none", help="Latency distribution, e.g. lognormal:20:0.5"
+    )
+    parser.add_argument(
+        "--slow-latency",
+        default="none",
+        help="Latency distribution for long-running operations, e.g. uniform:2000:8000",
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction of failed requests"
+    )
+    parser.add_argument(
+        "--error-status", type=int, default=503, help="Status of injected errors"
+    )
+    parser.add_argument(
+        "--capacity",
+        type=int,
+        default=0,
+        help="Concurrently processed requests before queuing and 503s (0: unlimited)",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=0,
+        help="Default page size for list endpoints (0: no pagination)",
+    )
+    parser.add_argument("--username", help="Required basic auth user")
+    parser.add_argument("--password", help="Required basic auth password")
+    parser.add_argument(
+        "--token-ttl",
+        type=float,
+        default=0.0,
+        help="Serve bearer tokens valid for this many seconds (0: basic auth only)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--http2", action="store_true", help="Offer HTTP/2 (requires h2)"
+    )
+    parser.add_argument(
+        "--write-config", type=Path, help="Write a scale_config.ini for the mock"
+    )
+    return parser
+
+
+def server_from_args(args: argparse.Namespace) -> MockScaleServer:
+    """Create a mock server from parsed command line arguments."""
+    cluster = SyntheticCluster(
+        nodes=args.nodes,
+        filesystems=args.filesystems,
+        filesets=args.filesets,
+        independent_ratio=args.independent_ratio,
+        snapshots=args.snapshots,
+        quotas=args.quotas,
+        seed=args.seed,
+    )
+    return MockScaleServer(
+        cluster,
+        latency=args.latency,
+        slow_latency=args.slow_latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        default_page_size=args.page_size,
+        username=args.username,
+        password=args.password,
+        seed=args.seed,
+        http2=args.http2,
+        capacity=args.capacity,
+        token_ttl=args.token_ttl,
+    )
+
+
+async def main():
+    """Run the mock server until interrupted."""
+    args = build_parser().parse_args()
+    server = server_from_args(args)
+    await server.start(args.host, args.v3_port, args.v2_port)
+
+    print(
+        f"Mock Storage Scale REST server listening on https://{args.host} "
+        f"(v3 port {server.ports['v3']}, v2 port {server.ports['v2']})"
+    )
+    if args.write_config:
+        server.write_config(args.write_config)
+        print(f"Wrote {args.write_config}; start the MCP server with:")
+        print(f"  SCALE_CONFIG_PATH={args.write_config} scale-mcp-server")
+    sys.stdout.flush()
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -55,6 +55,28 @@ class CommandExecutorInterface(ABC):
             CommandError: Base exception for command-related errors
         """
         pass
+    
+    def execute_batch(
+        self,
+        commands: list[list[str]],
+        parallel: bool = False
+    ) -> list[CommandResult]:
+        """Execute several commands and return their results in order.
+        
+        The default implementation runs the commands one after another with
+        execute; executors with a per-command round trip override it.
+        
+        Args:
+            commands: Commands, each with its arguments as a list
+            parallel: Run the commands concurrently where supported
+            
+        Returns:
+            list[CommandResult]: One result per command
+            
+        Raises:
+            CommandError: Base exception for command-related errors
+        """
+        return [self.execute(command) for command in commands]
 
 
 class CommandError(Exception):
@@ -3,8 +3,9 @@
 This module provides remote command execution via SSH using paramiko.
 """
 
-from typing import Optional, Any
+from typing import Iterator, Optional, Any
 import logging
+import secrets
 import paramiko
 
 from .base import (
@@ -17,6 +18,21 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+# Each command of a batch writes its output and exit code to files in a
+# temporary directory; the results are then printed as length-prefixed
+# records: '<marker> <index> <exit code> <stdout bytes> <stderr bytes>'
+# followed by the stdout and stderr bytes
+_BATCH_HEAD = """t=$(mktemp -d) || exit 125
+trap 'rm -rf "$t"' EXIT
+"""
+_BATCH_COMMAND = """( {command}
+) </dev/null >"$t/{index}.out" 2>"$t/{index}.err"; echo $? >"$t/{index}.rc"
+"""
+_BATCH_RECORD = """printf '%s %d %d %d %d\\n' {marker} {index} "$(cat "$t/{index}.rc")" \\
+    $(($(wc -c <"$t/{index}.out"))) $(($(wc -c <"$t/{index}.err")))
+cat "$t/{index}.out" "$t/{index}.err"
+"""
+
 
 class SSHCommandExecutor(CommandExecutorInterface):
     """Execute commands remotely via SSH.
@@ -33,7 +49,8 @@ class SSHCommandExecutor(CommandExecutorInterface):
         password: Optional[str] = None,
         key_filename: Optional[str] = None,
         port: int = 22,
-        command_timeout: int = 30
+        command_timeout: int = 30,
+        connect_timeout: Optional[float] = None
     ):
         """Initialize the SSH command executor.
         
@@ -44,6 +61,7 @@ class SSHCommandExecutor(CommandExecutorInterface):
             key_filename: Path to SSH private key file (optional)
             port: SSH port (default: 22)
             command_timeout: Maximum execution time in seconds (default: 30)
+            connect_timeout: Connection timeout in seconds (default: command_timeout)
             
         Raises:
             CommandError: If configuration is invalid
@@ -63,6 +81,7 @@ class SSHCommandExecutor(CommandExecutorInterface):
         self.key_filename = key_filename
         self.port = port
         self.command_timeout = command_timeout
+        self.connect_timeout = connect_timeout or command_timeout
         self.ssh_client: Optional[Any] = None
         
         logger.info(
@@ -88,7 +107,7 @@ class SSHCommandExecutor(CommandExecutorInterface):
                 'hostname': self.host,
                 'port': self.port,
                 'username': self.username,
-                'timeout': self.command_timeout,
+                'timeout': self.connect_timeout,
             }
             
             if self.password:
@@ -173,6 +192,174 @@ class SSHCommandExecutor(CommandExecutorInterface):
             logger.error(error_msg)
             raise CommandExecutionError(error_msg) from e
     
+    def execute_lines(self, command: list[str]) -> Iterator[str]:
+        """Execute a command via SSH and yield its standard output line by line.
+        
+        The output is not collected, so commands printing millions of lines
+        can be consumed with constant memory.
+        
+        Args:
+            command: Command and arguments as a list
+            
+        Yields:
+            str: Lines of standard output without line terminators
+            
+        Raises:
+            CommandExecutionError: If command execution fails or the command
+                exits with a non-zero code (after its output was consumed)
+            SSHConnectionError: If SSH connection fails
+        """
+        command_str = ' '.join(command)
+        
+        # Connect if not already connected
+        if not self.ssh_client:
+            self.connect()
+        
+        logger.info(f"Executing SSH command on {self.host}: {command_str}")
+        
+        try:
+            stdin, stdout, stderr = self.ssh_client.exec_command(  # type: ignore
+                command_str,
+                timeout=self.command_timeout
+            )
+            for line in stdout:
+                yield line.rstrip('\r\n')
+            exit_code = stdout.channel.recv_exit_status()
+            stderr_str = stderr.read().decode('utf-8', errors='replace')
+        except Exception as e:
+            error_msg = f"SSH command execution failed: {str(e)}"
+            logger.error(error_msg)
+            raise CommandExecutionError(error_msg) from e
+        
+        if exit_code != 0:
+            error_msg = (
+                f"SSH command failed with exit code {exit_code}: {stderr_str.strip()}"
+            )
+            logger.warning(error_msg)
+            raise CommandExecutionError(error_msg)
+        logger.info("SSH command executed successfully (exit code: 0)")
+    
+    @staticmethod
+    def _batch_script(commands: list[str], marker: str, parallel: bool) -> str:
+        """Build the remote script of a batch."""
+        script = [_BATCH_HEAD]
+        for index, command in enumerate(commands):
+            step = _BATCH_COMMAND.format(command=command, index=index)
+            # Background steps end with '&' instead of the newline
+            script.append(f"( {step.rstrip()} ) &\n" if parallel else step)
+        if parallel:
+            script.append("wait\n")
+        for index in range(len(commands)):
+            script.append(_BATCH_RECORD.format(marker=marker, index=index))
+        return "".join(script)
+    
+    @staticmethod
+    def _parse_batch(
+        output: bytes,
+        commands: list[str],
+        marker: str
+    ) -> list[CommandResult]:
+        """Split the output of a batch script into per-command results."""
+        results: list[Optional[CommandResult]] = [None] * len(commands)
+        prefix = marker.encode() + b' '
+        position = output.find(prefix)
+        while position >= 0:
+            end = output.index(b'\n', position)
+            index, exit_code, out_size, err_size = (
+                int(field) for field in output[position + len(prefix):end].split()
+            )
+            start = end + 1
+            stdout = output[start:start + out_size]
+            stderr = output[start + out_size:start + out_size + err_size]
+            results[index] = CommandResult(
+                stdout=stdout.decode('utf-8', errors='replace'),
+                stderr=stderr.decode('utf-8', errors='replace'),
+                returncode=exit_code,
+                command=commands[index]
+            )
+            position = output.find(prefix, start + out_size + err_size)
+        
+        missing = [commands[i] for i, result in enumerate(results) if result is None]
+        if missing:
+            raise CommandExecutionError(
+                f"SSH batch returned no result for: {', '.join(missing)}"
+            )
+        return results  # type: ignore[return-value]
+    
+    def execute_batch(
+        self,
+        commands: list[list[str]],
+        parallel: bool = False
+    ) -> list[CommandResult]:
+        """Execute several commands via SSH in a single round trip.
+        
+        The commands are sent as one shell script over a single channel. Each
+        command's stdout, stderr and exit code are captured separately on the
+        remote host and returned as delimited records, so a failing command
+        does not stop the others.
+        
+        Args:
+            commands: Commands, each with its arguments as a list
+            parallel: Run the commands concurrently on the remote host
+            
+        Returns:
+            list[CommandResult]: One result per command, in the given order
+            
+        Raises:
+            CommandExecutionError: If the batch could not be executed
+            SSHConnectionError: If SSH connection fails
+        """
+        if not commands:
+            return []
+        command_strs = [' '.join(command) for command in commands]
+        # The marker cannot occur in the output by chance
+        marker = f"__scale_mcp_batch_{secrets.token_hex(8)}__"
+        script = self._batch_script(command_strs, marker, parallel)
+        
+        # Connect if not already connected
+        if not self.ssh_client:
+            self.connect()
+        
+        logger.info(
+            f"Executing SSH batch of {len(commands)} commands on {self.host}"
+            f"{' in parallel' if parallel else ''}: {'; '.join(command_strs)}"
+        )
+        
+        try:
+            stdin, stdout, stderr = self.ssh_client.exec_command(  # type: ignore
+                'sh -s',
+                timeout=self.command_timeout
+            )
+            # The script is read from stdin, so it is not limited by the
+            # maximum command line length
+            stdin.write(script)
+            stdin.flush()
+            stdin.channel.shutdown_write()
+            
+            output = stdout.read()
+            exit_code = stdout.channel.recv_exit_status()
+            stderr_str = stderr.read().decode('utf-8', errors='replace')
+        except Exception as e:
+            error_msg = f"SSH batch execution failed: {str(e)}"
+            logger.error(error_msg)
+            raise CommandExecutionError(error_msg) from e
+        
+        if exit_code != 0:
+            error_msg = (
+                f"SSH batch script failed with exit code {exit_code}: "
+                f"{stderr_str.strip()}"
+            )
+            logger.error(error_msg)
+            raise CommandExecutionError(error_msg)
+        
+        results = self._parse_batch(output, command_strs, marker)
+        failed = sum(1 for result in results if not result.success)
+        if failed:
+            logger.warning(f"SSH batch: {failed} of {len(results)} commands failed")
+        else:
+            logger.info(f"SSH batch of {len(results)} commands executed successfully")
+        return results
+    
     def __enter__(self):
         """Context manager entry - establish connection."""
         self.connect()
@@ -192,7 +192,7 @@ async def mount_all_filesystems_api(
         headers["X-StorageScaleDomain"] = domain
 
     try:
-        async with StorageScaleClient() as client:
+        async with StorageScaleClient(long_running=True) as client:
             return await client.post("/scalemgmt/v3/filesystems:mount", headers=headers)
     except StorageScaleAPIError as e:
         raise StorageScaleAPIError(f"Failed to mount all filesystems: {str(e)}") from e
@@ -217,7 +217,7 @@ async def unmount_all_filesystems_api(
         headers["X-StorageScaleDomain"] = domain
 
     try:
-        async with StorageScaleClient() as client:
+        async with StorageScaleClient(long_running=True) as client:
             return await client.post(
                 "/scalemgmt/v3/filesystems:unmount", headers=headers
             )
@@ -55,7 +55,7 @@ async def batch_add_nodes_api(
         headers["X-StorageScaleDomain"] = domain
 
     try:
-        async with StorageScaleClient() as client:
+        async with StorageScaleClient(long_running=True) as client:
             return await client.post(
                 "/scalemgmt/v3/nodes:batchAdd", json=nodes_data, headers=headers
             )
@@ -136,7 +136,7 @@ async def start_nodes_api(
         headers["X-StorageScaleDomain"] = domain
 
     try:
-        async with StorageScaleClient() as client:
+        async with StorageScaleClient(long_running=True) as client:
             return await client.post(
                 "/scalemgmt/v3/nodes:start", json=nodes_data, headers=headers
             )
@@ -165,7 +165,7 @@ async def stop_nodes_api(
         headers["X-StorageScaleDomain"] = domain
 
     try:
-        async with StorageScaleClient() as client:
+        async with StorageScaleClient(long_running=True) as client:
             return await client.post(
                 "/scalemgmt/v3/nodes:stop", json=nodes_data, headers=headers
             )
@@ -6,14 +6,17 @@ from scale_mcp_server.utils.client import StorageScaleClient, StorageScaleAPIErr
 
 async def list_nsds_api(
     domain: Optional[str] = None,
+    raw: bool = False,
 ) -> Any:
     """List all NSDs (Network Shared Disks).
 
     Args:
         domain: Domain to be authorized against (default 'StorageScaleDomain')
+        raw: Return the undecoded JSON response body (default False)
 
     Returns:
-        Dictionary containing NSDs information
+        Dictionary containing NSDs information, or the raw
+        JSON body if raw is set
 
     Raises:
         StorageScaleAPIError: If the API request fails
@@ -24,7 +27,7 @@ async def list_nsds_api(
 
     try:
         async with StorageScaleClient() as client:
-            return await client.get("/scalemgmt/v3/nsds", headers=headers)
+            return await client.get("/scalemgmt/v3/nsds", headers=headers, raw=raw)
     except StorageScaleAPIError as e:
         raise StorageScaleAPIError(f"Failed to list NSDs: {str(e)}") from e
 
@@ -77,7 +80,7 @@ async def batch_create_nsds_api(
         headers["X-StorageScaleDomain"] = domain
 
     try:
-        async with StorageScaleClient() as client:
+        async with StorageScaleClient(long_running=True) as client:
             return await client.post(
                 "/scalemgmt/v3/nsds:batchCreate", json=nsds_data, headers=headers
             )
@@ -7,19 +7,32 @@ from scale_mcp_server.utils.client import StorageScaleClient, StorageScaleAPIErr
 async def list_snapshots_api(
     filesystem: str,
     domain: Optional[str] = None,
+    raw: bool = False,
+    page_size: Optional[int] = None,
+    page_token: Optional[str] = None,
 ) -> Any:
     """List all snapshots for a filesystem.
 
     Args:
         filesystem: Filesystem name
         domain: Domain to be authorized against (default 'StorageScaleDomain')
+        raw: Return the undecoded JSON response body (default False)
+        page_size: Number of results per page (default: all)
+        page_token: Token of the page to return
 
     Returns:
-        Dictionary containing snapshots information
+        Dictionary containing snapshots information, or the raw
+        JSON body if raw is set
 
     Raises:
         StorageScaleAPIError: If the API request fails
     """
+    query_params = {}
+    if page_size:
+        query_params["page_size"] = page_size
+    if page_token:
+        query_params["page_token"] = page_token
+
     headers = {}
     if domain:
         headers["X-StorageScaleDomain"] = domain
@@ -27,7 +40,10 @@ async def list_snapshots_api(
     try:
         async with StorageScaleClient() as client:
             return await client.get(
-                f"/scalemgmt/v3/filesystems/{filesystem}/snapshots", headers=headers
+                f"/scalemgmt/v3/filesystems/{filesystem}/snapshots",
+                params=query_params,
+                headers=headers,
+                raw=raw,
             )
     except StorageScaleAPIError as e:
         raise StorageScaleAPIError(
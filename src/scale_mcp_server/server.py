@@ -1,16 +1,28 @@
 import argparse
 from fastmcp import FastMCP
+from fastmcp.server.lifespan import lifespan
 from pathlib import Path
+from scale_mcp_server.utils.client import close_shared_clients
+from scale_mcp_server.utils.endpoints import close_routers
 from scale_mcp_server.utils.read_config import read_config, setup_logging
+from scale_mcp_server.utils.scheduler import PriorityMiddleware
+from scale_mcp_server.utils.timeouts import DeadlineMiddleware
+from scale_mcp_server.utils.log_format import LogContextMiddleware
+from scale_mcp_server.utils.context_logging import ContextLogMiddleware, parse_level
+from scale_mcp_server.utils.clusters import ClusterMiddleware
 from scale_mcp_server.adapters.fileops import initialize_fileops_client
 from scale_mcp_server.tools.third_party import fileops
+from scale_mcp_server.tools.cli import commands as cli_commands
 from scale_mcp_server.tools.cli import policies as cli_policies
+from scale_mcp_server.tools.server import jobs, metrics
+from scale_mcp_server.tools.fleet import clusters as fleet_clusters
 from scale_mcp_server.tools.v3 import (
     clusters,
     config,
     diagnostics,
     filesets,
     filesystems,
+    inventory,
     nodes,
     nsds,
     policies,
@@ -22,9 +34,23 @@ from scale_mcp_server.tools.v3 import (
 from scale_mcp_server.tools.v2 import (
     nodes_health,
     filesystems_health,
+    health_feed,
+    health_watcher,
 )
 
 
+@lifespan
+async def close_connections(server):
+    """Stop the health pollers, close REST connections and stop node probes on shutdown."""
+    try:
+        yield {}
+    finally:
+        await health_feed.feed.stop()
+        await health_watcher.watcher.stop()
+        await close_routers()
+        await close_shared_clients()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="IBM Storage Scale MCP Server",
@@ -95,9 +121,19 @@ Examples:
     config_path = Path(__file__).parent.parent.parent / "config" / "mcp_config.ini"
     config_data = read_config(config_path=config_path)
     setup_logging(config_data)
+    fastmcp_config = config_data.get("fastmcp", {})
 
     # Initialize MCP server
-    mcp = FastMCP(name="scale-mcp-server", version="1.0.0")
+    mcp = FastMCP(
+        name="scale-mcp-server",
+        version="1.0.0",
+        lifespan=close_connections,
+        client_log_level=parse_level(fastmcp_config.get("contextLogLevel")),
+    )
+    mcp.add_middleware(PriorityMiddleware())
+    mcp.add_middleware(DeadlineMiddleware())
+    mcp.add_middleware(LogContextMiddleware())
+    mcp.add_middleware(ContextLogMiddleware.from_config(fastmcp_config))
 
     # Mounting sub-servers
     mcp.mount(clusters.mcp)
@@ -105,6 +141,7 @@ Examples:
     mcp.mount(diagnostics.mcp)
     mcp.mount(filesets.mcp)
     mcp.mount(filesystems.mcp)
+    mcp.mount(inventory.mcp)
     mcp.mount(nodes.mcp)
     mcp.mount(nsds.mcp)
     mcp.mount(policies.mcp)
@@ -115,8 +152,37 @@ Examples:
     # V2
     mcp.mount(nodes_health.mcp)
     mcp.mount(filesystems_health.mcp)
+    mcp.mount(health_feed.mcp)
+    mcp.mount(health_watcher.mcp)
+    health_watcher.register_subscriptions(mcp)
     # CLI tools
     mcp.mount(cli_policies.mcp)
+    mcp.mount(cli_commands.mcp)
+    # Server tools
+    mcp.mount(jobs.mcp)
+    mcp.mount(metrics.mcp)
+    # Fleet tools
+    mcp.mount(fleet_clusters.mcp)
+
+    # REST tools take a 'cluster' argument when several clusters are configured
+    rest_servers = [
+        clusters.mcp,
+        config.mcp,
+        diagnostics.mcp,
+        filesets.mcp,
+        filesystems.mcp,
+        inventory.mcp,
+        nodes.mcp,
+        nsds.mcp,
+        policies.mcp,
+        quotas.mcp,
+        snapshots.mcp,
+        storage_pools.mcp,
+        version.mcp,
+        nodes_health.mcp,
+        filesystems_health.mcp,
+    ]
+    mcp.add_middleware(ClusterMiddleware(rest_servers))
 
     # Setup fileops tools if paths are provided
     if args.filesystem_paths:
@@ -133,7 +199,6 @@ Examples:
             print("  Make sure Node.js and npx are installed.")
             raise
 
-    fastmcp_config = config_data.get("fastmcp", {})
     log_level = (
         args.log_level if args.log_level else fastmcp_config.get("level", "INFO")
     )
@@ -0,0 +1,181 @@
+"""IBM Storage Scale CLI Read-Only Command Tools."""
+
+from fastmcp import FastMCP
+import logging
+import json
+import shlex
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from scale_mcp_server.adapters.base import CommandError
+from scale_mcp_server.tools.cli.connection import create_executor
+from scale_mcp_server.utils.mmparse import MmParser
+
+logger = logging.getLogger(__name__)
+
+# Create the CLI command MCP server
+mcp = FastMCP(
+    "scale-cli-commands",
+    instructions="Read-only IBM Storage Scale mm commands via SSH with parsed -Y output",
+)
+
+# Commands that only report state; nothing else can be run through this server
+READ_ONLY_COMMANDS = (
+    "mmlsfileset",
+    "mmrepquota",
+    "mmlsdisk",
+    "mmlssnapshot",
+    "mmlscluster",
+)
+
+ReadOnlyCommand = Literal[
+    "mmlsfileset", "mmrepquota", "mmlsdisk", "mmlssnapshot", "mmlscluster"
+]
+
+
+class MmCommand(BaseModel):
+    """A read-only mm command of a batch."""
+
+    command: ReadOnlyCommand
+    arguments: list[str] = Field(
+        default_factory=list,
+        description="Further command arguments, e.g. ['fs1'] (-Y is added)",
+    )
+
+
+def _command_line(command: str, arguments: Optional[list[str]]) -> list[str]:
+    """Build the command line of a read-only command with -Y."""
+    if command not in READ_ONLY_COMMANDS:
+        raise ValueError(
+            f"Command '{command}' is not allowed, expected one of {READ_ONLY_COMMANDS}"
+        )
+    if arguments is not None and (
+        not isinstance(arguments, list)
+        or not all(isinstance(arg, str) for arg in arguments)
+    ):
+        raise ValueError(f"arguments must be a list of strings, got: {arguments!r}")
+    # Quote the arguments, the remote shell must not interpret them
+    command_line = [command] + [shlex.quote(arg) for arg in arguments or []]
+    if "-Y" not in (arguments or []):
+        command_line.append("-Y")
+    return command_line
+
+
+@mcp.tool()
+def run_mm_command(
+    command: ReadOnlyCommand,
+    arguments: Optional[list[str]] = None,
+    columns: Optional[list[str]] = None,
+    limit: Optional[int] = None,
+) -> str:
+    """Run a read-only mm command and return its output as tables.
+
+    The command is run with -Y, and its colon-delimited output is parsed
+    into one table per section, with the values of each column in a list.
+    Selecting columns keeps large outputs, such as the filesets or quotas of
+    a big filesystem, small.
+
+    Args:
+        command: The mm command, one of mmlsfileset, mmrepquota, mmlsdisk,
+            mmlssnapshot or mmlscluster
+        arguments: Further command arguments, e.g. ['fs1'] or ['fs1', '-L']
+            (-Y is added)
+        columns: Column names to return, as in the HEADER of the -Y output,
+            e.g. ['filesetName', 'path'] (default: all)
+        limit: Maximum number of rows per table (default: all)
+
+    Returns:
+        str: JSON object with the command line and the tables by section
+            name, each with its total number of rows and its columns
+    """
+    if limit is not None and limit < 0:
+        raise ValueError("limit must not be negative")
+    command_line = _command_line(command, arguments)
+
+    try:
+        parser = MmParser(columns)
+        logger.info(f"Running read-only command: {' '.join(command_line)}")
+        with create_executor() as executor:
+            parser.feed_lines(executor.execute_lines(command_line))
+
+        if parser.skipped:
+            logger.debug(f"Skipped {parser.skipped} lines of {command} output")
+        return json.dumps(
+            {
+                "command": " ".join(command_line),
+                "tables": {
+                    name: table.to_dict(limit) for name, table in parser.tables.items()
+                },
+            }
+        )
+
+    except CommandError as e:
+        logger.error(f"Failed to run {command}: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error: {str(e)}")
+        raise
+
+
+@mcp.tool()
+def run_mm_commands(
+    commands: list[MmCommand],
+    columns: Optional[list[str]] = None,
+    limit: Optional[int] = None,
+    parallel: bool = False,
+) -> str:
+    """Run several read-only mm commands in one SSH round trip.
+
+    The commands are sent to the node as a single script, so a diagnosis
+    needing several commands pays the SSH latency once. Each command is
+    run with -Y and its output parsed into tables as with run_mm_command;
+    a failing command is reported with its exit code and error output and
+    does not stop the others.
+
+    Args:
+        commands: Commands to run, each an object with a 'command' (one of
+            mmlsfileset, mmrepquota, mmlsdisk, mmlssnapshot or mmlscluster)
+            and optional 'arguments', e.g.
+            [{"command": "mmlsdisk", "arguments": ["fs1"]},
+            {"command": "mmlssnapshot", "arguments": ["fs1"]}]
+        columns: Column names to return from every table (default: all)
+        limit: Maximum number of rows per table (default: all)
+        parallel: Run the commands concurrently on the node (default: False)
+
+    Returns:
+        str: JSON object with one result per command, in the given order,
+            each with its command line, exit code and tables, or its error
+    """
+    if not commands:
+        raise ValueError("At least one command is required")
+    if limit is not None and limit < 0:
+        raise ValueError("limit must not be negative")
+    command_lines = [
+        _command_line(entry.command, entry.arguments) for entry in commands
+    ]
+
+    try:
+        logger.info(f"Running {len(command_lines)} read-only commands in one batch")
+        with create_executor() as executor:
+            results = executor.execute_batch(command_lines, parallel=parallel)
+
+        output = []
+        for command_line, result in zip(command_lines, results):
+            entry = {"command": " ".join(command_line), "exit_code": result.returncode}
+            if result.success:
+                parser = MmParser(columns).feed_lines(result.stdout.splitlines())
+                entry["tables"] = {
+                    name: table.to_dict(limit) for name, table in parser.tables.items()
+                }
+            else:
+                entry["error"] = result.stderr.strip() or result.stdout.strip()
+            output.append(entry)
+        return json.dumps({"results": output})
+
+    except CommandError as e:
+        logger.error(f"Failed to run command batch: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error: {str(e)}")
+        raise
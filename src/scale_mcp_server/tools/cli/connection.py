@@ -0,0 +1,51 @@
+"""SSH connection settings of the IBM Storage Scale CLI tools."""
+
+import os
+
+from scale_mcp_server.adapters.ssh_executor import SSHCommandExecutor
+from scale_mcp_server.utils.read_config import read_config, scale_config_path
+from scale_mcp_server.utils.timeouts import CLI, effective_timeout, load_profiles
+
+# Load configuration from default location or SCALE_CONFIG_PATH
+config = read_config(scale_config_path())
+
+# Get SSH connection details from config
+if 'ssh' not in config:
+    raise ValueError("Missing [ssh] section in configuration file")
+
+ssh_config = config['ssh']
+if not ssh_config.get('hostname'):
+    raise ValueError("Missing 'hostname' in [ssh] configuration")
+if not ssh_config.get('username'):
+    raise ValueError("Missing 'username' in [ssh] configuration")
+
+SSH_HOST = ssh_config['hostname']
+SSH_PORT = int(ssh_config.get('port', 22))
+SSH_USERNAME = ssh_config['username']
+SSH_PASSWORD = ssh_config.get('password') or None
+SSH_KEY_PATH = ssh_config.get('key_path') or None
+
+# Expand ~ to home directory if present in key path
+if SSH_KEY_PATH:
+    SSH_KEY_PATH = os.path.expanduser(SSH_KEY_PATH)
+
+# Get timeout from the cli profile of the [timeouts] config section
+COMMAND_TIMEOUT = load_profiles(config)[CLI]
+
+
+def create_executor() -> SSHCommandExecutor:
+    """Create an SSH executor for the configured node.
+
+    The command timeout is the cli profile, cut to the deadline of the
+    current tool call.
+    """
+    timeout = effective_timeout(COMMAND_TIMEOUT)
+    return SSHCommandExecutor(
+        host=SSH_HOST,
+        username=SSH_USERNAME,
+        password=SSH_PASSWORD if not SSH_KEY_PATH else None,
+        key_filename=SSH_KEY_PATH,
+        port=SSH_PORT,
+        command_timeout=timeout.read,
+        connect_timeout=timeout.connect
+    )
@@ -0,0 +1,162 @@
+"""IBM Storage Scale Fleet MCP Server."""
+
+import time
+from typing import Optional, Any
+from fastmcp import FastMCP, Context
+from scale_mcp_server.api.v2.nodes import get_node_health_states_api
+from scale_mcp_server.api.v3.filesystems import list_filesystems_api
+from scale_mcp_server.utils.clusters import (
+    DEFAULT_CLUSTER,
+    cluster_config,
+    cluster_names,
+    gather_clusters,
+)
+from scale_mcp_server.utils.read_config import read_config, scale_config_path
+
+# Create the fleet MCP server
+mcp = FastMCP("fleet", instructions="Operations across all configured clusters")
+
+HEALTHY_STATES = frozenset(("HEALTHY", "TIPS"))
+
+
+def _items(response: Any, key: str) -> list:
+    """Extract the entity list from a list response."""
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict) and isinstance(response.get(key), list):
+        return response[key]
+    return []
+
+
+@mcp.tool()
+async def list_configured_clusters(ctx: Context) -> Any:
+    """List the Storage Scale clusters this server is configured for.
+
+    The names can be passed as the 'cluster' argument of the other tools and
+    as 'clusters' of the fleet tools.
+
+    Returns:
+        List of clusters with their name and management host
+    """
+    await ctx.info("Tool called: list_configured_clusters")
+
+    try:
+        config = read_config(config_path=scale_config_path())
+        result = []
+        for name in cluster_names(config):
+            api_config = cluster_config(config, name).get("scale_api", {})
+            result.append(
+                {
+                    "name": name,
+                    "hostname": api_config.get("hostname"),
+                    "default": name == DEFAULT_CLUSTER,
+                }
+            )
+        await ctx.info(f"Found {len(result)} configured clusters")
+        return result
+    except Exception as e:
+        await ctx.error(f"Failed to list configured clusters: {str(e)}")
+        raise
+
+
+@mcp.tool(tags={"bulk"})
+async def list_fleet_filesystems(
+    ctx: Context,
+    clusters: Optional[list[str]] = None,
+    domain: Optional[str] = None,
+) -> Any:
+    """List the filesystems of several clusters concurrently.
+
+    A cluster that cannot be reached is reported under 'errors' without
+    failing the others.
+
+    Args:
+        clusters: Cluster names (default: all configured clusters)
+        domain: Domain to be authorized against (default 'StorageScaleDomain')
+
+    Returns:
+        Dictionary with all filesystems, each with its 'cluster', the number
+        of filesystems per cluster, errors and the elapsed time
+    """
+    await ctx.info(f"Tool called: list_fleet_filesystems with clusters={clusters}")
+    started = time.perf_counter()
+
+    try:
+        results, errors = await gather_clusters(
+            lambda: list_filesystems_api(domain=domain), clusters
+        )
+        filesystems = [
+            {"cluster": cluster, **filesystem}
+            for cluster, response in results.items()
+            for filesystem in _items(response, "filesystems")
+        ]
+        await ctx.info(
+            f"Retrieved {len(filesystems)} filesystems from {len(results)} clusters"
+        )
+        return {
+            "filesystems": filesystems,
+            "clusters": {
+                cluster: len(_items(response, "filesystems"))
+                for cluster, response in results.items()
+            },
+            "errors": errors,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+    except Exception as e:
+        await ctx.error(f"Failed to list fleet filesystems: {str(e)}")
+        raise
+
+
+@mcp.tool(tags={"bulk"})
+async def get_fleet_health(
+    ctx: Context,
+    clusters: Optional[list[str]] = None,
+) -> Any:
+    """Get the System Health state of all nodes of several clusters concurrently.
+
+    Every cluster is summarized by its number of health entities and the
+    entities not in a HEALTHY or TIPS state. A cluster that cannot be reached
+    is reported under 'errors' without failing the others.
+
+    Args:
+        clusters: Cluster names (default: all configured clusters)
+
+    Returns:
+        Dictionary with a health summary per cluster, the unhealthy entities
+        of the whole fleet, errors and the elapsed time
+    """
+    await ctx.info(f"Tool called: get_fleet_health with clusters={clusters}")
+    started = time.perf_counter()
+
+    try:
+        results, errors = await gather_clusters(
+            lambda: get_node_health_states_api(":all:"), clusters
+        )
+        summary = {}
+        unhealthy = []
+        for cluster, response in results.items():
+            states = _items(response, "states")
+            degraded = [
+                {"cluster": cluster, **state}
+                for state in states
+                if state.get("state") not in HEALTHY_STATES
+            ]
+            summary[cluster] = {
+                "entities": len(states),
+                "unhealthy": len(degraded),
+                "healthy": not degraded,
+            }
+            unhealthy.extend(degraded)
+        await ctx.info(
+            f"Retrieved health of {len(results)} clusters, "
+            f"{len(unhealthy)} unhealthy entities"
+        )
+        return {
+            "clusters": summary,
+            "unhealthy": unhealthy,
+            "errors": errors,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+    except Exception as e:
+        await ctx.error(f"Failed to get fleet health: {str(e)}")
+        raise
@@ -0,0 +1,115 @@
+"""Storage Scale MCP Server Background Jobs MCP Server."""
+
+from typing import Optional, Any
+from fastmcp import FastMCP, Context
+from scale_mcp_server.utils.jobs import Job, get_job_manager
+from scale_mcp_server.utils.scheduler import request_session
+
+# Create the jobs MCP server
+mcp = FastMCP(
+    "jobs",
+    instructions="Status of long-running operations submitted as background jobs",
+)
+
+
+@mcp.tool()
+async def get_job(
+    ctx: Context,
+    job_id: str,
+    wait: float = 0.0,
+) -> Any:
+    """Get the status and result of a background job.
+
+    Long-running operations such as mount_all_filesystems, start_nodes or
+    batch_create_nsds return a job_id instead of their result. With wait set,
+    the call blocks up to that many seconds for the job to finish and sends
+    progress notifications while it runs. Only jobs submitted by this session
+    can be read.
+
+    Args:
+        job_id: Job ID returned by the operation
+        wait: Seconds to wait for the job to finish (default 0)
+
+    Returns:
+        Job record with status 'pending', 'running', 'succeeded', 'failed'
+        or 'cancelled', and the result or error once finished
+    """
+    await ctx.info(f"Tool called: get_job with job_id={job_id}, wait={wait}")
+
+    async def progress(job: Job) -> None:
+        await ctx.report_progress(
+            progress=round(job.elapsed, 1),
+            message=f"{job.operation} {job.status} for {job.elapsed:.0f}s",
+        )
+
+    try:
+        manager = get_job_manager()
+        job = manager.get(job_id, request_session.get())
+        if job is None:
+            raise ValueError(f"Job '{job_id}' not found")
+        if wait > 0:
+            job = await manager.wait(job, wait, progress)
+        await ctx.info(f"Job {job_id} is {job.status}")
+        return job.to_dict()
+    except Exception as e:
+        await ctx.error(f"Failed to get job {job_id}: {str(e)}")
+        raise
+
+
+@mcp.tool()
+async def list_jobs(
+    ctx: Context,
+    status: Optional[str] = None,
+    operation: Optional[str] = None,
+) -> Any:
+    """List the background jobs of this session, newest first.
+
+    Args:
+        status: Only jobs with this status, e.g. 'running' or 'failed'
+        operation: Only jobs of this operation, e.g. 'start_nodes'
+
+    Returns:
+        Dictionary containing the matching jobs
+    """
+    await ctx.info(
+        f"Tool called: list_jobs with status={status}, operation={operation}"
+    )
+
+    try:
+        jobs = get_job_manager().list(
+            status=status, operation=operation, session=request_session.get()
+        )
+        await ctx.info(f"Found {len(jobs)} jobs")
+        return {"jobs": [job.to_dict() for job in jobs]}
+    except Exception as e:
+        await ctx.error(f"Failed to list jobs: {str(e)}")
+        raise
+
+
+@mcp.tool()
+async def cancel_job(
+    ctx: Context,
+    job_id: str,
+) -> Any:
+    """Cancel a pending or running background job of this session.
+
+    Cancelling abandons the REST request. An operation the management node
+    has already accepted may still complete there.
+
+    Args:
+        job_id: Job ID returned by the operation
+
+    Returns:
+        Job record
+    """
+    await ctx.info(f"Tool called: cancel_job with job_id={job_id}")
+
+    try:
+        job = get_job_manager().cancel(job_id, request_session.get())
+        if job is None:
+            raise ValueError(f"Job '{job_id}' not found")
+        await ctx.info(f"Cancellation of job {job_id} requested")
+        return job.to_dict()
+    except Exception as e:
+        await ctx.error(f"Failed to cancel job {job_id}: {str(e)}")
+        raise
@@ -0,0 +1,78 @@
+"""Storage Scale MCP Server Metrics MCP Server."""
+
+from typing import Any
+from fastmcp import FastMCP, Context
+from scale_mcp_server.utils.limiter import client_metrics
+from scale_mcp_server.utils.listing import get_lister
+from scale_mcp_server.utils.logging_queue import pipeline_stats
+
+# Create the metrics MCP server
+mcp = FastMCP("metrics", instructions="Metrics of this MCP server")
+
+
+@mcp.tool()
+async def get_client_metrics(ctx: Context) -> Any:
+    """Get request scheduling and concurrency limit metrics per REST endpoint.
+
+    For every Storage Scale REST endpoint contacted so far, reports the
+    current concurrency limit with its bounds, requests in flight and queued,
+    requests dispatched per priority class, the smoothed latency, the smoothed
+    and baseline latency per request kind (method, endpoint template and
+    response size class), and how often the limit was raised or lowered after 429/503 responses,
+    transport errors or rising latency. With several management nodes
+    configured, each node also reports whether it is up, its smoothed latency
+    and its failures.
+
+    Returns:
+        Dictionary keyed by endpoint URL with 'scheduler' and 'limiter' sections
+    """
+    await ctx.info("Tool called: get_client_metrics")
+
+    try:
+        result = client_metrics()
+        await ctx.info(f"Retrieved client metrics for {len(result)} endpoints")
+        return result
+    except Exception as e:
+        await ctx.error(f"Failed to get client metrics: {str(e)}")
+        raise
+
+
+@mcp.tool()
+async def get_logging_metrics(ctx: Context) -> Any:
+    """Get metrics of the logging pipeline.
+
+    Log records are written by a background thread from a bounded queue.
+    Reports the queue depth and size, records dropped because the queue was
+    full, and DEBUG records suppressed by sampling and rate limiting.
+
+    Returns:
+        Dictionary of logging pipeline metrics
+    """
+    await ctx.info("Tool called: get_logging_metrics")
+
+    try:
+        return pipeline_stats()
+    except Exception as e:
+        await ctx.error(f"Failed to get logging metrics: {str(e)}")
+        raise
+
+
+@mcp.tool()
+async def get_listing_metrics(ctx: Context) -> Any:
+    """Get the cost models that choose between REST and CLI listings.
+
+    Fileset and quota listings are served by the REST API or by mm commands
+    over SSH. Reports the fitted setup and per-item cost of each backend, how
+    often each was chosen, CLI failures that fell back to REST, and the last
+    listing size per filesystem.
+
+    Returns:
+        Dictionary of listing backend metrics
+    """
+    await ctx.info("Tool called: get_listing_metrics")
+
+    try:
+        return get_lister().stats()
+    except Exception as e:
+        await ctx.error(f"Failed to get listing metrics: {str(e)}")
+        raise
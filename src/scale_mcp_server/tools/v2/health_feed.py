@@ -0,0 +1,55 @@
+"""IBM Storage Scale Incremental Health Event Feed MCP Server (v2 API)."""
+
+from pathlib import Path
+from typing import Optional, Any
+from fastmcp import FastMCP, Context
+from scale_mcp_server.utils.health_feed import HealthEventFeed
+from scale_mcp_server.utils.read_config import read_config
+
+# Create the health feed MCP server
+mcp = FastMCP(
+    "health_feed_v2",
+    instructions="Incremental System Health event feed (v2 API)",
+)
+
+config_path = Path(__file__).resolve().parents[4] / "config" / "mcp_config.ini"
+feed_config = read_config(config_path).get("health_feed", {})
+
+feed = HealthEventFeed(
+    interval=float(feed_config.get("interval", 30)),
+    history=int(feed_config.get("history", 10000)),
+)
+
+
+@mcp.tool()
+async def get_health_event_changes(
+    ctx: Context,
+    cursor: Optional[str] = None,
+) -> Any:
+    """Get System Health events added, updated or cleared since a cursor.
+
+    A background poller keeps the active events of all nodes and filesystems.
+    Pass the cursor returned by the previous call to receive only the changes
+    since then. Without a cursor, or when the cursor has expired, all active
+    events are returned as added and 'reset' is true.
+
+    Args:
+        cursor: Cursor returned by a previous call
+
+    Returns:
+        Dictionary containing the new cursor and the added, updated and
+        cleared events
+    """
+    await ctx.info(f"Tool called: get_health_event_changes with cursor={cursor}")
+
+    try:
+        await feed.ensure_started()
+        result = feed.changes_since(cursor)
+        await ctx.info(
+            f"Health event changes: {len(result['added'])} added, "
+            f"{len(result['updated'])} updated, {len(result['cleared'])} cleared"
+        )
+        return result
+    except Exception as e:
+        await ctx.error(f"Failed to get health event changes: {str(e)}")
+        raise
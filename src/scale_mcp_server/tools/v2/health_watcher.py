@@ -0,0 +1,97 @@
+"""IBM Storage Scale Health State Watcher MCP Server (v2 API).
+
+Exposes the System Health state table kept by a single server-side watcher
+as an MCP resource. Clients subscribe to the resource once and receive a
+resources/updated notification whenever the table changes, instead of
+polling get_node_health_states themselves.
+"""
+
+import logging
+import weakref
+from pathlib import Path
+from typing import Any
+from fastmcp import FastMCP
+from mcp.server.lowlevel.server import request_ctx
+from mcp.server.session import ServerSession
+from scale_mcp_server.utils.health_feed import HealthStateWatcher
+from scale_mcp_server.utils.read_config import read_config
+from scale_mcp_server.utils.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+HEALTH_STATES_URI = "scale://health/states"
+
+# Create the health watcher MCP server
+mcp = FastMCP(
+    "health_watcher_v2",
+    instructions="Subscribable System Health state table (v2 API)",
+)
+
+config_path = Path(__file__).resolve().parents[4] / "config" / "mcp_config.ini"
+watcher_config = read_config(config_path).get("health_watcher", {})
+
+watcher = HealthStateWatcher(
+    interval=float(watcher_config.get("interval", 15)),
+    jitter=float(watcher_config.get("jitter", 0.2)),
+)
+
+# Sessions subscribed to the health states resource
+_subscribers: "weakref.WeakSet[ServerSession]" = weakref.WeakSet()
+
+
+async def _notify_subscribers() -> None:
+    """Send a resources/updated notification to every subscribed session."""
+    for session in list(_subscribers):
+        try:
+            await session.send_resource_updated(HEALTH_STATES_URI)  # type: ignore[arg-type]
+        except Exception as e:
+            logger.debug(f"Dropping health state subscriber: {e}")
+            _subscribers.discard(session)
+
+
+watcher.listeners.append(_notify_subscribers)
+
+
+@mcp.resource(HEALTH_STATES_URI, mime_type="application/json")
+async def health_states() -> str:
+    """System Health states of all nodes, kept up to date by a background watcher.
+
+    Subscribe to this resource to be notified when any node or component
+    changes state. 'unhealthy' lists only the entities not in a HEALTHY state.
+    """
+    await watcher.ensure_started()
+    return dumps(watcher.snapshot())
+
+
+def register_subscriptions(server: FastMCP) -> None:
+    """Register resource subscription handlers on the top-level server.
+
+    Subscribe requests are handled by the server the client is connected to,
+    so they cannot be registered on this mounted sub-server.
+
+    Args:
+        server: The top-level FastMCP server
+    """
+    low_level = server._mcp_server
+
+    @low_level.subscribe_resource()
+    async def subscribe(uri: Any) -> None:
+        if str(uri) != HEALTH_STATES_URI:
+            raise ValueError(f"Resource '{uri}' does not support subscriptions")
+        _subscribers.add(request_ctx.get().session)
+        await watcher.ensure_started()
+
+    @low_level.unsubscribe_resource()
+    async def unsubscribe(uri: Any) -> None:
+        _subscribers.discard(request_ctx.get().session)
+
+    # The MCP SDK always advertises subscribe=False; advertise the handlers
+    get_capabilities = low_level.get_capabilities
+
+    def get_capabilities_with_subscribe(*args: Any, **kwargs: Any) -> Any:
+        capabilities = get_capabilities(*args, **kwargs)
+        if capabilities.resources is not None:
+            capabilities.resources.subscribe = True
+        return capabilities
+
+    low_level.get_capabilities = get_capabilities_with_subscribe  # type: ignore[method-assign]
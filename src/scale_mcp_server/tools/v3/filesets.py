@@ -1,6 +1,6 @@
 """IBM Storage Scale Fileset Management MCP Server."""
 
-from typing import Optional, Any
+from typing import Literal, Optional, Any
 from fastmcp import FastMCP, Context
 from scale_mcp_server.api.v3.filesets import (
     list_filesets_api,
@@ -12,6 +12,8 @@ from scale_mcp_server.api.v3.filesets import (
     link_fileset_api,
     unlink_fileset_api,
 )
+from scale_mcp_server.utils.listing import FILESETS, get_lister, records
+from scale_mcp_server.utils.serialization import raw_result
 
 # Create the filesets MCP server
 mcp = FastMCP("filesets", instructions="Fileset management operations")
@@ -36,14 +38,56 @@ async def list_filesets(
     await ctx.debug(f"Listing all filesets for filesystem: {filesystem}")
 
     try:
-        result = await list_filesets_api(filesystem=filesystem, domain=domain)
+        result = await list_filesets_api(filesystem=filesystem, domain=domain, raw=True)
         await ctx.info(f"Successfully retrieved filesets for {filesystem}")
-        return result
+        return raw_result(result)
     except Exception as e:
         await ctx.error(f"Failed to list filesets for {filesystem}: {str(e)}")
         raise
 
 
+@mcp.tool(tags={"bulk"})
+async def list_fileset_records(
+    ctx: Context,
+    filesystem: str,
+    domain: Optional[str] = None,
+    backend: Optional[Literal["auto", "rest", "cli"]] = None,
+) -> Any:
+    """List the filesets of a filesystem as normalized records.
+
+    The filesets are listed through the REST API or with mmlsfileset -Y over SSH,
+    whichever is predicted to be faster from the durations and sizes of
+    earlier listings; large filesystems usually take the CLI. The records
+    are the same for both backends.
+
+    Args:
+        filesystem: Filesystem name
+        domain: Domain to be authorized against (default 'StorageScaleDomain');
+            listings with a domain always use the REST API
+        backend: 'auto', 'rest' or 'cli' (default: [scale_api] listing_backend)
+
+    Returns:
+        Dictionary with the records, their number, the backend that served
+        them and the elapsed time
+    """
+    await ctx.info(f"Tool called: list_fileset_records with filesystem={filesystem}")
+
+    try:
+        items, used, elapsed = await get_lister().list(
+            FILESETS, filesystem, domain=domain, backend=backend
+        )
+        await ctx.info(f"Listed {len(items)} filesets of {filesystem} with {used}")
+        return {
+            "filesets": records(items),
+            "count": len(items),
+            "backend": used,
+            "elapsed_ms": round(elapsed * 1000, 2),
+        }
+    except Exception as e:
+        await ctx.error(f"Failed to list filesets of {filesystem}: {str(e)}")
+        raise
+
+
 @mcp.tool()
 async def create_independent_fileset(
     ctx: Context,
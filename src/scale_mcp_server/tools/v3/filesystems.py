@@ -2,6 +2,7 @@
 
 from typing import Optional, Any
 from fastmcp import FastMCP, Context
+from scale_mcp_server.utils.jobs import get_job_manager
 from scale_mcp_server.api.v3.filesystems import (
     list_filesystems_api,
     get_filesystem_api,
@@ -179,12 +180,15 @@ async def mount_all_filesystems(
 ) -> Any:
     """Mount all filesystems.
 
+    Mounting can take minutes, so it runs as a background job and the tool
+    returns immediately.
+
     Args:
         mount_data: Mount configuration data
         domain: Domain to be authorized against (default 'StorageScaleDomain')
 
     Returns:
-        Dictionary containing mount status
+        Job record with the job_id to pass to get_job for status and result
     """
     await ctx.info("Tool called: mount_all_filesystems")
     await ctx.debug("Mounting all filesystems")
@@ -194,9 +198,13 @@ async def mount_all_filesystems(
         headers["X-StorageScaleDomain"] = domain
 
     try:
-        result = await mount_all_filesystems_api(domain=domain)
-        await ctx.info("All filesystems mounted successfully")
-        return result
+        job = get_job_manager().submit(
+            "mount_all_filesystems",
+            lambda: mount_all_filesystems_api(domain=domain),
+            {"domain": domain},
+        )
+        await ctx.info(f"Submitted job {job.job_id} to mount all filesystems")
+        return job.to_dict()
     except Exception as e:
         await ctx.error(f"Failed to mount all filesystems: {str(e)}")
         raise
@@ -210,12 +218,15 @@ async def unmount_all_filesystems(
 ) -> Any:
     """Unmount all filesystems.
 
+    Unmounting can take minutes, so it runs as a background job and the tool
+    returns immediately.
+
     Args:
         unmount_data: Unmount configuration data
         domain: Domain to be authorized against (default 'StorageScaleDomain')
 
     Returns:
-        Dictionary containing unmount status
+        Job record with the job_id to pass to get_job for status and result
     """
     await ctx.info("Tool called: unmount_all_filesystems")
     await ctx.debug("Unmounting all filesystems")
@@ -225,9 +236,13 @@ async def unmount_all_filesystems(
         headers["X-StorageScaleDomain"] = domain
 
     try:
-        result = await unmount_all_filesystems_api(domain=domain)
-        await ctx.info("All filesystems unmounted successfully")
-        return result
+        job = get_job_manager().submit(
+            "unmount_all_filesystems",
+            lambda: unmount_all_filesystems_api(domain=domain),
+            {"domain": domain},
+        )
+        await ctx.info(f"Submitted job {job.job_id} to unmount all filesystems")
+        return job.to_dict()
     except Exception as e:
         await ctx.error(f"Failed to unmount all filesystems: {str(e)}")
         raise
@@ -0,0 +1,226 @@
+"""IBM Storage Scale Cluster Inventory MCP Server."""
+
+import asyncio
+import time
+from typing import Optional, Any
+from fastmcp import FastMCP, Context
+from scale_mcp_server.api.v3.clusters import list_clusters_api
+from scale_mcp_server.api.v3.filesystems import list_filesystems_api
+from scale_mcp_server.api.v3.nodes import get_nodes_config_api, get_nodes_status_api
+from scale_mcp_server.api.v3.nsds import list_nsds_api
+from scale_mcp_server.api.v3.storage_pools import list_storage_pools_api
+from scale_mcp_server.api.v3.version import get_version_api
+
+# Create the inventory MCP server
+mcp = FastMCP("inventory", instructions="Cluster-wide inventory operations")
+
+
+def _items(response: Any, *keys: str) -> list:
+    """Extract the entity list from a list response."""
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        for key in keys:
+            if isinstance(response.get(key), list):
+                return response[key]
+    return []
+
+
+def _name(entry: dict, *keys: str) -> Optional[str]:
+    """Extract the entity name, looking into a nested 'config' section too."""
+    for section in (entry, entry.get("config") or {}):
+        for key in keys:
+            if section.get(key):
+                return section[key]
+    return None
+
+
+# Identifying and state keys kept per entity; the per-entity tools return
+# the full details
+_CLUSTER_KEYS = ("clusterName", "clusterId", "primaryServer", "state")
+_NODE_KEYS = (
+    "nodeNumber",
+    "adminNodeName",
+    "ipAddress",
+    "roles",
+    "designation",
+    "state",
+    "gpfsState",
+    "nodeState",
+    "healthState",
+)
+_FILESYSTEM_KEYS = ("mountPoint", "state", "status", "mountState", "health")
+_NSD_KEYS = ("availability", "status", "state")
+
+
+def _project(entry: dict, keys: tuple[str, ...]) -> dict:
+    """Keep the given keys of an entry, looking into nested sections too."""
+    sections = [entry] + [v for v in entry.values() if isinstance(v, dict)]
+    projected = {}
+    for key in keys:
+        for section in sections:
+            value = section.get(key)
+            if value is not None and value != "":
+                projected[key] = value
+                break
+    return projected
+
+
+def _names(value: Any) -> list[str]:
+    """Normalize a comma-separated string or list of names to a list."""
+    if isinstance(value, str):
+        return [name.strip() for name in value.split(",") if name.strip()]
+    if isinstance(value, list):
+        return [str(name) for name in value if name]
+    return []
+
+
+async def _timed(coro: Any) -> tuple[Any, Optional[str], float]:
+    started = time.perf_counter()
+    try:
+        result, error = await coro, None
+    except Exception as e:
+        result, error = None, str(e)
+    return result, error, round((time.perf_counter() - started) * 1000, 2)
+
+
+@mcp.tool(tags={"bulk"})
+async def get_cluster_inventory(
+    ctx: Context,
+    domain: Optional[str] = None,
+) -> Any:
+    """Get a cross-referenced inventory of the whole cluster in one call.
+
+    Gathers clusters, node config and status, filesystems, storage pools of
+    every filesystem, NSDs and version information concurrently. Each entity
+    is reduced to its identifying and state keys and keyed by name: nodes
+    list the NSDs they serve, filesystems their storage pools with the NSDs
+    of each pool, and NSDs their filesystem, pool and servers. Use the
+    per-entity tools for full details. A failing section is reported under
+    'errors' without failing the others.
+
+    Args:
+        domain: Domain to be authorized against (default 'StorageScaleDomain')
+
+    Returns:
+        Dictionary containing the compact cluster inventory
+    """
+    await ctx.info("Tool called: get_cluster_inventory")
+    started = time.perf_counter()
+
+    pool_results: dict[str, tuple[Any, Optional[str], float]] = {}
+
+    async def filesystems_and_pools() -> tuple[Any, Optional[str], float]:
+        # Pools are fetched as soon as the filesystems are known, while the
+        # other sections are still in flight
+        listed = await _timed(list_filesystems_api(domain))
+        names = [
+            name
+            for name in (
+                _name(fs, "filesystemName", "name")
+                for fs in _items(listed[0], "filesystems")
+            )
+            if name
+        ]
+        await ctx.debug(f"Fetching storage pools for {len(names)} filesystems")
+        pools = await asyncio.gather(
+            *(_timed(list_storage_pools_api(fs, domain)) for fs in names)
+        )
+        pool_results.update(zip(names, pools))
+        return listed
+
+    sections = {
+        "clusters": _timed(list_clusters_api(domain=domain)),
+        "nodes_config": _timed(get_nodes_config_api(domain)),
+        "nodes_status": _timed(get_nodes_status_api(domain)),
+        "filesystems": filesystems_and_pools(),
+        "nsds": _timed(list_nsds_api(domain)),
+        "version": _timed(get_version_api(domain)),
+    }
+    results = dict(zip(sections, await asyncio.gather(*sections.values())))
+    for fs, pools in pool_results.items():
+        results[f"storage_pools:{fs}"] = pools
+
+    errors = {key: error for key, (_, error, _) in results.items() if error}
+    timing = {f"{key}_ms": elapsed for key, (_, _, elapsed) in results.items()}
+
+    # Merge node config and status by node name
+    nodes: dict[str, dict] = {}
+    for key in ("nodes_config", "nodes_status"):
+        for entry in _items(results[key][0], "nodes", "nodesConfig", "nodesStatus"):
+            name = _name(entry, "nodeName", "adminNodeName", "name")
+            if name:
+                nodes.setdefault(name, {"nsds": []}).update(_project(entry, _NODE_KEYS))
+
+    # Cross-reference NSDs by filesystem, storage pool and serving node
+    nsds: dict[str, dict] = {}
+    pool_nsds: dict[tuple[str, str], list[str]] = {}
+    fs_nsds: dict[str, list[str]] = {}
+    for entry in _items(results["nsds"][0], "nsds"):
+        name = _name(entry, "nsdName", "name")
+        if not name:
+            continue
+        fs = _name(entry, "filesystem", "filesystemName", "fileSystem")
+        pool = _name(entry, "storagePool", "storagePoolName", "poolName")
+        servers = _names(_name(entry, "servers", "nsdServers"))
+        nsds[name] = {
+            "filesystem": fs,
+            "storagePool": pool,
+            "servers": servers,
+            **_project(entry, _NSD_KEYS),
+        }
+        if fs:
+            fs_nsds.setdefault(fs, []).append(name)
+            if pool:
+                pool_nsds.setdefault((fs, pool), []).append(name)
+        for server in servers:
+            if server in nodes:
+                nodes[server]["nsds"].append(name)
+
+    filesystems: dict[str, dict] = {}
+    for fs in _items(results["filesystems"][0], "filesystems"):
+        name = _name(fs, "filesystemName", "name")
+        if not name:
+            continue
+        pools = _items(
+            (results.get(f"storage_pools:{name}") or (None,))[0],
+            "storagePools",
+            "pools",
+        )
+        pool_names = [
+            _name(pool, "storagePoolName", "poolName", "name") for pool in pools
+        ]
+        filesystems[name] = {
+            **_project(fs, _FILESYSTEM_KEYS),
+            "storagePools": {
+                pool: pool_nsds.get((name, pool), []) for pool in pool_names if pool
+            },
+            "nsds": fs_nsds.get(name, []),
+        }
+
+    clusters = [
+        _project(cluster, _CLUSTER_KEYS)
+        for cluster in _items(results["clusters"][0], "clusters")
+    ]
+    await ctx.info(
+        f"Inventory collected: {len(nodes)} nodes, {len(filesystems)} filesystems, "
+        f"{len(nsds)} NSDs"
+    )
+    return {
+        "cluster": clusters[0] if len(clusters) == 1 else clusters,
+        "version": results["version"][0],
+        "summary": {
+            "nodes": len(nodes),
+            "filesystems": len(filesystems),
+            "nsds": len(nsds),
+            "unassignedNsds": len(nsds) - sum(len(v) for v in fs_nsds.values()),
+        },
+        "nodes": nodes,
+        "filesystems": filesystems,
+        "nsds": nsds,
+        "errors": errors,
+        "timing": {
+            **timing,
+            "total_ms": round((time.perf_counter() - started) * 1000, 2),
+        },
+    }
@@ -3,11 +3,13 @@
 from typing import Optional, Any
 from fastmcp import FastMCP, Context
 from scale_mcp_server.api.v3.nodes import (
+    batch_add_nodes_api,
     get_nodes_config_api,
     get_nodes_status_api,
     start_nodes_api,
     stop_nodes_api,
 )
+from scale_mcp_server.utils.jobs import get_job_manager
 
 # Create the nodes MCP server
 mcp = FastMCP("nodes", instructions="Node management operations")
@@ -71,20 +73,27 @@ async def start_nodes(
 ) -> Any:
     """Start specified nodes.
 
+    Starting nodes can take minutes, so it runs as a background job and the
+    tool returns immediately.
+
     Args:
         nodes_data: Data specifying which nodes to start
         domain: Domain to be authorized against (default 'StorageScaleDomain')
 
     Returns:
-        Dictionary containing operation status
+        Job record with the job_id to pass to get_job for status and result
     """
     await ctx.info("Tool called: start_nodes")
     await ctx.debug("Starting specified nodes")
 
     try:
-        result = await start_nodes_api(nodes_data, domain)
-        await ctx.info("Nodes started successfully")
-        return result
+        job = get_job_manager().submit(
+            "start_nodes",
+            lambda: start_nodes_api(nodes_data, domain),
+            {"nodes_data": nodes_data, "domain": domain},
+        )
+        await ctx.info(f"Submitted job {job.job_id} to start nodes")
+        return job.to_dict()
     except Exception as e:
         await ctx.error(f"Failed to start nodes: {str(e)}")
         raise
@@ -98,20 +107,61 @@ async def stop_nodes(
 ) -> Any:
     """Stop specified nodes.
 
+    Stopping nodes can take minutes, so it runs as a background job and the
+    tool returns immediately.
+
     Args:
         nodes_data: Data specifying which nodes to stop
         domain: Domain to be authorized against (default 'StorageScaleDomain')
 
     Returns:
-        Dictionary containing operation status
+        Job record with the job_id to pass to get_job for status and result
     """
     await ctx.info("Tool called: stop_nodes")
     await ctx.debug("Stopping specified nodes")
 
     try:
-        result = await stop_nodes_api(nodes_data, domain)
-        await ctx.info("Nodes stopped successfully")
-        return result
+        job = get_job_manager().submit(
+            "stop_nodes",
+            lambda: stop_nodes_api(nodes_data, domain),
+            {"nodes_data": nodes_data, "domain": domain},
+        )
+        await ctx.info(f"Submitted job {job.job_id} to stop nodes")
+        return job.to_dict()
     except Exception as e:
         await ctx.error(f"Failed to stop nodes: {str(e)}")
         raise
+
+
+@mcp.tool()
+async def batch_add_nodes(
+    ctx: Context,
+    nodes_data: dict,
+    domain: Optional[str] = None,
+) -> Any:
+    """Add multiple nodes to the cluster.
+
+    Adding nodes can take minutes, so it runs as a background job and the
+    tool returns immediately.
+
+    Args:
+        nodes_data: Batch node configuration data
+        domain: Domain to be authorized against (default 'StorageScaleDomain')
+
+    Returns:
+        Job record with the job_id to pass to get_job for status and result
+    """
+    await ctx.info("Tool called: batch_add_nodes")
+    await ctx.debug("Adding nodes to the cluster")
+
+    try:
+        job = get_job_manager().submit(
+            "batch_add_nodes",
+            lambda: batch_add_nodes_api(nodes_data, domain),
+            {"nodes_data": nodes_data, "domain": domain},
+        )
+        await ctx.info(f"Submitted job {job.job_id} to add nodes")
+        return job.to_dict()
+    except Exception as e:
+        await ctx.error(f"Failed to batch add nodes: {str(e)}")
+        raise
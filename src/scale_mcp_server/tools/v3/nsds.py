@@ -3,9 +3,12 @@
 from typing import Optional, Any
 from fastmcp import FastMCP, Context
 from scale_mcp_server.api.v3.nsds import (
+    batch_create_nsds_api,
     list_nsds_api,
     get_nsd_api,
 )
+from scale_mcp_server.utils.jobs import get_job_manager
+from scale_mcp_server.utils.serialization import raw_result
 
 # Create the nsds MCP server
 mcp = FastMCP("nsds", instructions="NSD (Network Shared Disk) management operations")
@@ -28,9 +31,9 @@ async def list_nsds(
     await ctx.debug("Listing all NSDs (Network Shared Disks)")
 
     try:
-        result = await list_nsds_api(domain=domain)
+        result = await list_nsds_api(domain=domain, raw=True)
         await ctx.info("Successfully retrieved NSDs list")
-        return result
+        return raw_result(result)
     except Exception as e:
         await ctx.error(f"Failed to list NSDs: {str(e)}")
         raise
@@ -61,3 +64,37 @@ async def get_nsd(
     except Exception as e:
         await ctx.error(f"Failed to get NSD {nsd_name}: {str(e)}")
         raise
+
+
+@mcp.tool()
+async def batch_create_nsds(
+    ctx: Context,
+    nsds_data: dict,
+    domain: Optional[str] = None,
+) -> Any:
+    """Create multiple NSDs.
+
+    Creating NSDs can take minutes, so it runs as a background job and the
+    tool returns immediately.
+
+    Args:
+        nsds_data: Batch NSD creation data
+        domain: Domain to be authorized against (default 'StorageScaleDomain')
+
+    Returns:
+        Job record with the job_id to pass to get_job for status and result
+    """
+    await ctx.info("Tool called: batch_create_nsds")
+    await ctx.debug("Creating NSDs")
+
+    try:
+        job = get_job_manager().submit(
+            "batch_create_nsds",
+            lambda: batch_create_nsds_api(nsds_data, domain),
+            {"nsds_data": nsds_data, "domain": domain},
+        )
+        await ctx.info(f"Submitted job {job.job_id} to create NSDs")
+        return job.to_dict()
+    except Exception as e:
+        await ctx.error(f"Failed to batch create NSDs: {str(e)}")
+        raise
@@ -1,11 +1,13 @@
 """IBM Storage Scale Quota Management MCP Server."""
 
-from typing import Optional, Any
+from typing import Literal, Optional, Any
 from fastmcp import FastMCP, Context
 from scale_mcp_server.api.v3.quotas import (
     list_quotas_api,
     set_quota_api,
 )
+from scale_mcp_server.utils.listing import QUOTAS, get_lister, records
+from scale_mcp_server.utils.serialization import raw_result
 
 # Create the quotas MCP server
 mcp = FastMCP("quotas", instructions="Quota management operations")
@@ -30,14 +32,56 @@ async def list_quotas(
     await ctx.debug(f"Listing all quotas for filesystem: {filesystem}")
 
     try:
-        result = await list_quotas_api(filesystem=filesystem, domain=domain)
+        result = await list_quotas_api(filesystem=filesystem, domain=domain, raw=True)
         await ctx.info(f"Successfully retrieved quotas for {filesystem}")
-        return result
+        return raw_result(result)
     except Exception as e:
         await ctx.error(f"Failed to list quotas for {filesystem}: {str(e)}")
         raise
 
 
+@mcp.tool(tags={"bulk"})
+async def list_quota_records(
+    ctx: Context,
+    filesystem: str,
+    domain: Optional[str] = None,
+    backend: Optional[Literal["auto", "rest", "cli"]] = None,
+) -> Any:
+    """List the quotas of a filesystem as normalized records.
+
+    The quotas are listed through the REST API or with mmrepquota -Y over SSH,
+    whichever is predicted to be faster from the durations and sizes of
+    earlier listings; large filesystems usually take the CLI. The records
+    are the same for both backends, with the block counts in bytes.
+
+    Args:
+        filesystem: Filesystem name
+        domain: Domain to be authorized against (default 'StorageScaleDomain');
+            listings with a domain always use the REST API
+        backend: 'auto', 'rest' or 'cli' (default: [scale_api] listing_backend)
+
+    Returns:
+        Dictionary with the records, their number, the backend that served
+        them and the elapsed time
+    """
+    await ctx.info(f"Tool called: list_quota_records with filesystem={filesystem}")
+
+    try:
+        items, used, elapsed = await get_lister().list(
+            QUOTAS, filesystem, domain=domain, backend=backend
+        )
+        await ctx.info(f"Listed {len(items)} quotas of {filesystem} with {used}")
+        return {
+            "quotas": records(items),
+            "count": len(items),
+            "backend": used,
+            "elapsed_ms": round(elapsed * 1000, 2),
+        }
+    except Exception as e:
+        await ctx.error(f"Failed to list quotas of {filesystem}: {str(e)}")
+        raise
+
+
 @mcp.tool()
 async def set_quota(
     ctx: Context,
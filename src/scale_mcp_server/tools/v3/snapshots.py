@@ -1,12 +1,16 @@
 """IBM Storage Scale Snapshot Management MCP Server."""
 
-from typing import Optional, Any
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Optional
 from fastmcp import FastMCP, Context
 from scale_mcp_server.api.v3.snapshots import (
     list_snapshots_api,
     create_snapshot_api,
     get_snapshot_api,
     delete_snapshot_api,
+    batch_delete_snapshots_api,
     get_snapdir_settings_api,
 )
 from scale_mcp_server.api.v3.filesets import (
@@ -14,7 +18,18 @@ from scale_mcp_server.api.v3.filesets import (
     create_fileset_snapshot_api,
     get_fileset_snapshot_api,
     delete_fileset_snapshot_api,
+    batch_create_fileset_snapshots_api,
+    batch_delete_fileset_snapshots_api,
 )
+from scale_mcp_server.utils.helpers import chunked, percentile
+from scale_mcp_server.utils.listing import FILESETS, get_lister
+from scale_mcp_server.utils.models import decode_list
+from scale_mcp_server.utils.retention import (
+    RetentionPolicy,
+    parse_snapshot,
+    plan_retention,
+)
+from scale_mcp_server.utils.serialization import loads, raw_result
 
 # Create the snapshots MCP server
 mcp = FastMCP("snapshots", instructions="Snapshot management operations")
@@ -41,9 +56,11 @@ async def list_filesystem_snapshots(
     await ctx.debug(f"Listing all snapshots for filesystem: {filesystem}")
 
     try:
-        result = await list_snapshots_api(filesystem=filesystem, domain=domain)
+        result = await list_snapshots_api(
+            filesystem=filesystem, domain=domain, raw=True
+        )
         await ctx.info(f"Successfully retrieved snapshots for {filesystem}")
-        return result
+        return raw_result(result)
     except Exception as e:
         await ctx.error(f"Failed to list snapshots for {filesystem}: {str(e)}")
         raise
@@ -172,10 +189,10 @@ async def list_fileset_snapshots(
 
     try:
         result = await list_fileset_snapshots_api(
-            filesystem=filesystem, fileset=fileset, domain=domain
+            filesystem=filesystem, fileset=fileset, domain=domain, raw=True
         )
         await ctx.info(f"Successfully retrieved snapshots for fileset {fileset}")
-        return result
+        return raw_result(result)
     except Exception as e:
         await ctx.error(f"Failed to list snapshots for fileset {fileset}: {str(e)}")
         raise
@@ -328,3 +345,334 @@ async def get_snapdir_settings(
     except Exception as e:
         await ctx.error(f"Failed to get snapdir settings for {filesystem}: {str(e)}")
         raise
+
+
+async def _snapshot_pages(
+    filesystem: str, domain: Optional[str]
+) -> AsyncIterator[dict]:
+    """Yield every page of the snapshot listing of a filesystem."""
+    page_token = None
+    while True:
+        body = loads(
+            await list_snapshots_api(
+                filesystem=filesystem,
+                domain=domain,
+                raw=True,
+                page_token=page_token,
+            )
+        )
+        yield body
+        page_token = body.get("next_page_token")
+        if not page_token:
+            return
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+@mcp.tool(tags={"bulk"})
+async def prune_snapshots(
+    ctx: Context,
+    filesystem: str,
+    keep_last: int = 0,
+    keep_hourly: int = 0,
+    keep_daily: int = 0,
+    keep_weekly: int = 0,
+    dry_run: bool = True,
+    chunk_size: int = 100,
+    domain: Optional[str] = None,
+) -> Any:
+    """Apply a grandfather-father-son retention policy to snapshots.
+
+    Evaluates the policy over all filesystem and fileset snapshots of the
+    filesystem in one pass. Each fileset is evaluated independently of the
+    filesystem-level snapshots. Snapshots without a known creation time are
+    always kept. Deletions are issued through the batch delete endpoints in
+    chunks of chunk_size.
+
+    Args:
+        filesystem: Filesystem name
+        keep_last: Number of most recent snapshots to keep per scope
+        keep_hourly: Number of hours to keep the newest snapshot of
+        keep_daily: Number of days to keep the newest snapshot of
+        keep_weekly: Number of ISO weeks to keep the newest snapshot of
+        dry_run: Only compute the delete set without deleting (default True)
+        chunk_size: Maximum number of snapshots per batch delete request
+        domain: Domain to be authorized against (default 'StorageScaleDomain')
+
+    Returns:
+        Dictionary containing the delete set, batch results and timing stats
+    """
+    await ctx.info(
+        f"Tool called: prune_snapshots with filesystem={filesystem}, dry_run={dry_run}"
+    )
+
+    policy = RetentionPolicy(
+        keep_last=keep_last,
+        keep_hourly=keep_hourly,
+        keep_daily=keep_daily,
+        keep_weekly=keep_weekly,
+    )
+    if policy.is_empty:
+        raise ValueError(
+            "Retention policy keeps no snapshots; set at least one keep_* value"
+        )
+
+    try:
+        started = time.perf_counter()
+        # The plan needs every snapshot, so all pages are collected first
+        snapshots = []
+        async for body in _snapshot_pages(filesystem, domain):
+            snapshots.extend(decode_list(body, "snapshots", parse_snapshot))
+        list_ms = _elapsed_ms(started)
+
+        planned = time.perf_counter()
+        plan = plan_retention(snapshots, policy)
+        plan_ms = _elapsed_ms(planned)
+        await ctx.debug(
+            f"Retention plan for {filesystem}: keep {len(plan.keep)}, delete {len(plan.delete)}"
+        )
+
+        batches = []
+        deleting = time.perf_counter()
+        if not dry_run:
+            filesystem_names = [s.name for s in plan.delete if s.fileset is None]
+            fileset_snapshots = [s for s in plan.delete if s.fileset is not None]
+
+            for chunk in chunked(filesystem_names, chunk_size):
+                result = await batch_delete_snapshots_api(
+                    filesystem=filesystem,
+                    snapshot_data={"snapshots": [{"snapshotName": n} for n in chunk]},
+                    domain=domain,
+                )
+                batches.append(
+                    {"scope": "filesystem", "count": len(chunk), "result": result}
+                )
+
+            for chunk in chunked(fileset_snapshots, chunk_size):
+                result = await batch_delete_fileset_snapshots_api(
+                    filesystem=filesystem,
+                    snapshot_data={
+                        "snapshots": [
+                            {"filesetName": s.fileset, "snapshotName": s.name}
+                            for s in chunk
+                        ]
+                    },
+                    domain=domain,
+                )
+                batches.append(
+                    {"scope": "fileset", "count": len(chunk), "result": result}
+                )
+        delete_ms = _elapsed_ms(deleting)
+
+        await ctx.info(
+            f"{'Planned' if dry_run else 'Deleted'} {len(plan.delete)} snapshots "
+            f"for {filesystem} in {len(batches)} batch requests"
+        )
+        return {
+            "filesystem": filesystem,
+            "dry_run": dry_run,
+            "summary": {
+                "evaluated": len(snapshots),
+                "keep": len(plan.keep),
+                "delete": len(plan.delete),
+                "batches": len(batches),
+            },
+            "delete": [
+                {
+                    "snapshotName": s.name,
+                    "filesetName": s.fileset,
+                    "created": s.created.isoformat() if s.created else None,
+                }
+                for s in plan.delete
+            ],
+            "keep": [
+                {"snapshotName": name, "filesetName": fileset, "reasons": reasons}
+                for (fileset, name), reasons in plan.keep.items()
+            ],
+            "batches": batches,
+            "timing": {
+                "list_ms": list_ms,
+                "plan_ms": plan_ms,
+                "delete_ms": delete_ms,
+                "total_ms": _elapsed_ms(started),
+            },
+        }
+    except Exception as e:
+        await ctx.error(f"Failed to prune snapshots for {filesystem}: {str(e)}")
+        raise
+
+
+@mcp.tool(tags={"bulk"})
+async def snapshot_independent_filesets(
+    ctx: Context,
+    filesystem: str,
+    snapshot_prefix: str = "backup",
+    group_size: int = 50,
+    max_concurrency: int = 4,
+    poll_interval: float = 2.0,
+    poll_timeout: float = 300.0,
+    domain: Optional[str] = None,
+) -> Any:
+    """Snapshot all independent filesets of a filesystem with one consistent name.
+
+    Discovers the filesets that own their inode space, groups them into
+    batchCreate requests of group_size filesets, submits up to max_concurrency
+    groups at a time and polls the snapshot listing until every snapshot
+    appears or poll_timeout expires. All snapshots share the name
+    '<snapshot_prefix>-<UTC timestamp>'. Failed polls are retried until
+    poll_timeout; snapshots not seen by then are reported as pending.
+
+    Args:
+        filesystem: Filesystem name
+        snapshot_prefix: Prefix for the snapshot name (default 'backup')
+        group_size: Maximum number of filesets per batchCreate request
+        max_concurrency: Maximum number of batchCreate requests in flight
+        poll_interval: Seconds between completion polls
+        poll_timeout: Seconds to wait for all snapshots to appear
+        domain: Domain to be authorized against (default 'StorageScaleDomain')
+
+    Returns:
+        Dictionary containing per-group and per-fileset status, latency and
+        timing stats
+    """
+    await ctx.info(
+        f"Tool called: snapshot_independent_filesets with filesystem={filesystem}"
+    )
+
+    started = time.perf_counter()
+    snapshot_name = (
+        f"{snapshot_prefix}-{datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')}"
+    )
+
+    try:
+        # Served by the REST API or mmlsfileset, whichever is faster
+        listing, _, _ = await get_lister().list(FILESETS, filesystem, domain=domain)
+        # The root fileset is excluded since its snapshots are filesystem snapshots
+        filesets = [
+            fileset.name
+            for fileset in listing
+            if fileset.independent and fileset.name != "root"
+        ]
+        discover_ms = _elapsed_ms(started)
+        await ctx.info(
+            f"Snapshotting {len(filesets)} independent filesets in {filesystem} "
+            f"as '{snapshot_name}'"
+        )
+
+        groups = chunked(filesets, group_size) if filesets else []
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        submitted_at: dict[str, float] = {}
+        group_reports: list[dict] = []
+
+        async def submit(index: int, group: list[str]) -> None:
+            async with semaphore:
+                submitted = time.perf_counter()
+                for name in group:
+                    submitted_at[name] = submitted
+                report: dict[str, Any] = {"group": index, "filesets": len(group)}
+                try:
+                    report["result"] = await batch_create_fileset_snapshots_api(
+                        filesystem=filesystem,
+                        snapshot_data={
+                            "snapshots": [
+                                {"filesetName": name, "snapshotName": snapshot_name}
+                                for name in group
+                            ]
+                        },
+                        domain=domain,
+                    )
+                    report["status"] = "submitted"
+                except Exception as e:
+                    report["status"] = "failed"
+                    report["error"] = str(e)
+                    for name in group:
+                        submitted_at.pop(name, None)
+                report["submit_ms"] = _elapsed_ms(submitted)
+                group_reports.append(report)
+
+        submitting = time.perf_counter()
+        await asyncio.gather(*(submit(i, g) for i, g in enumerate(groups)))
+        submit_ms = _elapsed_ms(submitting)
+
+        # Poll the snapshot listing until every submitted snapshot shows up.
+        # The snapshots exist by now, so a failed poll is counted and retried
+        # instead of discarding the report.
+        completed_at: dict[str, float] = {}
+        poll_errors: list[str] = []
+        polling = time.perf_counter()
+        deadline = polling + poll_timeout
+        while len(completed_at) < len(submitted_at) and time.perf_counter() < deadline:
+            try:
+                async for body in _snapshot_pages(filesystem, domain):
+                    observed = time.perf_counter()
+                    for ref in decode_list(body, "snapshots", parse_snapshot):
+                        if (
+                            ref.name == snapshot_name
+                            and ref.fileset in submitted_at
+                            and ref.fileset not in completed_at
+                        ):
+                            completed_at[ref.fileset] = observed
+                    if len(completed_at) == len(submitted_at):
+                        break
+            except Exception as e:
+                poll_errors.append(str(e))
+                await ctx.warning(f"Polling snapshots of {filesystem} failed: {str(e)}")
+            if len(completed_at) < len(submitted_at):
+                await ctx.report_progress(len(completed_at), len(submitted_at))
+                await asyncio.sleep(
+                    max(0.0, min(poll_interval, deadline - time.perf_counter()))
+                )
+        poll_ms = _elapsed_ms(polling)
+
+        details = []
+        latencies = []
+        for name in filesets:
+            if name in completed_at:
+                latency = round((completed_at[name] - submitted_at[name]) * 1000, 2)
+                latencies.append(latency)
+                details.append(
+                    {"filesetName": name, "status": "created", "latency_ms": latency}
+                )
+            elif name in submitted_at:
+                details.append({"filesetName": name, "status": "pending"})
+            else:
+                details.append({"filesetName": name, "status": "failed"})
+
+        await ctx.info(
+            f"Created {len(completed_at)} of {len(filesets)} fileset snapshots "
+            f"'{snapshot_name}' in {filesystem}"
+        )
+        return {
+            "filesystem": filesystem,
+            "snapshotName": snapshot_name,
+            "summary": {
+                "filesets": len(filesets),
+                "created": len(completed_at),
+                "pending": len(submitted_at) - len(completed_at),
+                "failed": len(filesets) - len(submitted_at),
+                "groups": len(groups),
+                "poll_errors": len(poll_errors),
+            },
+            "latency_ms": {
+                "p50": percentile(latencies, 50),
+                "p95": percentile(latencies, 95),
+                "max": max(latencies, default=0.0),
+            },
+            "groups": sorted(group_reports, key=lambda r: r["group"]),
+            "filesets": details,
+            # The last few poll errors, enough to tell what went wrong
+            "poll_errors": poll_errors[-5:],
+            "timing": {
+                "discover_ms": discover_ms,
+                "submit_ms": submit_ms,
+                "poll_ms": poll_ms,
+                "total_ms": _elapsed_ms(started),
+            },
+        }
+    except Exception as e:
+        await ctx.error(
+            f"Failed to snapshot independent filesets in {filesystem}: {str(e)}"
+        )
+        raise
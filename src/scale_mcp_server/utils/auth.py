@@ -0,0 +1,144 @@
+"""Bearer token authentication for the management API.
+
+With HTTP basic authentication, every request makes the management node
+check the credentials, which is expensive with PAM or LDAP backends. With
+auth = token in the [authorization] section, TokenAuth exchanges the
+credentials for a bearer token once and sends the token instead:
+
+- Tokens are cached per management node, user and X-StorageScaleDomain, and
+  shared by all clients of the process.
+- A token is refreshed token_refresh seconds before it expires, or halfway
+  through its lifetime if that is shorter.
+- A 401 response to a token invalidates it; the request is sent again once
+  with a new token.
+- If the node does not offer the token endpoint, requests fall back to basic
+  authentication and the endpoint is tried again after token_ttl seconds.
+
+The token endpoint is token_path on the node (default
+/scalemgmt/v3/auth/token), requested with POST and basic authentication. It
+answers with a JSON object holding the token under 'token' or
+'access_token' and its lifetime in seconds under 'expires_in'. Any other
+answer, including a body that is not JSON, counts as no token.
+"""
+
+import asyncio
+import base64
+import logging
+import time
+from typing import AsyncGenerator, Optional
+
+import httpx
+
+from scale_mcp_server.utils.serialization import loads
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_PATH = "/scalemgmt/v3/auth/token"
+
+# (origin, user, domain) -> (token or None if unsupported, monotonic time at
+# which it is replaced)
+_tokens: dict[tuple[str, str, Optional[str]], tuple[Optional[str], float]] = {}
+
+
+def clear_tokens() -> None:
+    """Forget all cached tokens."""
+    _tokens.clear()
+
+
+class TokenAuth(httpx.Auth):
+    """Authenticate with cached bearer tokens, falling back to basic auth."""
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        token_path: str = DEFAULT_TOKEN_PATH,
+        refresh: float = 60.0,
+        default_ttl: float = 300.0,
+    ):
+        """Initialize the token authentication.
+
+        Args:
+            username: API user
+            password: API password
+            token_path: Path of the token endpoint on the management node
+            refresh: Seconds before expiry at which a token is replaced
+            default_ttl: Token lifetime if the endpoint does not report one,
+                and time until an unsupported endpoint is tried again
+        """
+        self.username = username
+        self.token_path = token_path
+        self.refresh = refresh
+        self.default_ttl = default_ttl
+        credentials = f"{username}:{password}".encode()
+        self._basic = f"Basic {base64.b64encode(credentials).decode()}"
+        self._locks: dict[tuple, asyncio.Lock] = {}
+
+    def _key(self, request: httpx.Request) -> tuple[str, str, Optional[str]]:
+        origin = f"{request.url.scheme}://{request.url.netloc.decode()}"
+        return origin, self.username, request.headers.get("X-StorageScaleDomain")
+
+    def _cached(self, key: tuple) -> tuple[Optional[str], bool]:
+        """Get the cached token and whether the cache entry is still valid."""
+        token, replace_at = _tokens.get(key, (None, 0.0))
+        return token, time.monotonic() < replace_at
+
+    def _token_request(self, request: httpx.Request) -> httpx.Request:
+        headers = {"Authorization": self._basic}
+        domain = request.headers.get("X-StorageScaleDomain")
+        if domain:
+            headers["X-StorageScaleDomain"] = domain
+        url = request.url.copy_with(path=self.token_path, query=None)
+        return httpx.Request("POST", url, headers=headers)
+
+    async def _store(self, key: tuple, response: httpx.Response) -> Optional[str]:
+        """Cache the token of a token endpoint response."""
+        token = None
+        ttl = self.default_ttl
+        if response.status_code == 200:
+            try:
+                body = loads(await response.aread())
+                token = body.get("token") or body.get("access_token") or None
+                ttl = float(body.get("expires_in") or self.default_ttl)
+            except Exception as e:
+                logger.debug(f"Undecodable token response from {key[0]}: {e}")
+                token, ttl = None, self.default_ttl
+        if token is None:
+            logger.info(
+                f"No token from {key[0]} (HTTP {response.status_code}), "
+                f"using basic authentication for {ttl:.0f}s"
+            )
+            _tokens[key] = (None, time.monotonic() + ttl)
+            return None
+        # Short-lived tokens are replaced halfway through their lifetime, so a
+        # refresh margin longer than the lifetime cannot leave none valid
+        margin = min(self.refresh, ttl / 2)
+        _tokens[key] = (token, time.monotonic() + ttl - margin)
+        return token
+
+    async def async_auth_flow(
+        self, request: httpx.Request
+    ) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        key = self._key(request)
+        token, valid = self._cached(key)
+        stale = None
+        for attempt in range(2):
+            if not valid:
+                # One token request per key at a time; waiters reuse its result
+                lock = self._locks.setdefault(key, asyncio.Lock())
+                async with lock:
+                    token, valid = self._cached(key)
+                    if not valid or (stale is not None and token == stale):
+                        response = yield self._token_request(request)
+                        token = await self._store(key, response)
+
+            request.headers["Authorization"] = (
+                f"Bearer {token}" if token else self._basic
+            )
+            response = yield request
+            if response.status_code != 401 or token is None or attempt:
+                return
+            # Revoked or expired early: replace the token and retry once
+            stale, valid = token, False
+            if _tokens.get(key, (None,))[0] == token:
+                del _tokens[key]
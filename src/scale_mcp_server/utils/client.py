@@ -1,10 +1,81 @@
+import asyncio
+import logging
+import time
+import weakref
 import httpx
-from typing import Optional, Dict, Any
-from pathlib import Path
-from fastmcp.utilities.logging import get_logger
-from scale_mcp_server.utils.read_config import read_config
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, NamedTuple, Optional
+from scale_mcp_server.utils.auth import DEFAULT_TOKEN_PATH, TokenAuth
+from scale_mcp_server.utils.clusters import cluster_config
+from scale_mcp_server.utils.endpoints import get_router
+from scale_mcp_server.utils.limiter import AdaptiveLimiter, get_limiter
+from scale_mcp_server.utils.log_format import endpoint_template, request_tool
+from scale_mcp_server.utils.read_config import read_config, scale_config_path
+from scale_mcp_server.utils.scheduler import (
+    RequestScheduler,
+    get_scheduler,
+    parse_weights,
+    request_session,
+)
+from scale_mcp_server.utils.serialization import loads
+from scale_mcp_server.utils.timeouts import (
+    LONG_RUNNING,
+    READ,
+    DeadlineExceeded,
+    deadline_scope,
+    effective_timeout,
+    endpoint_class,
+    load_profiles,
+    shortened,
+)
+from scale_mcp_server.utils.tls import ssl_context
 
-logger = get_logger(__name__)
+logger = logging.getLogger(__name__)
+# One INFO record with the structured timing fields per request
+request_logger = logging.getLogger("scale_mcp_server.requests")
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# httpx clients shared by all StorageScaleClient instances with the same
+# connection settings, one set per event loop. Sharing them lets concurrent
+# requests reuse pooled connections, or multiplex over HTTP/2 when enabled.
+_shared_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _is_true(value: Any) -> bool:
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+
+def _shared_session(
+    key: tuple, create: Callable[[], httpx.AsyncClient]
+) -> Optional[httpx.AsyncClient]:
+    """Get or create the shared httpx client for a settings key.
+
+    Returns:
+        Shared client, or None if no event loop is running
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    clients = _shared_clients.setdefault(loop, {})
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = clients[key] = create()
+        logger.debug(f"Created shared client for {client.base_url}")
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close the shared httpx clients of the running event loop."""
+    clients = _shared_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
 
 
 class StorageScaleAPIError(Exception):
@@ -13,6 +84,15 @@ class StorageScaleAPIError(Exception):
     pass
 
 
+class _Upstream(NamedTuple):
+    """Connection pool, scheduler and limiter of one management node."""
+
+    session: httpx.AsyncClient
+    owned: bool
+    scheduler: Optional[RequestScheduler]
+    limiter: Optional[AdaptiveLimiter]
+
+
 class StorageScaleClient:
     """IBM Storage Scale REST API Client."""
 
@@ -24,149 +104,336 @@ class StorageScaleClient:
         verify_ssl: Optional[bool] = None,
         timeout: Optional[float] = None,
         api_version: Optional[str] = None,
+        http2: Optional[bool] = None,
+        shared: bool = True,
+        long_running: bool = False,
+        cluster: Optional[str] = None,
     ):
-        config_path = (
-            Path(__file__).parent.parent.parent.parent / "config" / "scale_config.ini"
-        )
-        config = read_config(config_path=config_path)
+        """Initialize the client from scale_config.ini and explicit overrides.
+
+        Args:
+            base_url: REST API base URL (default: one per host of the
+                comma-separated [scale_api] hostname list)
+            username: API user
+            password: API password
+            verify_ssl: Verify the server certificate
+            timeout: Request timeout in seconds for all phases of all requests
+                (default: the [timeouts] profile of each request)
+            api_version: 'v2' to use the v2 port, otherwise the v3 port
+            http2: Negotiate HTTP/2 (default: [scale_api] http2)
+            shared: Use the connection pool shared with other clients of the
+                same settings instead of a private one (default True)
+            long_running: Requests may take minutes, e.g. mounting all
+                filesystems. They use the long_running timeout profile and
+                bypass request scheduling and the adaptive limit.
+            cluster: Cluster profile (default: the cluster of the current
+                request, see utils/clusters.py)
+
+        Raises:
+            UnknownClusterError: If the cluster profile is not configured
+        """
+        config = cluster_config(read_config(config_path=scale_config_path()), cluster)
 
         api_config = config.get("scale_api", {})
-        hostname = api_config.get("hostname", "localhost")
+        hostnames = [
+            host.strip()
+            for host in api_config.get("hostname", "localhost").split(",")
+            if host.strip()
+        ]
         if api_version == "v2":
             port = api_config.get("v2_port", 443)
+            probe_path = "/scalemgmt/v2/info"
         else:
             port = api_config.get("v3_port", 46443)
-        config_base_url = f"https://{hostname}:{port}"
+            probe_path = "/scalemgmt/v3/version"
 
         auth_config = config.get("authorization", "")
         config_username = auth_config.get("username", "")
         config_password = auth_config.get("password", "")
 
         # Override if provided via api
-        self.base_url = (base_url or config_base_url).rstrip("/")
+        base_urls = (
+            [base_url.rstrip("/")]
+            if base_url
+            else [f"https://{host}:{port}" for host in hostnames or ["localhost"]]
+        )
+        self.base_url = base_urls[0]
         self.username = username or config_username or "admin"
         self.password = password or config_password or ""
         verify = (
             verify_ssl
             if verify_ssl is not None
-            else not auth_config.get("allow_insecure", False)
+            else not _is_true(auth_config.get("allow_insecure", False))
         )
-        timeout_val = timeout or float(api_config.get("timeout", 5.0))
+        self.long_running = long_running
+        self.timeouts = load_profiles(config)
+        if timeout:
+            self.timeouts = dict.fromkeys(self.timeouts, httpx.Timeout(timeout))
+        self.http2 = http2 if http2 is not None else _is_true(api_config.get("http2"))
+        if self.http2 and not HTTP2_AVAILABLE:
+            logger.warning(
+                "HTTP/2 is enabled but the h2 package is not installed, using HTTP/1.1"
+            )
+            self.http2 = False
+        # One TLS context per verification setting for the whole process
+        tls = ssl_context(verify, auth_config.get("ca_bundle"), self.http2)
+
+        # Exchange the credentials for cached bearer tokens where offered
+        auth_mode = auth_config.get("auth", "basic").strip().lower()
+
+        def authentication() -> httpx.Auth | tuple[str, str]:
+            if auth_mode != "token":
+                return (self.username, self.password)
+            return TokenAuth(
+                self.username,
+                self.password,
+                token_path=auth_config.get("token_path", DEFAULT_TOKEN_PATH),
+                refresh=float(auth_config.get("token_refresh", 60)),
+                default_ttl=float(auth_config.get("token_ttl", 300)),
+            )
+
+        # Requests to the same endpoint share in-flight slots, handed out by
+        # priority class and session; max_concurrency = 0 disables this
+        capacity = 0 if long_running else int(api_config.get("max_concurrency", 16))
 
-        self.session = httpx.AsyncClient(
-            base_url=self.base_url,
-            auth=(self.username, self.password),
-            timeout=httpx.Timeout(timeout=timeout_val),
-            verify=verify,
+        def connect(url: str) -> _Upstream:
+            def create() -> httpx.AsyncClient:
+                return httpx.AsyncClient(
+                    base_url=url,
+                    auth=authentication(),
+                    timeout=self.timeouts[READ],
+                    verify=tls,
+                    http2=self.http2,
+                )
+
+            key = (url, self.username, self.password, tls, self.http2, auth_mode)
+            session = _shared_session(key, create) if shared else None
+            owned = session is None
+            if session is None:
+                session = create()
+
+            scheduler = (
+                get_scheduler(
+                    url, capacity, parse_weights(api_config.get("priority_weights"))
+                )
+                if capacity > 0
+                else None
+            )
+            # With adaptive_concurrency, max_concurrency is the upper bound of
+            # a limit tuned by latency and 429/503 responses
+            limiter = (
+                get_limiter(
+                    url,
+                    scheduler,
+                    min_limit=int(api_config.get("min_concurrency", 2)),
+                    max_limit=capacity,
+                )
+                if scheduler is not None
+                and _is_true(api_config.get("adaptive_concurrency", True))
+                else None
+            )
+            return _Upstream(session, owned, scheduler, limiter)
+
+        # Every management node has its own pool, scheduler and limit; the
+        # router picks the node of each request
+        self.upstreams = {url: connect(url) for url in base_urls}
+        self.router = get_router(
+            base_urls,
+            probe_path=probe_path,
+            probe_interval=float(api_config.get("probe_interval", 10)),
+            sticky_ttl=float(api_config.get("sticky_ttl", 30)),
+            verify=ssl_context(verify, auth_config.get("ca_bundle")),
         )
 
         logger.debug(f"Initialized StorageScaleClient for {self.base_url}")
 
-    async def get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """Execute GET request."""
+    async def _request(
+        self, method: str, endpoint: str, raw: bool = False, **kwargs
+    ) -> Any:
+        """Execute a request and decode the JSON response body.
+
+        Args:
+            method: HTTP method
+            endpoint: Endpoint path relative to the base URL
+            raw: Return the undecoded response body as bytes
+            **kwargs: Additional arguments passed to httpx
+
+        Returns:
+            Decoded response, or the raw body if raw is set
+        """
+        started = time.perf_counter()
+        response = None
         try:
-            logger.debug(f"GET {endpoint}")
-            response = await self.session.get(endpoint, **kwargs)
+            try:
+                if "timeout" not in kwargs:
+                    profile = (
+                        LONG_RUNNING
+                        if self.long_running
+                        else endpoint_class(method, endpoint)
+                    )
+                    kwargs["timeout"] = effective_timeout(self.timeouts[profile])
+                # Per-request lines are formatted lazily, and only if kept
+                logger.debug("%s %s", method, endpoint)
+                if method == "POST" and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("POST payload: %s", kwargs.get("json", {}))
+                response = await self._send(method, endpoint, **kwargs)
+            finally:
+                self._log_request(method, endpoint, started, response)
             response.raise_for_status()
-            logger.debug(f"GET {endpoint} - Status: {response.status_code}")
-            return response.json()
+            if raw:
+                return response.content
+            return loads(response.content)
         except httpx.HTTPStatusError as e:
-            logger.error(f"GET {endpoint} failed: {e}")
+            logger.error(f"{method} {endpoint} failed: {e}")
             try:
                 error_body = e.response.text
                 logger.error(f"Response body: {error_body}")
             except Exception:
                 pass
             raise StorageScaleAPIError(f"API request failed: {e}")
-        except httpx.HTTPError as e:
-            logger.error(f"GET {endpoint} failed: {e}")
+        except (httpx.HTTPError, DeadlineExceeded) as e:
+            logger.error(f"{method} {endpoint} failed: {e}")
             raise StorageScaleAPIError(f"API request failed: {e}")
 
+    @staticmethod
+    def _log_request(
+        method: str,
+        endpoint: str,
+        started: float,
+        response: Optional[httpx.Response],
+    ) -> None:
+        """Log the timing record of a finished or failed request."""
+        if not request_logger.isEnabledFor(logging.INFO):
+            return
+        fields = StorageScaleClient._log_fields(method, endpoint, started, response)
+        if response is None:
+            request_logger.info(
+                "%s %s - Failed (%.1f ms)",
+                method,
+                endpoint,
+                fields["duration_ms"],
+                extra=fields,
+            )
+            return
+        request_logger.info(
+            "%s %s - Status: %s (%.1f ms, %d bytes)",
+            method,
+            endpoint,
+            fields["status"],
+            fields["duration_ms"],
+            fields["bytes"],
+            extra=fields,
+        )
+
+    @staticmethod
+    def _log_fields(
+        method: str,
+        endpoint: str,
+        started: float,
+        response: Optional[httpx.Response],
+    ) -> Dict[str, Any]:
+        """Build the structured log fields of a finished request."""
+        return {
+            "tool": request_tool.get(),
+            "method": method,
+            "endpoint": endpoint_template(endpoint),
+            "status": response.status_code if response is not None else None,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            "bytes": len(response.content) if response is not None else None,
+        }
+
+    async def _send(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Send a request within the deadline of the tool call.
+
+        If the connection to the chosen management node fails, the request is
+        retried on the next one until all nodes have been tried.
+        """
+        session = request_session.get()
+        tried: set[str] = set()
+        async with deadline_scope():
+            while True:
+                url = self.router.select(session, frozenset(tried))
+                try:
+                    return await self._send_to(url, method, endpoint, **kwargs)
+                except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                    tried.add(url)
+                    if len(tried) >= len(self.upstreams):
+                        raise
+                    self.router.failovers += 1
+                    logger.debug(f"{method} {endpoint} failed on {url}: {e}")
+
+    async def _send_to(
+        self, url: str, method: str, endpoint: str, **kwargs
+    ) -> httpx.Response:
+        """Send a request to a management node, in a scheduler slot if enabled.
+
+        The outcome is fed to the router and the adaptive limiter.
+        """
+        upstream = self.upstreams[url]
+        async with upstream.scheduler.slot() if upstream.scheduler else nullcontext():
+            started = time.perf_counter()
+            self.router.begin(url)
+            try:
+                response = await upstream.session.request(method, endpoint, **kwargs)
+            except httpx.TransportError as e:
+                # Timeouts shortened by the tool call are no sign of overload
+                if shortened() and isinstance(e, httpx.TimeoutException):
+                    self.router.released(url)
+                elif isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)):
+                    self.router.failed(url)
+                else:
+                    self.router.released(url)
+                if upstream.limiter is not None and not shortened():
+                    upstream.limiter.record(None, time.perf_counter() - started)
+                raise
+            except BaseException:
+                self.router.released(url)
+                raise
+            elapsed = time.perf_counter() - started
+            self.router.succeeded(
+                url,
+                elapsed,
+                request_session.get(),
+                mutation=method != "GET" and response.is_success,
+            )
+            if upstream.limiter is not None:
+                upstream.limiter.record(
+                    response.status_code,
+                    elapsed,
+                    f"{method} {endpoint_template(endpoint)}",
+                    len(response.content),
+                )
+            return response
+
+    async def get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Execute GET request."""
+        return await self._request("GET", endpoint, **kwargs)
+
     async def post(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Execute POST request."""
-        try:
-            logger.debug(f"POST {endpoint}")
-            logger.debug(f"POST payload: {kwargs.get('json', {})}")
-            response = await self.session.post(endpoint, **kwargs)
-            response.raise_for_status()
-            logger.debug(f"POST {endpoint} - Status: {response.status_code}")
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"POST {endpoint} failed: {e}")
-            try:
-                error_body = e.response.text
-                logger.error(f"Response body: {error_body}")
-            except Exception:
-                pass
-            raise StorageScaleAPIError(f"API request failed: {e}")
-        except httpx.HTTPError as e:
-            logger.error(f"POST {endpoint} failed: {e}")
-            raise StorageScaleAPIError(f"API request failed: {e}")
+        return await self._request("POST", endpoint, **kwargs)
 
     async def put(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Execute PUT request."""
-        try:
-            logger.debug(f"PUT {endpoint}")
-            response = await self.session.put(endpoint, **kwargs)
-            response.raise_for_status()
-            logger.debug(f"PUT {endpoint} - Status: {response.status_code}")
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"PUT {endpoint} failed: {e}")
-            try:
-                error_body = e.response.text
-                logger.error(f"Response body: {error_body}")
-            except Exception:
-                pass
-            raise StorageScaleAPIError(f"API request failed: {e}")
-        except httpx.HTTPError as e:
-            logger.error(f"PUT {endpoint} failed: {e}")
-            raise StorageScaleAPIError(f"API request failed: {e}")
+        return await self._request("PUT", endpoint, **kwargs)
 
     async def patch(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Execute PATCH request."""
-        try:
-            logger.debug(f"PATCH {endpoint}")
-            response = await self.session.patch(endpoint, **kwargs)
-            response.raise_for_status()
-            logger.debug(f"PATCH {endpoint} - Status: {response.status_code}")
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"PATCH {endpoint} failed: {e}")
-            try:
-                error_body = e.response.text
-                logger.error(f"Response body: {error_body}")
-            except Exception:
-                pass
-            raise StorageScaleAPIError(f"API request failed: {e}")
-        except httpx.HTTPError as e:
-            logger.error(f"PATCH {endpoint} failed: {e}")
-            raise StorageScaleAPIError(f"API request failed: {e}")
+        return await self._request("PATCH", endpoint, **kwargs)
 
     async def delete(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Execute DELETE request."""
-        try:
-            logger.debug(f"DELETE {endpoint}")
-            response = await self.session.delete(endpoint, **kwargs)
-            response.raise_for_status()
-            logger.debug(f"DELETE {endpoint} - Status: {response.status_code}")
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"DELETE {endpoint} failed: {e}")
-            try:
-                error_body = e.response.text
-                logger.error(f"Response body: {error_body}")
-            except Exception:
-                pass
-            raise StorageScaleAPIError(f"API request failed: {e}")
-        except httpx.HTTPError as e:
-            logger.error(f"DELETE {endpoint} failed: {e}")
-            raise StorageScaleAPIError(f"API request failed: {e}")
+        return await self._request("DELETE", endpoint, **kwargs)
 
     async def __aenter__(self):
         """Async context manager entry."""
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self.session.aclose()
+        """Async context manager exit.
+
+        Shared sessions stay open for reuse by later clients.
+        """
+        for upstream in self.upstreams.values():
+            if upstream.owned:
+                await upstream.session.aclose()
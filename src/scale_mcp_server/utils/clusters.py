@@ -0,0 +1,217 @@
+"""Multiple Storage Scale clusters.
+
+One server can manage a fleet of clusters. The [scale_api] and
+[authorization] sections of scale_config.ini describe the default cluster;
+every further cluster is a [cluster:<name>] section overriding their keys:
+
+    [cluster:archive]
+    hostname = archive-gui.example.com
+    username = archive-admin
+    password = secret
+
+Keys not set in a profile, such as ports, timeouts or concurrency limits,
+are taken from [scale_api] and [authorization].
+
+The cluster of the current request travels in a context variable.
+ClusterMiddleware adds a 'cluster' argument to the REST tools when more than
+one cluster is configured and sets the variable from it; StorageScaleClient
+connects to the cluster it names. Every cluster has its own connection pool,
+request scheduler and concurrency limit, since these are keyed by base URL.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from scale_mcp_server.utils.read_config import read_config, scale_config_path
+
+DEFAULT_CLUSTER = "default"
+
+_PREFIX = "cluster:"
+_AUTHORIZATION_KEYS = frozenset(
+    (
+        "username",
+        "password",
+        "allow_insecure",
+        "ca_bundle",
+        "auth",
+        "token_path",
+        "token_refresh",
+        "token_ttl",
+    )
+)
+
+# Cluster profile of the current request, None for the default cluster
+request_cluster: ContextVar[Optional[str]] = ContextVar("request_cluster", default=None)
+
+
+class UnknownClusterError(ValueError):
+    """Raised when a cluster profile is not configured."""
+
+    pass
+
+
+def cluster_names(config: dict) -> list[str]:
+    """Get the names of the configured clusters, the default cluster first.
+
+    Args:
+        config: Configuration as returned by read_config
+    """
+    return [DEFAULT_CLUSTER] + [
+        section[len(_PREFIX) :].strip()
+        for section in config
+        if section.startswith(_PREFIX)
+    ]
+
+
+def cluster_config(config: dict, name: Optional[str] = None) -> dict:
+    """Get the configuration of a cluster.
+
+    Args:
+        config: Configuration as returned by read_config
+        name: Cluster profile (default: the cluster of the current request)
+
+    Returns:
+        Configuration with the profile merged into [scale_api] and
+        [authorization]
+
+    Raises:
+        UnknownClusterError: If the profile is not configured
+    """
+    name = name or request_cluster.get() or DEFAULT_CLUSTER
+    if name == DEFAULT_CLUSTER:
+        return config
+    profile = config.get(f"{_PREFIX}{name}")
+    if profile is None:
+        raise UnknownClusterError(
+            f"Unknown cluster '{name}', configured clusters: "
+            f"{', '.join(cluster_names(config))}"
+        )
+
+    api_config = dict(config.get("scale_api", {}))
+    auth_config = dict(config.get("authorization", {}))
+    for key, value in profile.items():
+        if key in _AUTHORIZATION_KEYS:
+            auth_config[key] = value
+        else:
+            api_config[key] = value
+    return {**config, "scale_api": api_config, "authorization": auth_config}
+
+
+@contextmanager
+def cluster_scope(name: Optional[str]) -> Iterator[None]:
+    """Send the requests made in the block to a cluster."""
+    token = request_cluster.set(name)
+    try:
+        yield
+    finally:
+        request_cluster.reset(token)
+
+
+async def gather_clusters(
+    run: Callable[[], Awaitable[Any]], clusters: Optional[list[str]] = None
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Run an operation against several clusters concurrently.
+
+    Args:
+        run: Coroutine function performing the operation against the cluster
+            of the current request
+        clusters: Cluster profiles (default: all configured clusters)
+
+    Returns:
+        Results and error messages, keyed by cluster
+
+    Raises:
+        UnknownClusterError: If one of the profiles is not configured
+    """
+    config = read_config(config_path=scale_config_path())
+    names = clusters or cluster_names(config)
+    for name in names:
+        cluster_config(config, name)
+
+    async def run_on(name: str) -> Any:
+        # Each gathered coroutine runs in its own task and context
+        request_cluster.set(name)
+        return await run()
+
+    outcomes = await asyncio.gather(
+        *(run_on(name) for name in names), return_exceptions=True
+    )
+    results, errors = {}, {}
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, Exception):
+            errors[name] = str(outcome)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results[name] = outcome
+    return results, errors
+
+
+class ClusterMiddleware(Middleware):
+    """Add a 'cluster' argument to the tools of the REST sub-servers.
+
+    The argument is only advertised when more than one cluster is
+    configured. It is removed from the call before the tool sees it.
+    """
+
+    def __init__(self, servers: list[FastMCP]):
+        """Initialize the middleware.
+
+        Args:
+            servers: Sub-servers whose tools talk to the Storage Scale REST API
+        """
+        self.servers = servers
+        self._tools: Optional[set[str]] = None
+
+    async def _tool_names(self) -> set[str]:
+        if self._tools is None:
+            names: set[str] = set()
+            for server in self.servers:
+                names.update(tool.name for tool in await server.list_tools())
+            self._tools = names
+        return self._tools
+
+    async def on_list_tools(self, context: MiddlewareContext, call_next: Any) -> Any:
+        tools = await call_next(context)
+        names = cluster_names(read_config(config_path=scale_config_path()))
+        if len(names) < 2:
+            return tools
+
+        rest_tools = await self._tool_names()
+        argument = {
+            "type": "string",
+            "enum": names,
+            "default": DEFAULT_CLUSTER,
+            "description": "Storage Scale cluster to run the tool against",
+        }
+        listed = []
+        for tool in tools:
+            if tool.name in rest_tools:
+                parameters = dict(tool.parameters)
+                parameters["properties"] = {
+                    **parameters.get("properties", {}),
+                    "cluster": argument,
+                }
+                tool = tool.model_copy(update={"parameters": parameters})
+            listed.append(tool)
+        return listed
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: Any) -> Any:
+        arguments = context.message.arguments or {}
+        if "cluster" not in arguments or (
+            context.message.name not in await self._tool_names()
+        ):
+            return await call_next(context)
+
+        arguments = dict(arguments)
+        cluster = arguments.pop("cluster")
+        if cluster:
+            cluster_config(read_config(config_path=scale_config_path()), cluster)
+        message = context.message.model_copy(update={"arguments": arguments})
+        with cluster_scope(cluster or None):
+            return await call_next(context.copy(message=message))
@@ -0,0 +1,159 @@
+"""Log notifications sent to MCP clients.
+
+Tools report what they do with ctx.info, ctx.debug and friends, and every
+such call is a separate JSON-RPC notification to the client. The [fastmcp]
+section of mcp_config.ini controls them:
+
+- contextLogging: Send log notifications at all
+- contextLogLevel: Lowest level sent, unless the client sets its own with
+  logging/setLevel
+- contextLogBatch: Collect the messages of a tool call and send them as one
+  notification when the call completes, instead of one per message
+
+A batched notification has the level of its most severe message. Its text
+holds the messages one per line, and its extra data holds them with their
+levels under 'messages'.
+
+Notifications are intercepted at the session, since mounted servers give
+each tool its own Context; the tool call they belong to is identified
+through a context variable set by ContextLogMiddleware.
+"""
+
+import logging
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from fastmcp.server.context import LogData
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+logger = logging.getLogger(__name__)
+
+LEVELS = (
+    "debug",
+    "info",
+    "notice",
+    "warning",
+    "error",
+    "critical",
+    "alert",
+    "emergency",
+)
+
+
+class _Batch:
+    """Log notifications collected during one tool call."""
+
+    def __init__(self) -> None:
+        self.messages: list[dict[str, Any]] = []
+        self.logger: Optional[str] = None
+        self.related_request_id: Any = None
+        self.open = True
+
+
+_batch: ContextVar[Optional[_Batch]] = ContextVar("context_log_batch", default=None)
+
+
+def parse_level(value: Optional[str]) -> Optional[str]:
+    """Validate an MCP log level such as 'info' or 'WARNING'.
+
+    Raises:
+        ValueError: If the level is not an MCP log level
+    """
+    if not value:
+        return None
+    level = value.strip().lower()
+    if level not in LEVELS:
+        raise ValueError(f"Invalid log level '{value}', expected one of {LEVELS}")
+    return level
+
+
+class ContextLogMiddleware(Middleware):
+    """Suppress or batch the log notifications of tool calls."""
+
+    def __init__(self, enabled: bool = True, batch: bool = False):
+        """Initialize the middleware.
+
+        Args:
+            enabled: Send log notifications to clients
+            batch: Send the messages of a tool call as one notification
+        """
+        self.enabled = enabled
+        self.batch = batch
+
+    @classmethod
+    def from_config(cls, fastmcp_config: dict) -> "ContextLogMiddleware":
+        """Create the middleware from the [fastmcp] section of mcp_config.ini."""
+
+        def is_true(key: str, default: str) -> bool:
+            value = str(fastmcp_config.get(key, default)).strip().lower()
+            return value in ("1", "true", "yes", "on")
+
+        return cls(
+            enabled=is_true("contextLogging", "true"),
+            batch=is_true("contextLogBatch", "false"),
+        )
+
+    def _wrap(self, session: Any) -> None:
+        """Route the log notifications of a session through this middleware."""
+        if getattr(session, "_scale_log_wrapped", False):
+            return
+        send = session.send_log_message
+
+        async def send_log_message(
+            level: str,
+            data: Any,
+            logger: Optional[str] = None,
+            related_request_id: Any = None,
+        ) -> None:
+            if not self.enabled:
+                return
+            batch = _batch.get()
+            if batch is None or not batch.open:
+                await send(level, data, logger, related_request_id)
+                return
+            message = getattr(data, "msg", data)
+            batch.messages.append({"level": level, "message": str(message)})
+            batch.logger = batch.logger or logger
+            batch.related_request_id = batch.related_request_id or related_request_id
+
+        session.send_log_message = send_log_message
+        session._scale_log_wrapped = True
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: Any) -> Any:
+        session = None
+        if context.fastmcp_context is not None:
+            try:
+                session = context.fastmcp_context.session
+            except Exception:
+                pass
+        if session is None or (self.enabled and not self.batch):
+            return await call_next(context)
+
+        self._wrap(session)
+        if not self.enabled:
+            return await call_next(context)
+
+        batch = _Batch()
+        token = _batch.set(batch)
+        try:
+            return await call_next(context)
+        finally:
+            _batch.reset(token)
+            # Messages of tasks started by the call are sent on their own
+            batch.open = False
+            if batch.messages:
+                try:
+                    await self._flush(session, batch)
+                except Exception as e:
+                    logger.warning(f"Failed to send batched log notification: {e}")
+
+    @staticmethod
+    async def _flush(session: Any, batch: _Batch) -> None:
+        level = max((message["level"] for message in batch.messages), key=LEVELS.index)
+        data = LogData(
+            msg="\n".join(message["message"] for message in batch.messages),
+            extra={"messages": batch.messages},
+        )
+        await session.send_log_message(
+            level, data, batch.logger, batch.related_request_id
+        )
@@ -0,0 +1,291 @@
+"""Routing of REST requests across the management nodes of a cluster.
+
+A cluster usually runs the GUI and REST API on several nodes. With a
+comma-separated [scale_api] hostname list, EndpointRouter spreads requests
+over them and keeps them away from nodes that are slow or down:
+
+- Selection: the node with the lowest smoothed (EWMA) latency times its
+  requests in flight gets the request. A node without a latency sample yet
+  is tried with a single request first.
+- Failover: a node whose connection fails is marked down, with an
+  exponentially growing back-off, and the request is retried on the next
+  node. The request never reached the failed node, so this is safe for
+  mutations too.
+- Probing: while more than one node is configured, a background task probes
+  every node each probe_interval seconds, so a node that went down is
+  avoided before a request hits it and one that came back is used again.
+  close_routers stops the probe tasks when the server shuts down.
+- Stickiness: after a mutation, requests of the same MCP session go to the
+  node that took it for sticky_ttl seconds, so a sequence of changes and
+  the reads checking them see the same node.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class _Node:
+    """Routing state of one management node."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.latency: Optional[float] = None
+        self.in_flight = 0
+        self.failures = 0
+        self.down_until = 0.0
+        self.requests = 0
+
+    @property
+    def up(self) -> bool:
+        return time.monotonic() >= self.down_until
+
+    def score(self) -> float:
+        if self.latency is None:
+            # Send a single request to learn the latency of a new node
+            return -1.0 if not self.in_flight else float("inf")
+        return self.latency * (self.in_flight + 1)
+
+
+class EndpointRouter:
+    """Latency-aware selection and failover across management nodes."""
+
+    def __init__(
+        self,
+        base_urls: list[str],
+        probe_path: str = "/scalemgmt/v3/version",
+        probe_interval: float = 10.0,
+        sticky_ttl: float = 30.0,
+        verify: Any = True,
+        smoothing: float = 0.2,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        """Initialize the router.
+
+        Args:
+            base_urls: Base URLs of the management nodes
+            probe_path: Endpoint requested by health probes
+            probe_interval: Seconds between health probes (0 disables them)
+            sticky_ttl: Seconds a session stays on the node of its last
+                mutation (0 disables stickiness)
+            verify: TLS verification setting of the probe client
+            smoothing: Weight of a new sample in the smoothed latency
+            backoff: Seconds a node stays down after its first failure,
+                doubled for every further consecutive failure
+            max_backoff: Longest time a node stays down
+        """
+        self.nodes = {url: _Node(url) for url in base_urls}
+        self.probe_path = probe_path
+        self.probe_interval = probe_interval
+        self.sticky_ttl = sticky_ttl
+        self.verify = verify
+        self.smoothing = smoothing
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.failovers = 0
+        self._pins: dict[str, tuple[str, float]] = {}
+        self._probe_task: Optional[asyncio.Task] = None
+
+    def select(
+        self, session: Optional[str] = None, exclude: frozenset[str] = frozenset()
+    ) -> str:
+        """Choose the node for a request.
+
+        Args:
+            session: MCP session of the request, for sticky routing
+            exclude: Base URLs already tried for this request
+
+        Returns:
+            Base URL of the chosen node
+        """
+        self._ensure_probing()
+        candidates = [n for url, n in self.nodes.items() if url not in exclude]
+        if not candidates:
+            candidates = list(self.nodes.values())
+
+        pin = self._pins.get(session) if session else None
+        if pin is not None:
+            url, expires = pin
+            node = self.nodes.get(url)
+            if time.monotonic() < expires and node in candidates and node.up:
+                return url
+            del self._pins[session]
+
+        up = [node for node in candidates if node.up]
+        if not up:
+            # Everything is down: try the node that comes back first
+            return min(candidates, key=lambda node: node.down_until).base_url
+        best = min(node.score() for node in up)
+        return random.choice([n for n in up if n.score() == best]).base_url
+
+    def begin(self, base_url: str) -> None:
+        """Count a request sent to a node."""
+        node = self.nodes[base_url]
+        node.in_flight += 1
+        node.requests += 1
+
+    def succeeded(
+        self,
+        base_url: str,
+        elapsed: float,
+        session: Optional[str] = None,
+        mutation: bool = False,
+    ) -> None:
+        """Record a response from a node.
+
+        Args:
+            base_url: Node that responded
+            elapsed: Request duration in seconds
+            session: MCP session of the request
+            mutation: The request changed state; pins the session to the node
+        """
+        node = self.nodes[base_url]
+        node.in_flight -= 1
+        node.failures = 0
+        node.down_until = 0.0
+        if node.latency is None:
+            node.latency = elapsed
+        else:
+            node.latency += self.smoothing * (elapsed - node.latency)
+        if mutation and session and self.sticky_ttl > 0:
+            self._pins[session] = (base_url, time.monotonic() + self.sticky_ttl)
+            if len(self._pins) > 1024:
+                now = time.monotonic()
+                self._pins = {s: p for s, p in self._pins.items() if p[1] > now}
+
+    def released(self, base_url: str) -> None:
+        """Record a request that ended without a response or a failure."""
+        self.nodes[base_url].in_flight -= 1
+
+    def failed(self, base_url: str, in_flight: bool = True) -> None:
+        """Mark a node down after a connection failure.
+
+        Args:
+            base_url: Node that failed
+            in_flight: The failure ended a request counted with begin
+        """
+        node = self.nodes[base_url]
+        if in_flight:
+            node.in_flight -= 1
+        node.failures += 1
+        delay = min(self.backoff * 2 ** (node.failures - 1), self.max_backoff)
+        was_up = node.up
+        node.down_until = time.monotonic() + delay
+        if was_up and len(self.nodes) > 1:
+            logger.warning(f"Management node {base_url} is down, retry in {delay}s")
+
+    def _ensure_probing(self) -> None:
+        """Start the probe task in the running event loop if needed."""
+        if len(self.nodes) < 2 or self.probe_interval <= 0:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = self._probe_task
+        if task is not None and not task.done():
+            if task.get_loop() is loop:
+                return
+            # The task belongs to an earlier event loop, stop it there
+            self._cancel_elsewhere(task)
+        self._probe_task = loop.create_task(self._probe())
+
+    @staticmethod
+    def _cancel_elsewhere(task: asyncio.Task) -> None:
+        """Cancel a task of another event loop, if that loop is still open."""
+        if not task.get_loop().is_closed():
+            task.get_loop().call_soon_threadsafe(task.cancel)
+
+    async def aclose(self) -> None:
+        """Stop the probe task."""
+        task, self._probe_task = self._probe_task, None
+        if task is None or task.done():
+            return
+        if task.get_loop() is not asyncio.get_running_loop():
+            self._cancel_elsewhere(task)
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _probe(self) -> None:
+        """Probe every node periodically; 5xx responses count as down."""
+        async with httpx.AsyncClient(verify=self.verify, timeout=3.0) as client:
+            while True:
+                await asyncio.sleep(self.probe_interval)
+                await asyncio.gather(
+                    *(self._probe_node(client, node) for node in self.nodes.values())
+                )
+
+    async def _probe_node(self, client: httpx.AsyncClient, node: _Node) -> None:
+        try:
+            response = await client.get(node.base_url + self.probe_path)
+            healthy = response.status_code < 500
+        except httpx.HTTPError:
+            healthy = False
+        if healthy:
+            if not node.up:
+                logger.info(f"Management node {node.base_url} is back up")
+            node.failures = 0
+            node.down_until = 0.0
+        else:
+            self.failed(node.base_url, in_flight=False)
+
+    def stats(self) -> dict[str, Any]:
+        """Get the routing state of every node."""
+        return {
+            "failovers": self.failovers,
+            "sticky_sessions": len(self._pins),
+            "nodes": {
+                url: {
+                    "up": node.up,
+                    "latency_ms": (
+                        round(node.latency * 1000, 2) if node.latency else None
+                    ),
+                    "in_flight": node.in_flight,
+                    "requests": node.requests,
+                    "failures": node.failures,
+                }
+                for url, node in self.nodes.items()
+            },
+        }
+
+
+_routers: dict[tuple[str, ...], EndpointRouter] = {}
+
+
+def get_router(base_urls: list[str], **kwargs) -> EndpointRouter:
+    """Get the router of a set of management nodes, creating it on first use.
+
+    Args:
+        base_urls: Base URLs of the management nodes
+        **kwargs: EndpointRouter settings of a newly created router
+
+    Returns:
+        The shared EndpointRouter for base_urls
+    """
+    key = tuple(base_urls)
+    router = _routers.get(key)
+    if router is None:
+        router = _routers[key] = EndpointRouter(list(base_urls), **kwargs)
+    return router
+
+
+def routers() -> dict[str, EndpointRouter]:
+    """Get the routers with more than one node, keyed by their node list."""
+    return {", ".join(key): r for key, r in _routers.items() if len(key) > 1}
+
+
+async def close_routers() -> None:
+    """Stop the probe tasks of all routers."""
+    for router in _routers.values():
+        await router.aclose()
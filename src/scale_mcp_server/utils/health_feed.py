@@ -0,0 +1,296 @@
+"""Background System Health pollers.
+
+HealthEventFeed fetches the active System Health events of all nodes and
+filesystems through the v2 API, diffs them against the last known state and
+records every added, updated and cleared event in a bounded change log.
+Clients pass back the cursor of their previous read to receive only the
+changes since then.
+
+HealthStateWatcher keeps an in-memory table of the System Health states of
+all nodes and notifies listeners whenever the table changes, so any number of
+clients can share a single poller.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from scale_mcp_server.api.v2.filesystems import get_filesystem_health_events_api
+from scale_mcp_server.api.v2.nodes import (
+    get_node_health_events_api,
+    get_node_health_states_api,
+)
+from scale_mcp_server.api.v3.filesystems import list_filesystems_api
+from scale_mcp_server.utils.scheduler import BULK, request_priority, request_session
+from scale_mcp_server.utils.timeouts import request_deadline
+
+logger = logging.getLogger(__name__)
+
+# Fields identifying an event independently of its changing attributes
+_EVENT_KEY_FIELDS = ("node", "component", "entityType", "entityName", "event", "name")
+
+
+@dataclass
+class HealthChange:
+    """A single change recorded in the feed.
+
+    Attributes:
+        seq: Sequence number of the change
+        action: One of 'added', 'updated' or 'cleared'
+        event: The event as last reported by the API
+    """
+
+    seq: int
+    action: str
+    event: dict
+
+
+def _event_key(scope: str, event: dict) -> str:
+    fields = [event.get(field) for field in _EVENT_KEY_FIELDS]
+    if not any(fields):
+        return f"{scope}|{json.dumps(event, sort_keys=True)}"
+    return "|".join([scope] + [str(f) if f is not None else "" for f in fields])
+
+
+class HealthPoller(ABC):
+    """Base class running poll_once in a background task.
+
+    The poller starts on first use and sleeps interval seconds between polls,
+    randomized by up to +/- jitter (a fraction of the interval) so that
+    several server instances do not hit the management node in lockstep.
+    """
+
+    name = "Health poller"
+
+    def __init__(self, interval: float = 30.0, jitter: float = 0.0):
+        """Initialize the poller.
+
+        Args:
+            interval: Seconds between polls (default: 30)
+            jitter: Random fraction of the interval added or subtracted per
+                sleep (default: 0)
+        """
+        self.interval = interval
+        self.jitter = jitter
+        self.last_poll: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._first_poll = asyncio.Event()
+
+    async def ensure_started(self) -> None:
+        """Start the background poller and wait for its first poll."""
+        if self._task is None or self._task.done():
+            self._first_poll = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                f"{self.name} started with interval={self.interval}s, "
+                f"jitter={self.jitter}"
+            )
+        await self._first_poll.wait()
+
+    async def stop(self) -> None:
+        """Stop the background poller."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        # Background polls yield to interactive tool calls
+        request_priority.set(BULK)
+        request_session.set(None)
+        request_deadline.set(None)
+        while True:
+            try:
+                await self.poll_once()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"{self.name} poll failed: {e}")
+            finally:
+                self._first_poll.set()
+            spread = self.interval * self.jitter
+            await asyncio.sleep(
+                max(0.0, self.interval + random.uniform(-spread, spread))
+            )
+
+    @abstractmethod
+    async def poll_once(self) -> None:
+        """Poll the API once."""
+
+
+class HealthEventFeed(HealthPoller):
+    """Poll System Health events and serve cursor-based deltas."""
+
+    name = "Health event feed"
+
+    def __init__(
+        self, interval: float = 30.0, history: int = 10000, jitter: float = 0.0
+    ):
+        """Initialize the health event feed.
+
+        Args:
+            interval: Seconds between polls (default: 30)
+            history: Maximum number of changes kept for delta reads
+            jitter: Random fraction of the interval added or subtracted per sleep
+        """
+        super().__init__(interval=interval, jitter=jitter)
+        self.generation = uuid.uuid4().hex[:8]
+        self.seq = 0
+        self.events: dict[str, dict] = {}
+        self.changes: deque[HealthChange] = deque(maxlen=history)
+
+    async def _fetch(self) -> dict[str, dict]:
+        """Fetch all active node and filesystem events keyed by identity."""
+        filesystems = await list_filesystems_api()
+        names = [
+            fs.get("filesystemName") or fs.get("name")
+            for fs in filesystems.get("filesystems", [])
+        ]
+        responses = await asyncio.gather(
+            get_node_health_events_api(":all:"),
+            *(get_filesystem_health_events_api(name) for name in names if name),
+        )
+
+        current: dict[str, dict] = {}
+        scopes = ["nodes"] + [f"filesystem:{name}" for name in names if name]
+        for scope, response in zip(scopes, responses):
+            for event in response.get("events", []):
+                current[_event_key(scope, event)] = event
+        return current
+
+    async def poll_once(self) -> None:
+        """Poll the API once and record the differences to the known state."""
+        current = await self._fetch()
+
+        for key, event in current.items():
+            previous = self.events.get(key)
+            if previous is None:
+                self._record("added", event)
+            elif previous != event:
+                self._record("updated", event)
+        for key in self.events.keys() - current.keys():
+            self._record("cleared", self.events[key])
+
+        self.events = current
+        self.last_poll = time.time()
+
+    def _record(self, action: str, event: dict) -> None:
+        self.seq += 1
+        self.changes.append(HealthChange(seq=self.seq, action=action, event=event))
+
+    @property
+    def cursor(self) -> str:
+        """Cursor pointing at the latest recorded change."""
+        return f"{self.generation}:{self.seq}"
+
+    def changes_since(self, cursor: Optional[str] = None) -> dict[str, Any]:
+        """Get the changes recorded after a cursor.
+
+        A missing, foreign or expired cursor yields a reset: all active events
+        are returned as added.
+
+        Args:
+            cursor: Cursor returned by a previous read
+
+        Returns:
+            Dictionary with the new cursor and the added, updated and cleared
+            events
+        """
+        since = None
+        if cursor:
+            generation, _, seq = cursor.partition(":")
+            if generation == self.generation and seq.isdigit():
+                since = int(seq)
+        oldest = self.changes[0].seq if self.changes else self.seq + 1
+        reset = since is None or since > self.seq or since < oldest - 1
+
+        delta: dict[str, list[dict]] = {"added": [], "updated": [], "cleared": []}
+        if reset:
+            delta["added"] = list(self.events.values())
+        else:
+            for change in self.changes:
+                if change.seq > since:  # type: ignore[operator]
+                    delta[change.action].append(change.event)
+
+        return {
+            "cursor": self.cursor,
+            "reset": reset,
+            **delta,
+            "active": len(self.events),
+            "last_poll": self.last_poll,
+            "last_error": self.last_error,
+        }
+
+
+class HealthStateWatcher(HealthPoller):
+    """Keep a System Health state table of all nodes and notify on changes."""
+
+    name = "Health state watcher"
+
+    def __init__(self, interval: float = 15.0, jitter: float = 0.2):
+        """Initialize the health state watcher.
+
+        Args:
+            interval: Seconds between polls (default: 15)
+            jitter: Random fraction of the interval added or subtracted per
+                sleep (default: 0.2)
+        """
+        super().__init__(interval=interval, jitter=jitter)
+        self.version = 0
+        self.table: dict[str, dict[str, Any]] = {}
+        self.listeners: list[Callable[[], Awaitable[None]]] = []
+
+    async def poll_once(self) -> None:
+        """Poll node health states and notify listeners if the table changed."""
+        response = await get_node_health_states_api(":all:")
+
+        table: dict[str, dict[str, Any]] = {}
+        for state in response.get("states", []):
+            node = state.get("node") or state.get("nodeName") or "unknown"
+            entity = "/".join(
+                str(state[field])
+                for field in ("component", "entityType", "entityName")
+                if state.get(field)
+            )
+            table.setdefault(node, {})[entity or "node"] = state.get("state")
+        self.last_poll = time.time()
+
+        if table == self.table:
+            return
+        self.table = table
+        self.version += 1
+        logger.debug(f"Health state table changed, version={self.version}")
+        for listener in list(self.listeners):
+            try:
+                await listener()
+            except Exception as e:
+                logger.warning(f"Health state listener failed: {e}")
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get the current state table with its version and poll metadata."""
+        unhealthy = {
+            node: {
+                entity: state
+                for entity, state in states.items()
+                if state not in ("HEALTHY", "TIPS", None)
+            }
+            for node, states in self.table.items()
+        }
+        return {
+            "version": self.version,
+            "last_poll": self.last_poll,
+            "last_error": self.last_error,
+            "nodes": self.table,
+            "unhealthy": {node: s for node, s in unhealthy.items() if s},
+        }
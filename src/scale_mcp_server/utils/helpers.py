@@ -1,6 +1,7 @@
 """Helper utility functions."""
 
 import re
+from typing import Any
 
 def clean_output(text: str) -> str:
     """Clean command output by replacing tabs with spaces.
@@ -13,3 +14,55 @@ def clean_output(text: str) -> str:
     """
     # Replace tabs with spaces
     return re.sub(r'\t+', ' ', text)
+
+
+def chunked(items: list, size: int) -> list[list]:
+    """Split a list into consecutive chunks.
+
+    Args:
+        items: Items to split
+        size: Maximum number of items per chunk
+
+    Returns:
+        List of chunks, the last one possibly shorter
+    """
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Compute a percentile using the nearest-rank method.
+
+    Args:
+        values: Sample values
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The percentile value, or 0.0 for an empty sample
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[min(int(rank), len(ordered)) - 1]
+
+
+def request_meta(context: Any, key: str) -> Any:
+    """Get a value from the _meta of the MCP request a middleware handles.
+
+    Args:
+        context: Middleware context
+        key: _meta key
+
+    Returns:
+        Value, or None if the request carries no such key
+    """
+    fastmcp_context = getattr(context, "fastmcp_context", None)
+    try:
+        meta = fastmcp_context.request_context.meta
+    except Exception:
+        return None
+    if isinstance(meta, dict):
+        return meta.get(key)
+    return getattr(meta, key, None)
@@ -0,0 +1,262 @@
+"""Background jobs for long-running operations.
+
+Mounting or unmounting all filesystems, starting or stopping nodes and batch
+node or NSD operations can take minutes, during which the REST request stays
+open. Instead of holding the tool call for that long, tools submit the
+operation to the JobManager and return a job record immediately. The job runs
+in a background task and its status, result or error can be read with the
+get_job and list_jobs tools. Jobs are private to the MCP session that
+submitted them.
+
+Cancelling a job only abandons the request; an operation already accepted by
+the management node keeps running there.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from scale_mcp_server.utils.read_config import read_config
+from scale_mcp_server.utils.scheduler import request_session
+from scale_mcp_server.utils.timeouts import request_deadline
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED = frozenset((SUCCEEDED, FAILED, CANCELLED))
+
+
+@dataclass
+class Job:
+    """A long-running operation.
+
+    Attributes:
+        job_id: Job identifier
+        operation: Operation name, e.g. 'mount_all_filesystems'
+        params: Parameters the operation was submitted with
+        status: One of 'pending', 'running', 'succeeded', 'failed' or
+            'cancelled'
+        submitted: Submission time (epoch seconds)
+        started: Start time (epoch seconds)
+        finished: Completion time (epoch seconds)
+        result: Result of a succeeded operation
+        error: Error message of a failed operation
+        session: MCP session that submitted the job
+    """
+
+    job_id: str
+    operation: str
+    params: dict = field(default_factory=dict)
+    status: str = PENDING
+    submitted: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+    session: Optional[str] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds the job has been running, or ran."""
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the job as a dictionary."""
+        return {
+            "job_id": self.job_id,
+            "operation": self.operation,
+            "params": self.params,
+            "status": self.status,
+            "submitted": self.submitted,
+            "started": self.started,
+            "finished": self.finished,
+            "elapsed_s": round(self.elapsed, 3),
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """Run long-running operations as background jobs."""
+
+    def __init__(self, max_running: int = 4, history: int = 1000):
+        """Initialize the job manager.
+
+        Args:
+            max_running: Jobs running at the same time; later jobs stay pending
+            history: Jobs kept, oldest finished jobs are dropped first
+        """
+        self.max_running = max(1, max_running)
+        self.history = history
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def submit(
+        self,
+        operation: str,
+        run: Callable[[], Awaitable[Any]],
+        params: Optional[dict] = None,
+    ) -> Job:
+        """Start an operation as a background job.
+
+        Args:
+            operation: Operation name
+            run: Coroutine function performing the operation
+            params: Parameters to report with the job
+
+        Returns:
+            The submitted job
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_running)
+        job = Job(
+            job_id=uuid.uuid4().hex[:16],
+            operation=operation,
+            params=params or {},
+            session=request_session.get(),
+        )
+        self._jobs[job.job_id] = job
+        self._prune()
+        self._tasks[job.job_id] = asyncio.create_task(self._run(job, run))
+        logger.info(f"Submitted job {job.job_id}: {operation}")
+        return job
+
+    async def _run(self, job: Job, run: Callable[[], Awaitable[Any]]) -> None:
+        # The job outlives the deadline of the tool call that submitted it
+        request_deadline.set(None)
+        try:
+            async with self._slots:
+                job.status = RUNNING
+                job.started = time.time()
+                job.result = await run()
+                job.status = SUCCEEDED
+        except asyncio.CancelledError:
+            job.status = CANCELLED
+        except Exception as e:
+            job.status = FAILED
+            job.error = str(e)
+        finally:
+            job.finished = time.time()
+            job.done.set()
+            self._tasks.pop(job.job_id, None)
+            logger.info(
+                f"Job {job.job_id} ({job.operation}) {job.status} "
+                f"after {job.elapsed:.1f}s"
+            )
+
+    def _prune(self) -> None:
+        """Drop the oldest finished jobs beyond the history limit."""
+        excess = len(self._jobs) - self.history
+        for job_id in [j for j, job in self._jobs.items() if job.status in FINISHED]:
+            if excess <= 0:
+                break
+            del self._jobs[job_id]
+            excess -= 1
+
+    def get(self, job_id: str, session: Optional[str] = None) -> Optional[Job]:
+        """Get a job of a session by ID.
+
+        Args:
+            job_id: Job ID
+            session: MCP session the job was submitted by
+        """
+        job = self._jobs.get(job_id)
+        return job if job is not None and job.session == session else None
+
+    def list(
+        self,
+        status: Optional[str] = None,
+        operation: Optional[str] = None,
+        session: Optional[str] = None,
+    ) -> list[Job]:
+        """List the jobs of a session, newest first.
+
+        Args:
+            status: Only jobs with this status
+            operation: Only jobs of this operation
+            session: MCP session the jobs were submitted by
+        """
+        return [
+            job
+            for job in reversed(self._jobs.values())
+            if job.session == session
+            and (status is None or job.status == status)
+            and (operation is None or job.operation == operation)
+        ]
+
+    def cancel(self, job_id: str, session: Optional[str] = None) -> Optional[Job]:
+        """Cancel a pending or running job of a session.
+
+        Args:
+            job_id: Job ID
+            session: MCP session the job was submitted by
+
+        Returns:
+            The job, or None if the session has no such job
+        """
+        job = self.get(job_id, session)
+        task = self._tasks.get(job_id) if job is not None else None
+        if task is not None:
+            task.cancel()
+        return job
+
+    async def wait(
+        self,
+        job: Job,
+        timeout: float,
+        progress: Optional[Callable[[Job], Awaitable[None]]] = None,
+        interval: float = 1.0,
+    ) -> Job:
+        """Wait for a job to finish.
+
+        Args:
+            job: Job to wait for
+            timeout: Seconds to wait at most
+            progress: Coroutine function called with the job every interval
+                while it has not finished
+            interval: Seconds between progress calls
+
+        Returns:
+            The job, finished or not
+        """
+        deadline = time.monotonic() + timeout
+        while not job.done.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(job.done.wait(), min(interval, remaining))
+            except asyncio.TimeoutError:
+                if progress is not None:
+                    await progress(job)
+        return job
+
+
+_manager: Optional[JobManager] = None
+
+
+def get_job_manager() -> JobManager:
+    """Get the job manager, configured from the [jobs] section of mcp_config.ini."""
+    global _manager
+    if _manager is None:
+        config_path = Path(__file__).resolve().parents[3] / "config" / "mcp_config.ini"
+        jobs_config = read_config(config_path).get("jobs", {})
+        _manager = JobManager(
+            max_running=int(jobs_config.get("max_running", 4)),
+            history=int(jobs_config.get("history", 1000)),
+        )
+    return _manager
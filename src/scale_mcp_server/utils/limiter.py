@@ -0,0 +1,221 @@
+"""Adaptive concurrency limiting of upstream REST requests.
+
+The management node is shared with the GUI and other automation, so the
+number of requests this server may have in flight is not known up front.
+AdaptiveLimiter finds it at run time with additive increase, multiplicative
+decrease (AIMD), and drives the capacity of the endpoint's RequestScheduler:
+
+- While the limit is fully used and latency stays near its baseline, the
+  limit grows by one for every window of limit successful requests.
+- On 429 or 503 responses, transport errors, or when the smoothed latency
+  exceeds the baseline by the tolerance factor, the limit is cut by the
+  backoff factor, at most once per smoothed round trip.
+
+Latency is compared per request kind, i.e. per method, endpoint template and
+response size class, so a listing of 50k filesets is judged against earlier
+listings of its size rather than against small GETs. The baseline of each
+kind follows the lowest smoothed latency seen and drifts slowly upwards, so
+a permanently slower node is eventually accepted.
+"""
+
+import logging
+import time
+from typing import Any, Optional
+
+from scale_mcp_server.utils.endpoints import routers
+from scale_mcp_server.utils.scheduler import RequestScheduler, schedulers
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUSES = frozenset((429, 503))
+
+
+def _request_kind(endpoint: Optional[str], size: Optional[int]) -> str:
+    """Name the kind of a request by endpoint and response size class.
+
+    Size classes grow by a factor of 4, e.g. '<4096 B' holds responses of
+    1024 to 4095 bytes.
+    """
+    kind = endpoint or "*"
+    if size is not None:
+        kind += f" <{4 ** ((size.bit_length() + 1) // 2)} B"
+    return kind
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit of one upstream endpoint."""
+
+    def __init__(
+        self,
+        scheduler: RequestScheduler,
+        min_limit: int = 2,
+        max_limit: int = 16,
+        initial: Optional[int] = None,
+        backoff: float = 0.5,
+        tolerance: float = 2.0,
+        smoothing: float = 0.1,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            scheduler: Scheduler whose capacity the limiter sets
+            min_limit: Lowest concurrency limit
+            max_limit: Highest concurrency limit
+            initial: Starting limit (default: half of max_limit)
+            backoff: Factor applied to the limit on overload
+            tolerance: Smoothed latency over baseline that counts as overload
+            smoothing: Weight of a new sample in the smoothed latency
+        """
+        self.scheduler = scheduler
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(
+            min(max(initial or self.max_limit // 2, self.min_limit), self.max_limit)
+        )
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.latency: Optional[float] = None
+        # Request kind -> [smoothed latency, baseline]
+        self.kinds: dict[str, list[float]] = {}
+        self._hold_until = 0.0
+        self.counters = {
+            "requests": 0,
+            "throttled": 0,
+            "errors": 0,
+            "increases": 0,
+            "decreases": 0,
+        }
+        self.scheduler.capacity = int(self.limit)
+
+    def record(
+        self,
+        status: Optional[int],
+        elapsed: float,
+        endpoint: Optional[str] = None,
+        size: Optional[int] = None,
+    ) -> None:
+        """Feed the outcome of a request into the limit.
+
+        Args:
+            status: HTTP status, or None if the request failed in transport
+            elapsed: Request duration in seconds
+            endpoint: Method and endpoint template of the request, e.g.
+                'GET /scalemgmt/v3/filesystems/{filesystem}/filesets'
+            size: Response body size in bytes
+        """
+        self.counters["requests"] += 1
+        if status is None:
+            self.counters["errors"] += 1
+            self._decrease("transport error")
+            return
+        if status in THROTTLE_STATUSES:
+            self.counters["throttled"] += 1
+            self._decrease(f"HTTP {status}")
+            return
+
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency += self.smoothing * (elapsed - self.latency)
+
+        kind = _request_kind(endpoint, size)
+        track = self.kinds.get(kind)
+        if track is None:
+            track = self.kinds[kind] = [elapsed, elapsed]
+        else:
+            track[0] += self.smoothing * (elapsed - track[0])
+            if track[0] < track[1]:
+                track[1] = track[0]
+            else:
+                track[1] += 0.001 * (track[0] - track[1])
+        latency, baseline = track
+
+        if latency > baseline * self.tolerance:
+            self._decrease(f"latency of {kind}")
+        elif (
+            self.scheduler.in_flight >= int(self.limit) and self.limit < self.max_limit
+        ):
+            # Only grow a limit that is actually reached
+            previous = int(self.limit)
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            if int(self.limit) > previous:
+                self.counters["increases"] += 1
+                self.scheduler.capacity = int(self.limit)
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now < self._hold_until:
+            return
+        # Let the requests sent at the old limit drain before cutting again
+        self._hold_until = now + max(self.latency or 0.0, 0.05)
+        previous = int(self.limit)
+        self.limit = max(float(self.min_limit), self.limit * self.backoff)
+        if int(self.limit) < previous:
+            self.counters["decreases"] += 1
+            self.scheduler.capacity = int(self.limit)
+            logger.info(
+                f"Concurrency limit lowered from {previous} to {int(self.limit)} "
+                f"({reason})"
+            )
+
+    def stats(self) -> dict[str, Any]:
+        """Get the current limit, latency and counters."""
+        return {
+            "limit": int(self.limit),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "latency_ms": round(self.latency * 1000, 2) if self.latency else None,
+            **self.counters,
+            "kinds": {
+                kind: {
+                    "latency_ms": round(latency * 1000, 2),
+                    "baseline_ms": round(baseline * 1000, 2),
+                }
+                for kind, (latency, baseline) in self.kinds.items()
+            },
+        }
+
+
+_limiters: dict[str, AdaptiveLimiter] = {}
+
+
+def get_limiter(key: str, scheduler: RequestScheduler, **kwargs) -> AdaptiveLimiter:
+    """Get the limiter of an upstream endpoint, creating it on first use.
+
+    Args:
+        key: Upstream identifier, e.g. the base URL
+        scheduler: Scheduler of the endpoint
+        **kwargs: AdaptiveLimiter settings of a newly created limiter
+
+    Returns:
+        The shared AdaptiveLimiter for key
+    """
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = _limiters[key] = AdaptiveLimiter(scheduler, **kwargs)
+        logger.debug(
+            f"Created adaptive limiter for {key} with limit {int(limiter.limit)}"
+        )
+    return limiter
+
+
+def client_metrics() -> dict[str, Any]:
+    """Get scheduler, limiter and routing metrics of every upstream endpoint.
+
+    Returns:
+        Dictionary keyed by endpoint with 'scheduler' and 'limiter' sections,
+        and a 'routing' section for endpoints of a management node list
+    """
+    routing = {}
+    for router in routers().values():
+        for key, node in router.stats()["nodes"].items():
+            routing[key] = {**node, "failovers": router.failovers}
+    return {
+        key: {
+            "scheduler": scheduler.stats(),
+            "limiter": _limiters[key].stats() if key in _limiters else None,
+            **({"routing": routing[key]} if key in routing else {}),
+        }
+        for key, scheduler in schedulers().items()
+    }
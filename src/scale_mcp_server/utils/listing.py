@@ -0,0 +1,414 @@
+"""Fileset and quota listings from the REST API or the CLI.
+
+Paging tens of thousands of filesets or quotas through the v3 REST API takes
+much longer than a single 'mmlsfileset -Y' or 'mmrepquota -Y' over SSH, while
+for small listings the SSH connection costs more than the REST call. Both
+backends produce the same normalized records, built with the models of
+utils/models.py, and HybridLister picks one per listing by predicted cost:
+
+- Every backend has a linear cost model, seconds = setup + per_item * items,
+  fitted by least squares over its recent listings, with decaying weights so
+  it follows changes in load. Until a backend has listings of two different
+  sizes, the priors below are scaled to its mean duration instead.
+- The expected size is the number of items the previous listing of the same
+  filesystem returned; before the first listing the REST API is used.
+- A backend that has not served a listing yet is tried once when its prior
+  predicts at most explore_factor times the cost of the other one, so a
+  pessimistic prior does not rule it out for good.
+- A failed CLI listing is served by the REST API instead, and the CLI is not
+  used again for cli_backoff seconds.
+
+The CLI runs on the [ssh] node of the default cluster as the SSH user, so it
+is only used for the default cluster and for listings without an
+authorization domain. The [scale_api] listing_backend key selects 'auto'
+(the default), 'rest' or 'cli'. mmrepquota reports block counts in KiB;
+they are converted to bytes, the unit of the REST API.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import fields
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from scale_mcp_server.api.v3.filesets import list_filesets_api
+from scale_mcp_server.api.v3.quotas import list_quotas_api
+from scale_mcp_server.utils.clusters import (
+    DEFAULT_CLUSTER,
+    cluster_config,
+    request_cluster,
+)
+from scale_mcp_server.utils.mmparse import MmParser
+from scale_mcp_server.utils.models import Fileset, Quota, decode_list
+from scale_mcp_server.utils.read_config import read_config, scale_config_path
+from scale_mcp_server.utils.serialization import loads
+
+logger = logging.getLogger(__name__)
+
+FILESETS = "filesets"
+QUOTAS = "quotas"
+
+REST = "rest"
+CLI = "cli"
+AUTO = "auto"
+BACKENDS = (AUTO, REST, CLI)
+
+# Priors in seconds: a REST page round trip and JSON decode per item, versus
+# an SSH connection and command start
+_PRIORS = {
+    REST: {"setup": 0.05, "per_item": 100e-6},
+    CLI: {"setup": 1.0, "per_item": 10e-6},
+}
+
+# Columns of the -Y output mapped to the keys of the REST list entries
+_FILESET_COLUMNS = {
+    "filesetName": "filesetName",
+    "id": "id",
+    "path": "path",
+    "status": "status",
+    "isInodeSpaceOwner": "isInodeSpaceOwner",
+    "inodeSpace": "inodeSpace",
+    "comment": "comment",
+    "created": "created",
+    "parentId": "parentId",
+}
+_QUOTA_COLUMNS = {
+    "id": "quotaId",
+    "quotaType": "quotaType",
+    "name": "objectName",
+    "blockUsage": "blockUsage",
+    "blockQuota": "blockQuota",
+    "blockLimit": "blockLimit",
+    "filesUsage": "filesUsage",
+    "filesQuota": "filesQuota",
+    "filesLimit": "filesLimit",
+    "filesetname": "filesetName",
+}
+# Quota keys that mmrepquota reports in KiB and the REST API in bytes
+_BLOCK_KEYS = ("blockUsage", "blockQuota", "blockLimit")
+_INTEGER_KEYS = frozenset(
+    (
+        "id",
+        "inodeSpace",
+        "parentId",
+        "quotaId",
+        "blockUsage",
+        "blockQuota",
+        "blockLimit",
+        "filesUsage",
+        "filesQuota",
+        "filesLimit",
+    )
+)
+
+
+class CostModel:
+    """Linear cost model of one backend, fitted by weighted least squares."""
+
+    def __init__(self, setup: float, per_item: float, decay: float = 0.9):
+        """Initialize the model.
+
+        Args:
+            setup: Prior fixed cost of a listing in seconds
+            per_item: Prior cost of each listed item in seconds
+            decay: Weight kept by the previous listings at every new one
+        """
+        self.setup = setup
+        self.per_item = per_item
+        self.decay = decay
+        self._prior = (setup, per_item)
+        self.samples = 0
+        # Decayed sums of weights, items, seconds, items^2 and items*seconds
+        self._w = self._x = self._y = self._xx = self._xy = 0.0
+
+    def predict(self, items: int) -> float:
+        """Predict the duration of a listing of items entries."""
+        return self.setup + self.per_item * items
+
+    def observe(self, items: int, seconds: float) -> None:
+        """Fit the model to a completed listing."""
+        d = self.decay
+        self._w = self._w * d + 1
+        self._x = self._x * d + items
+        self._y = self._y * d + seconds
+        self._xx = self._xx * d + items * items
+        self._xy = self._xy * d + items * seconds
+        self.samples += 1
+
+        variance = self._w * self._xx - self._x * self._x
+        if variance > 1e-9 * max(self._w * self._xx, 1.0):
+            slope = (self._w * self._xy - self._x * self._y) / variance
+            if slope > 0:
+                self.per_item = slope
+                self.setup = max((self._y - slope * self._x) / self._w, 0.0)
+                return
+        # A single listing size: scale the prior to the mean duration
+        mean_items, mean_seconds = self._x / self._w, self._y / self._w
+        prior = self._prior[0] + self._prior[1] * mean_items
+        ratio = mean_seconds / prior if prior > 0 else 1.0
+        self.setup = self._prior[0] * ratio
+        self.per_item = self._prior[1] * ratio
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "setup_ms": round(self.setup * 1000, 3),
+            "per_item_us": round(self.per_item * 1e6, 3),
+            "samples": self.samples,
+        }
+
+
+def _integer(value: str) -> Any:
+    try:
+        return int(value)
+    except ValueError:
+        return value or None
+
+
+def _entries(
+    table: Any, columns: dict[str, str], extra: Optional[dict] = None
+) -> Iterator[dict[str, Any]]:
+    """Turn the rows of a -Y table into REST-shaped entries."""
+    names = [name for name in columns if name in table.columns]
+    keys = [columns[name] for name in names]
+    integer = [key in _INTEGER_KEYS for key in keys]
+    for row in zip(*(table.columns[name] for name in names)):
+        entry = dict(extra or {})
+        for key, value, is_integer in zip(keys, row, integer):
+            entry[key] = _integer(value) if is_integer else value
+        yield entry
+
+
+def fileset_entries(tables: dict, filesystem: str) -> Iterator[dict[str, Any]]:
+    """Convert parsed mmlsfileset -Y output into list filesets entries."""
+    table = tables.get("mmlsfileset")
+    if table is None:
+        return
+    for config in _entries(table, _FILESET_COLUMNS):
+        config["isInodeSpaceOwner"] = config.get("isInodeSpaceOwner") in ("1", "yes")
+        yield {"filesystemName": filesystem, "config": config}
+
+
+def quota_entries(tables: dict, filesystem: str) -> Iterator[dict[str, Any]]:
+    """Convert parsed mmrepquota -Y output into list quotas entries."""
+    table = tables.get("mmrepquota")
+    if table is None:
+        return
+    for entry in _entries(table, _QUOTA_COLUMNS, {"filesystemName": filesystem}):
+        for key in _BLOCK_KEYS:
+            if isinstance(entry.get(key), int):
+                entry[key] *= 1024
+        yield entry
+
+
+def record(model: Any) -> dict[str, Any]:
+    """Get the normalized record of a model, without its extra attributes."""
+    return {f.name: getattr(model, f.name) for f in fields(model) if f.name != "_extra"}
+
+
+class HybridLister:
+    """Serve listings from the faster of the REST API and the CLI."""
+
+    # kind -> (command, column map, entry converter, model)
+    KINDS: dict[str, tuple] = {
+        FILESETS: ("mmlsfileset", _FILESET_COLUMNS, fileset_entries, Fileset),
+        QUOTAS: ("mmrepquota", _QUOTA_COLUMNS, quota_entries, Quota),
+    }
+
+    def __init__(
+        self,
+        executor_factory: Optional[Callable[[], Any]] = None,
+        cli_backoff: float = 300.0,
+        explore_factor: float = 2.0,
+    ):
+        """Initialize the lister.
+
+        Args:
+            executor_factory: Creates the SSHCommandExecutor of CLI listings
+                (default: the [ssh] node of tools/cli/connection.py)
+            cli_backoff: Seconds the CLI is avoided after a failure
+            explore_factor: Cost ratio up to which a backend without
+                measurements is tried
+        """
+        self.executor_factory = executor_factory
+        self.cli_backoff = cli_backoff
+        self.explore_factor = explore_factor
+        self.models = {
+            (backend, kind): CostModel(**_PRIORS[backend])
+            for backend in (REST, CLI)
+            for kind in self.KINDS
+        }
+        self.choices = {REST: 0, CLI: 0}
+        self.fallbacks = 0
+        self._sizes: dict[tuple[str, str, str], int] = {}
+        self._cli_down_until = 0.0
+
+    def _cli_executor(self) -> Any:
+        if self.executor_factory is None:
+            # Imported late: the module requires the [ssh] section
+            from scale_mcp_server.tools.cli.connection import create_executor
+
+            self.executor_factory = create_executor
+        return self.executor_factory()
+
+    def choose(
+        self,
+        kind: str,
+        filesystem: str,
+        domain: Optional[str] = None,
+        backend: Optional[str] = None,
+    ) -> str:
+        """Choose the backend of a listing.
+
+        Args:
+            kind: FILESETS or QUOTAS
+            filesystem: Filesystem name
+            domain: Authorization domain of the listing
+            backend: AUTO, REST or CLI (default: [scale_api] listing_backend)
+
+        Returns:
+            REST or CLI
+        """
+        config = cluster_config(read_config(config_path=scale_config_path()))
+        backend = (
+            backend or config.get("scale_api", {}).get("listing_backend", AUTO)
+        ).lower()
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Invalid listing backend '{backend}', expected {BACKENDS}"
+            )
+
+        cluster = request_cluster.get() or DEFAULT_CLUSTER
+        if (
+            backend == REST
+            or domain
+            or cluster != DEFAULT_CLUSTER
+            or "ssh" not in config
+        ):
+            return REST
+        if backend == CLI:
+            return CLI
+        if time.monotonic() < self._cli_down_until:
+            return REST
+        size = self._sizes.get((cluster, kind, filesystem))
+        if size is None:
+            return REST
+        rest_model, cli_model = self.models[(REST, kind)], self.models[(CLI, kind)]
+        rest, cli = rest_model.predict(size), cli_model.predict(size)
+        if not cli_model.samples and cli <= rest * self.explore_factor:
+            return CLI
+        if not rest_model.samples and rest <= cli * self.explore_factor:
+            return REST
+        return CLI if cli < rest else REST
+
+    async def _list_rest(self, kind: str, filesystem: str, domain: Optional[str]):
+        """List all pages of a REST collection."""
+        model = self.KINDS[kind][3]
+        call = list_filesets_api if kind == FILESETS else list_quotas_api
+        items: list = []
+        page_token = None
+        while True:
+            body = loads(
+                await call(
+                    filesystem=filesystem,
+                    domain=domain,
+                    raw=True,
+                    page_token=page_token,
+                )
+            )
+            items.extend(decode_list(body, kind, model.from_entry))
+            page_token = body.get("next_page_token")
+            if not page_token:
+                return items
+
+    def _list_cli(self, kind: str, filesystem: str) -> list:
+        command, columns, convert, model = self.KINDS[kind]
+        parser = MmParser(columns)
+        with self._cli_executor() as executor:
+            parser.feed_lines(executor.execute_lines([command, filesystem, "-Y"]))
+        items = []
+        for entry in convert(parser.tables, filesystem):
+            item = model.from_entry(entry)
+            if item is not None:
+                items.append(item)
+        return items
+
+    async def list(
+        self,
+        kind: str,
+        filesystem: str,
+        domain: Optional[str] = None,
+        backend: Optional[str] = None,
+    ) -> tuple[list, str, float]:
+        """List the filesets or quotas of a filesystem.
+
+        Args:
+            kind: FILESETS or QUOTAS
+            filesystem: Filesystem name
+            domain: Domain to be authorized against (forces the REST API)
+            backend: AUTO, REST or CLI (default: [scale_api] listing_backend)
+
+        Returns:
+            Models of the listed entities, the backend that served them and
+            the duration in seconds
+        """
+        chosen = self.choose(kind, filesystem, domain, backend)
+        started = time.perf_counter()
+        if chosen == CLI:
+            try:
+                items = await asyncio.to_thread(self._list_cli, kind, filesystem)
+            except Exception as e:
+                if backend == CLI:
+                    raise
+                logger.warning(
+                    f"CLI listing of {kind} in {filesystem} failed, using the "
+                    f"REST API for {self.cli_backoff:.0f}s: {e}"
+                )
+                self._cli_down_until = time.monotonic() + self.cli_backoff
+                self.fallbacks += 1
+                chosen = REST
+                started = time.perf_counter()
+        if chosen == REST:
+            items = await self._list_rest(kind, filesystem, domain)
+
+        elapsed = time.perf_counter() - started
+        self.models[(chosen, kind)].observe(len(items), elapsed)
+        cluster = request_cluster.get() or DEFAULT_CLUSTER
+        self._sizes[(cluster, kind, filesystem)] = len(items)
+        self.choices[chosen] += 1
+        logger.debug(
+            f"Listed {len(items)} {kind} of {filesystem} with {chosen} "
+            f"in {elapsed * 1000:.1f} ms"
+        )
+        return items, chosen, elapsed
+
+    def stats(self) -> dict[str, Any]:
+        """Get the cost models, choices and fallbacks."""
+        return {
+            "models": {
+                f"{backend}:{kind}": model.stats()
+                for (backend, kind), model in self.models.items()
+            },
+            "choices": dict(self.choices),
+            "fallbacks": self.fallbacks,
+            "cli_available": time.monotonic() >= self._cli_down_until,
+            "sizes": {
+                f"{cluster}:{kind}:{filesystem}": size
+                for (cluster, kind, filesystem), size in self._sizes.items()
+            },
+        }
+
+
+_lister: Optional[HybridLister] = None
+
+
+def get_lister() -> HybridLister:
+    """Get the process-wide HybridLister."""
+    global _lister
+    if _lister is None:
+        _lister = HybridLister()
+    return _lister
+
+
+def records(items: Iterable[Any]) -> list[dict[str, Any]]:
+    """Get the normalized records of models."""
+    return [record(item) for item in items]
@@ -0,0 +1,114 @@
+"""Structured JSON log records.
+
+With format = json in the [logging] section, every log record is written as
+one JSON object per line. Records of upstream REST requests carry the fields
+below in addition to time, name, level and message, so request latencies can
+be analysed straight from the log file:
+
+- tool: Name of the tool call the request was made for
+- method: HTTP method
+- endpoint: Endpoint template, e.g. '/scalemgmt/v3/filesystems/{filesystem}'
+- status: HTTP status, absent if the request failed in transport
+- duration_ms: Time from queuing the request to receiving the response body
+- bytes: Size of the response body
+
+Every request, whether it succeeds or fails, is logged once at INFO level
+by the 'scale_mcp_server.requests' logger, which is not subject to debug
+sampling.
+"""
+
+import logging
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from scale_mcp_server.utils.serialization import dumps
+
+REQUEST_FIELDS = ("tool", "method", "endpoint", "status", "duration_ms", "bytes")
+
+# Placeholder of the identifier following a collection segment
+_IDENTIFIERS = {
+    "filesystems": "{filesystem}",
+    "filesets": "{fileset}",
+    "snapshots": "{snapshot}",
+    "nodes": "{node}",
+    "nsds": "{nsd}",
+    "storagepools": "{pool}",
+    "remote": "{cluster}",
+}
+
+# Fixed segments that may follow a collection segment
+_SUBRESOURCES = frozenset(
+    (
+        "config",
+        "diagnostics",
+        "events",
+        "health",
+        "policy",
+        "quotas",
+        "remote",
+        "snapshots",
+        "state",
+        "states",
+        "status",
+        "trust",
+        "usage",
+    )
+)
+
+# Name of the tool called by the current request
+request_tool: ContextVar[Optional[str]] = ContextVar("request_tool", default=None)
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Replace resource names in an endpoint path with placeholders.
+
+    Args:
+        endpoint: Endpoint path, optionally with a query string
+
+    Returns:
+        Path template, e.g. '/scalemgmt/v3/filesystems/{filesystem}/filesets'
+    """
+    segments = endpoint.split("?", 1)[0].split("/")
+    for i in range(1, len(segments)):
+        name, sep, action = segments[i].partition(":")
+        placeholder = _IDENTIFIERS.get(segments[i - 1])
+        if placeholder and name and name not in _SUBRESOURCES:
+            segments[i] = placeholder + sep + action
+    return "/".join(segments)
+
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "name": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for field in REQUEST_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return dumps(entry)
+
+
+class LogContextMiddleware(Middleware):
+    """Make the name of the called tool available to log records."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: Any) -> Any:
+        token = request_tool.set(context.message.name)
+        try:
+            return await call_next(context)
+        finally:
+            request_tool.reset(token)
@@ -0,0 +1,205 @@
+"""Non-blocking logging pipeline.
+
+Log records are put on a bounded in-memory queue by a QueueHandler attached
+to the root logger; a QueueListener thread formats them and writes them to
+the console and log file handlers. Threads logging, most importantly the
+event loop, never wait for terminal or disk I/O:
+
+- When the queue is full, records are dropped and counted instead of
+  blocking. The next record that fits is preceded by a warning with the
+  number of records dropped.
+- The DEBUG records the REST client emits for every request can be sampled
+  and rate limited, so debug logging stays affordable under load. DEBUG
+  records of other loggers are never sampled.
+
+Message arguments are merged and exception tracebacks rendered on the
+logging thread, since they may refer to objects that change afterwards;
+everything else is formatted by the listener.
+"""
+
+import atexit
+import copy
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+
+# Loggers of the request path, whose DEBUG records are sampled
+REQUEST_LOGGERS = ("scale_mcp_server.utils.client",)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking on a full queue."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._unreported = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge message arguments and render tracebacks, leave formatting."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record on the queue, or count it as dropped if it is full."""
+        if self._unreported:
+            warning = logging.LogRecord(
+                __name__,
+                logging.WARNING,
+                __file__,
+                0,
+                f"Log queue full, dropped {self._unreported} log records",
+                None,
+                None,
+            )
+            try:
+                self.queue.put_nowait(warning)
+                self._unreported = 0
+            except queue.Full:
+                pass
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self._unreported += 1
+
+
+class DebugSampler(logging.Filter):
+    """Sample and rate limit the DEBUG records of the request path per logger.
+
+    Records at INFO and above, and records of other loggers, always pass.
+    """
+
+    def __init__(
+        self,
+        sample: int = 1,
+        rate_limit: float = 0.0,
+        loggers: tuple[str, ...] = REQUEST_LOGGERS,
+    ):
+        """Initialize the sampler.
+
+        Args:
+            sample: Keep one in every sample DEBUG records of a logger
+            rate_limit: DEBUG records per second and logger (0 is unlimited)
+            loggers: Names of the sampled loggers, including their children
+        """
+        super().__init__()
+        self.sample = max(1, sample)
+        self.rate_limit = rate_limit
+        self.loggers = loggers
+        self.suppressed = 0
+        self._seen: dict[str, int] = {}
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        if self.sample == 1 and not self.rate_limit:
+            return True
+        if not any(
+            record.name == name or record.name.startswith(name + ".")
+            for name in self.loggers
+        ):
+            return True
+        with self._lock:
+            keep = self._keep(record.name)
+            if not keep:
+                self.suppressed += 1
+            return keep
+
+    def _keep(self, name: str) -> bool:
+        seen = self._seen.get(name, 0)
+        self._seen[name] = seen + 1
+        if seen % self.sample:
+            return False
+        if not self.rate_limit:
+            return True
+
+        # Token bucket holding up to one second worth of records
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(name, (self.rate_limit, now))
+        tokens = min(self.rate_limit, tokens + (now - updated) * self.rate_limit)
+        if tokens < 1:
+            self._buckets[name] = (tokens, now)
+            return False
+        self._buckets[name] = (tokens - 1, now)
+        return True
+
+
+_pipeline: dict[str, Any] = {}
+
+
+def start_pipeline(
+    handlers: list[logging.Handler],
+    queue_size: int = 10000,
+    debug_sample: int = 1,
+    debug_rate_limit: float = 0.0,
+) -> QueueHandler:
+    """Route root logger records through a queue to handlers on a thread.
+
+    Replaces the handlers of the root logger and stops a previously started
+    pipeline.
+
+    Args:
+        handlers: Handlers the listener thread writes to
+        queue_size: Maximum number of queued records
+        debug_sample: Keep one in every debug_sample DEBUG records of the
+            request path per logger
+        debug_rate_limit: DEBUG records of the request path per second and
+            logger (0 is unlimited)
+
+    Returns:
+        The queue handler attached to the root logger
+    """
+    stop_pipeline()
+    log_queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+    handler = DroppingQueueHandler(log_queue)
+    sampler = DebugSampler(debug_sample, debug_rate_limit)
+    handler.addFilter(sampler)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    root_logger.addHandler(handler)
+    _pipeline.update(handler=handler, sampler=sampler, listener=listener)
+    return handler
+
+
+def stop_pipeline() -> None:
+    """Flush the queued records and stop the listener thread."""
+    listener: Optional[QueueListener] = _pipeline.pop("listener", None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+    _pipeline.clear()
+
+
+def pipeline_stats() -> dict[str, Any]:
+    """Get queue depth, dropped and sampled-out record counts."""
+    handler: Optional[DroppingQueueHandler] = _pipeline.get("handler")
+    sampler: Optional[DebugSampler] = _pipeline.get("sampler")
+    if handler is None or sampler is None:
+        return {"enabled": False}
+    return {
+        "enabled": True,
+        "queued": handler.queue.qsize(),
+        "queue_size": handler.queue.maxsize,
+        "dropped": handler.dropped,
+        "debug_suppressed": sampler.suppressed,
+        "debug_sample": sampler.sample,
+        "debug_rate_limit": sampler.rate_limit,
+    }
+
+
+atexit.register(stop_pipeline)
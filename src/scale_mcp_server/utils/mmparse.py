@@ -0,0 +1,203 @@
+"""Parser for the machine-readable (-Y) output of Storage Scale mm commands.
+
+With -Y, the mm commands print one colon-separated record per line:
+
+    mmlsfileset::HEADER:version:reserved:reserved:filesystemName:filesetName:...
+    mmlsfileset::0:1:::gpfs0:root:...
+
+The first field is the command and the second a section name; commands such
+as mmlscluster print several sections, each with its own columns. A HEADER
+in the third field marks the row naming the columns of its section. Values
+holding a colon or other special characters are percent-encoded, e.g. '%3A'.
+
+MmParser consumes the output one line at a time and appends the selected
+columns of every row to the column lists of its section's MmTable. Columns
+that are not selected are never stored, so memory grows with the selected
+columns only. Lines that are not -Y records, such as warnings, are skipped.
+"""
+
+from operator import itemgetter
+from typing import Any, Iterable, Optional
+from urllib.parse import unquote
+
+# Leading fields of every record: command, section and HEADER marker
+_PREFIX_FIELDS = 3
+
+# Percent-escapes of ASCII characters, in both letter cases
+_ASCII_ESCAPES = {f"{code:02X}": chr(code) for code in range(128)}
+_ASCII_ESCAPES.update({f"{code:02x}": chr(code) for code in range(128)})
+
+
+def _unquote(value: str) -> str:
+    """Decode a percent-encoded value.
+
+    Three times faster than urllib's unquote for the ASCII escapes of -Y
+    output; other escapes, such as UTF-8 sequences, are left to unquote.
+    """
+    parts = value.split("%")
+    decoded = [parts[0]]
+    for part in parts[1:]:
+        char = _ASCII_ESCAPES.get(part[:2])
+        if char is None:
+            return unquote(value)
+        decoded.append(char)
+        decoded.append(part[2:])
+    return "".join(decoded)
+
+
+class MmTable:
+    """Columns of one section of -Y output."""
+
+    def __init__(
+        self, command: str, section: str, header: list[str], columns: Optional[set]
+    ):
+        """Initialize the table from the HEADER row of its section.
+
+        Args:
+            command: Command that printed the section
+            section: Section name, empty for commands with a single section
+            header: Fields of the HEADER row
+            columns: Names of the columns to keep (default: all)
+        """
+        self.command = command
+        self.section = section
+        self.rows = 0
+        self.columns: dict[str, list[str]] = {}
+
+        indices = []
+        for index, name in enumerate(header):
+            if index < _PREFIX_FIELDS or not name or name in self.columns:
+                continue
+            if columns is None or name in columns:
+                self.columns[name] = []
+                indices.append(index)
+        self.prefix = f"{command}:{section}:"
+        self._appends = [values.append for values in self.columns.values()]
+        # Fields after the last selected one are left unsplit
+        self._width = max(indices, default=_PREFIX_FIELDS) + 1
+        # itemgetter returns a tuple for several indices only
+        if len(indices) == 1:
+            index = indices[0]
+            self._select = lambda fields: (fields[index],)
+        elif indices:
+            self._select = itemgetter(*indices)
+        else:
+            self._select = lambda fields: ()
+
+    def add(self, line: str) -> None:
+        """Append the selected values of a data row.
+
+        Args:
+            line: Data row without its line terminator
+        """
+        fields = line.split(":", self._width)
+        if len(fields) < self._width:
+            fields.extend([""] * (self._width - len(fields)))
+        values = self._select(fields)
+        if "%" in line:
+            values = [_unquote(value) if "%" in value else value for value in values]
+        for append, value in zip(self._appends, values):
+            append(value)
+        self.rows += 1
+
+    def records(self) -> list[dict[str, str]]:
+        """Get the rows as dictionaries keyed by column name."""
+        names = list(self.columns)
+        return [dict(zip(names, row)) for row in zip(*self.columns.values())]
+
+    def to_dict(self, limit: Optional[int] = None) -> dict[str, Any]:
+        """Get the table as a JSON-serializable dictionary.
+
+        Args:
+            limit: Maximum number of rows to include (default: all)
+        """
+        return {
+            "command": self.command,
+            "section": self.section,
+            "rows": self.rows,
+            "columns": {
+                name: values[:limit] if limit is not None else values
+                for name, values in self.columns.items()
+            },
+        }
+
+
+class MmParser:
+    """Streaming parser of -Y output."""
+
+    def __init__(self, columns: Optional[Iterable[str]] = None):
+        """Initialize the parser.
+
+        Args:
+            columns: Names of the columns to keep in every section
+                (default: all)
+        """
+        self.columns = set(columns) if columns is not None else None
+        self.tables: dict[str, MmTable] = {}
+        self.skipped = 0
+        # (command, section) -> table, for the hot path
+        self._tables: dict[tuple[str, str], MmTable] = {}
+
+    def feed(self, line: str) -> Optional[MmTable]:
+        """Parse one line of output.
+
+        Returns:
+            Table the line was added to or started, None if it was skipped
+        """
+        line = line.rstrip("\r\n")
+        fields = line.split(":", _PREFIX_FIELDS)
+        if len(fields) <= _PREFIX_FIELDS:
+            if line.strip():
+                self.skipped += 1
+            return None
+        key = (fields[0], fields[1])
+        if fields[2] == "HEADER":
+            table = MmTable(fields[0], fields[1], line.split(":"), self.columns)
+            self._tables[key] = table
+            self.tables[fields[1] or fields[0]] = table
+            return table
+        table = self._tables.get(key)
+        if table is None:
+            self.skipped += 1
+            return None
+        table.add(line)
+        return table
+
+    def feed_lines(self, lines: Iterable[str]) -> "MmParser":
+        """Parse lines of output."""
+        # Rows of the section of the previous line take the fast path
+        table = None
+        prefix = header = None
+        for line in lines:
+            if (
+                prefix is not None
+                and line.startswith(prefix)
+                and not line.startswith(header)
+            ):
+                if line[-1:] == "\n":
+                    line = line.rstrip("\r\n")
+                table.add(line)
+                continue
+            table = self.feed(line)
+            if table is not None:
+                prefix, header = table.prefix, f"{table.prefix}HEADER:"
+            else:
+                prefix = header = None
+        return self
+
+
+def parse_mm_output(
+    output: str | Iterable[str], columns: Optional[Iterable[str]] = None
+) -> dict[str, MmTable]:
+    """Parse -Y output into tables.
+
+    Args:
+        output: Command output, as text or as an iterable of lines
+        columns: Names of the columns to keep in every section (default: all)
+
+    Returns:
+        Tables keyed by section name, or by command for commands with a
+        single section
+    """
+    lines = output.splitlines() if isinstance(output, str) else output
+    return MmParser(columns).feed_lines(lines).tables
@@ -0,0 +1,188 @@
+"""Compact models for the most common REST entities.
+
+Listings of tens of thousands of filesets or quotas are expensive to hold
+as nested dictionaries. The models below keep the frequently used attributes
+in slotted dataclasses and store every other attribute (nested
+sections such as 'afm' or 'usage' and rarely used config keys) as a single
+compact JSON blob that is only decoded when the extra property is accessed.
+
+Snapshots are represented by retention.SnapshotRef.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Optional, TypeVar, Union
+
+from scale_mcp_server.utils.serialization import dumps, loads
+
+T = TypeVar("T")
+
+# Keys stored as attributes; everything else goes into the lazy extra blob
+_FILESET_KEYS = frozenset(
+    (
+        "config",
+        "filesystemName",
+        "filesetName",
+        "id",
+        "path",
+        "isInodeSpaceOwner",
+        "status",
+    )
+)
+_INDEPENDENT_KEYS = ("isInodeSpaceOwner", "inodeSpaceOwner", "inode_space_owner")
+_QUOTA_KEYS = frozenset(
+    (
+        "quotaId",
+        "quotaType",
+        "objectName",
+        "blockUsage",
+        "blockQuota",
+        "blockLimit",
+        "filesUsage",
+        "filesQuota",
+        "filesLimit",
+    )
+)
+
+
+def _rest(entry: dict, keys: frozenset) -> bytes:
+    """Encode the keys of an entry that are not stored as attributes."""
+    rest = {key: value for key, value in entry.items() if key not in keys}
+    return dumps(rest).encode() if rest else b""
+
+
+@dataclass(slots=True)
+class Fileset:
+    """Fileset listing entry.
+
+    Attributes:
+        name: Fileset name
+        filesystem: Owning filesystem
+        fileset_id: Fileset ID
+        path: Junction path
+        independent: Whether the fileset owns its inode space
+        status: Link status, e.g. 'Linked'
+    """
+
+    name: str
+    filesystem: Optional[str] = None
+    fileset_id: Optional[int] = None
+    path: Optional[str] = None
+    independent: bool = False
+    status: Optional[str] = None
+    _extra: bytes = field(default=b"", repr=False)
+
+    @property
+    def extra(self) -> dict:
+        """Remaining attributes, decoded on access."""
+        return loads(self._extra) if self._extra else {}
+
+    @classmethod
+    def from_entry(cls, entry: dict) -> Optional["Fileset"]:
+        """Build a Fileset from a list filesets entry.
+
+        Returns:
+            Fileset, or None if the entry carries no fileset name
+        """
+        config = entry.get("config") or {}
+        name = config.get("filesetName") or entry.get("filesetName")
+        if not name:
+            return None
+        independent = next(
+            (config[key] for key in _INDEPENDENT_KEYS if key in config),
+            config.get("inode_space_designation") == "new",
+        )
+
+        rest = {k: v for k, v in entry.items() if k not in _FILESET_KEYS}
+        config_rest = {k: v for k, v in config.items() if k not in _FILESET_KEYS}
+        if config_rest:
+            rest["config"] = config_rest
+        return cls(
+            name=name,
+            filesystem=entry.get("filesystemName"),
+            fileset_id=config.get("id"),
+            path=config.get("path"),
+            independent=bool(independent),
+            status=config.get("status"),
+            _extra=dumps(rest).encode() if rest else b"",
+        )
+
+
+@dataclass(slots=True)
+class Quota:
+    """Quota listing entry.
+
+    Attributes:
+        quota_id: Quota ID
+        quota_type: 'USR', 'GRP' or 'FILESET'
+        object_name: User, group or fileset the quota applies to
+        block_usage: Used space in bytes
+        block_quota: Soft limit of the space in bytes
+        block_limit: Hard limit of the space in bytes
+        files_usage: Used inodes
+        files_quota: Inode soft limit
+        files_limit: Inode hard limit
+    """
+
+    quota_id: Optional[int] = None
+    quota_type: Optional[str] = None
+    object_name: Optional[str] = None
+    block_usage: Optional[int] = None
+    block_quota: Optional[int] = None
+    block_limit: Optional[int] = None
+    files_usage: Optional[int] = None
+    files_quota: Optional[int] = None
+    files_limit: Optional[int] = None
+    _extra: bytes = field(default=b"", repr=False)
+
+    @property
+    def extra(self) -> dict:
+        """Remaining attributes, decoded on access."""
+        return loads(self._extra) if self._extra else {}
+
+    @classmethod
+    def from_entry(cls, entry: dict) -> "Quota":
+        """Build a Quota from a list quotas entry."""
+        return cls(
+            quota_id=entry.get("quotaId"),
+            quota_type=entry.get("quotaType"),
+            object_name=entry.get("objectName"),
+            block_usage=entry.get("blockUsage"),
+            block_quota=entry.get("blockQuota"),
+            block_limit=entry.get("blockLimit"),
+            files_usage=entry.get("filesUsage"),
+            files_quota=entry.get("filesQuota"),
+            files_limit=entry.get("filesLimit"),
+            _extra=_rest(entry, _QUOTA_KEYS),
+        )
+
+
+def decode_list(
+    body: Union[bytes, str, dict],
+    key: str,
+    model: Callable[[dict], Optional[T]],
+) -> list[T]:
+    """Decode the entities of a list response into models.
+
+    When decoding a raw body, each entry is released as soon as it has been
+    converted, so the nested dictionaries of the response are not kept alive
+    alongside the models.
+
+    Args:
+        body: Raw JSON response body, or an already decoded response
+        key: Key of the entity list, e.g. 'filesets'
+        model: Model constructor, e.g. Fileset.from_entry
+
+    Returns:
+        List of models; entries the model rejects are skipped
+    """
+    owned = isinstance(body, (bytes, str))
+    data = loads(body) if owned else body
+    entries = data.get(key) or []
+    models = []
+    for index, entry in enumerate(entries):
+        if owned:
+            entries[index] = None
+        item = model(entry)
+        if item is not None:
+            models.append(item)
+    return models
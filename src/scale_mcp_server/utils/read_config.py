@@ -1,9 +1,12 @@
 import configparser
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Dict, Any
 from logging.handlers import RotatingFileHandler
+from scale_mcp_server.utils.log_format import JsonFormatter
+from scale_mcp_server.utils.logging_queue import start_pipeline
 
 
 def read_config(config_path: Path) -> Dict[str, Any]:
@@ -22,9 +25,27 @@ def read_config(config_path: Path) -> Dict[str, Any]:
     return {section: dict(config[section]) for section in config.sections()}
 
 
+def scale_config_path() -> Path:
+    """Get the path of the Storage Scale connection configuration file.
+
+    The SCALE_CONFIG_PATH environment variable overrides the default
+    config/scale_config.ini in the project root.
+
+    Returns:
+        Path to the scale configuration file
+    """
+    override = os.environ.get("SCALE_CONFIG_PATH")
+    if override:
+        return Path(override)
+    return Path(__file__).resolve().parents[3] / "config" / "scale_config.ini"
+
+
 def setup_logging(config: Dict[str, Any]) -> None:
     """Setup logging based on MCP configuration.
 
+    Records are written to the console and log file by a background thread,
+    see utils/logging_queue.py.
+
     Args:
         config: Optional configuration dictionary.
     """
@@ -35,9 +56,7 @@ def setup_logging(config: Dict[str, Any]) -> None:
 
     # Setup formatter based on format type
     if log_format == "json":
-        formatter = logging.Formatter(
-            '{"time":"%(asctime)s","name":"%(name)s","level":"%(levelname)s","message":"%(message)s"}'
-        )
+        formatter = JsonFormatter()
     else:
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -47,14 +66,11 @@ def setup_logging(config: Dict[str, Any]) -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
-    # Clear existing handlers
-    root_logger.handlers.clear()
-
     # Setup console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # Setup file handler if file path is configured
     file_path = logging_config.get("file_path")
@@ -83,4 +99,12 @@ def setup_logging(config: Dict[str, Any]) -> None:
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Hand records to the writer thread through a bounded queue
+    start_pipeline(
+        handlers,
+        queue_size=int(logging_config.get("queue_size", 10000)),
+        debug_sample=int(logging_config.get("debug_sample", 1)),
+        debug_rate_limit=float(logging_config.get("debug_rate_limit", 0)),
+    )
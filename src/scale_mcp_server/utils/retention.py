@@ -0,0 +1,202 @@
+"""Snapshot retention planning.
+
+This module evaluates grandfather-father-son (GFS) retention policies over
+snapshot listings returned by the Storage Scale REST API and computes which
+snapshots to keep and which to delete. It performs no I/O; the snapshot tools
+feed it listings and issue the resulting delete set through the batch
+endpoints.
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional
+
+# Keys under which the REST API reports snapshot attributes
+_NAME_KEYS = ("snapshotName", "snapshot_name", "name")
+_FILESET_KEYS = ("filesetName", "fileset_name", "fileset")
+_CREATED_KEYS = ("created", "createTime", "create_time", "creation_time", "snapCreated")
+
+# Snapshot names created by the SMB/VSS integration, e.g. @GMT-2024.01.31-23.00.00
+_GMT_NAME = re.compile(r"@GMT-(\d{4})\.(\d{2})\.(\d{2})-(\d{2})\.(\d{2})\.(\d{2})")
+
+
+@dataclass
+class RetentionPolicy:
+    """Grandfather-father-son retention policy.
+
+    Attributes:
+        keep_last: Number of most recent snapshots to keep unconditionally
+        keep_hourly: Number of distinct hours to keep the newest snapshot of
+        keep_daily: Number of distinct days to keep the newest snapshot of
+        keep_weekly: Number of distinct ISO weeks to keep the newest snapshot of
+    """
+
+    keep_last: int = 0
+    keep_hourly: int = 0
+    keep_daily: int = 0
+    keep_weekly: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if the policy would keep nothing."""
+        return not (
+            self.keep_last or self.keep_hourly or self.keep_daily or self.keep_weekly
+        )
+
+
+@dataclass(slots=True)
+class SnapshotRef:
+    """Minimal view of a snapshot used for retention decisions.
+
+    Attributes:
+        name: Snapshot name
+        created: Creation time (timezone-aware), or None if unknown
+        fileset: Owning fileset for fileset snapshots, None for filesystem snapshots
+    """
+
+    name: str
+    created: Optional[datetime]
+    fileset: Optional[str] = None
+
+
+@dataclass
+class RetentionPlan:
+    """Result of evaluating a retention policy.
+
+    Attributes:
+        keep: Snapshots to keep, mapped to the reasons they are kept
+        delete: Snapshots selected for deletion, oldest first
+    """
+
+    keep: dict[tuple[Optional[str], str], list[str]] = field(default_factory=dict)
+    delete: list[SnapshotRef] = field(default_factory=list)
+
+
+def _first(entry: dict, keys: Iterable[str]) -> Any:
+    for key in keys:
+        value = entry.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse a snapshot creation time as reported by the REST API.
+
+    Accepts epoch seconds or milliseconds and ISO 8601 strings. Naive values
+    are assumed to be UTC.
+
+    Args:
+        value: Raw timestamp value
+
+    Returns:
+        Timezone-aware datetime, or None if the value cannot be parsed
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        seconds = value / 1000 if value > 1e12 else value
+        return datetime.fromtimestamp(seconds, tz=timezone.utc)
+
+    text = str(value).strip()
+    if text.isdigit():
+        return parse_timestamp(int(text))
+    # Scale reports milliseconds with a comma separator, e.g. 2024-01-31 23:00:00,123
+    text = text.replace(",", ".").replace("Z", "+00:00")
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def parse_snapshot(entry: dict) -> Optional[SnapshotRef]:
+    """Build a SnapshotRef from a snapshot listing entry.
+
+    Falls back to the @GMT name format when no creation time is reported.
+
+    Args:
+        entry: Snapshot dictionary from a list snapshots response
+
+    Returns:
+        SnapshotRef, or None if the entry carries no snapshot name
+    """
+    name = _first(entry, _NAME_KEYS)
+    if not name:
+        return None
+
+    created = parse_timestamp(_first(entry, _CREATED_KEYS))
+    if created is None:
+        match = _GMT_NAME.search(name)
+        if match:
+            created = datetime(*map(int, match.groups()), tzinfo=timezone.utc)
+
+    fileset = _first(entry, _FILESET_KEYS)
+    # The root fileset owns filesystem-level snapshots
+    if fileset == "root":
+        fileset = None
+
+    return SnapshotRef(name=name, created=created, fileset=fileset)
+
+
+def _bucket_keys(policy: RetentionPolicy) -> list[tuple[str, int, Any]]:
+    return [
+        ("hourly", policy.keep_hourly, lambda ts: (ts.date(), ts.hour)),
+        ("daily", policy.keep_daily, lambda ts: ts.date()),
+        ("weekly", policy.keep_weekly, lambda ts: ts.isocalendar()[:2]),
+    ]
+
+
+def plan_retention(
+    snapshots: Iterable[SnapshotRef],
+    policy: RetentionPolicy,
+) -> RetentionPlan:
+    """Evaluate a retention policy over filesystem and fileset snapshots.
+
+    Each scope (the filesystem itself and every fileset) is evaluated
+    independently, so a fileset's snapshots never satisfy the filesystem's
+    retention and vice versa. Snapshots without a known creation time are
+    always kept.
+
+    Args:
+        snapshots: Snapshots to evaluate
+        policy: Retention policy to apply
+
+    Returns:
+        RetentionPlan with the keep reasons and the delete set
+    """
+    scopes: dict[Optional[str], list[SnapshotRef]] = {}
+    plan = RetentionPlan()
+
+    for snapshot in snapshots:
+        if snapshot.created is None:
+            plan.keep[(snapshot.fileset, snapshot.name)] = ["unknown creation time"]
+            continue
+        scopes.setdefault(snapshot.fileset, []).append(snapshot)
+
+    for fileset, members in scopes.items():
+        members.sort(key=lambda s: s.created, reverse=True)  # type: ignore[arg-type, return-value]
+        reasons: dict[str, list[str]] = {}
+
+        for snapshot in members[: policy.keep_last]:
+            reasons.setdefault(snapshot.name, []).append("last")
+
+        for label, count, bucket_of in _bucket_keys(policy):
+            seen: set = set()
+            for snapshot in members:
+                if len(seen) >= count:
+                    break
+                bucket = bucket_of(snapshot.created)
+                if bucket not in seen:
+                    seen.add(bucket)
+                    reasons.setdefault(snapshot.name, []).append(label)
+
+        for snapshot in reversed(members):
+            if snapshot.name in reasons:
+                plan.keep[(fileset, snapshot.name)] = reasons[snapshot.name]
+            else:
+                plan.delete.append(snapshot)
+
+    plan.delete.sort(key=lambda s: s.created)  # type: ignore[arg-type, return-value]
+    return plan
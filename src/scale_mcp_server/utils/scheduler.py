@@ -0,0 +1,254 @@
+"""Priority scheduling of upstream REST requests.
+
+All requests to a management node share a fixed number of in-flight slots.
+When every slot is busy, waiting requests are ordered by weighted fair
+queuing: each (priority class, MCP session) pair is a flow whose share of the
+slots is proportional to the weight of its class. An interactive call from one
+agent therefore overtakes the queued requests of a bulk sweep from another,
+while the bulk sweep still soaks up whatever capacity is left, and two
+sessions of the same class are served in turns instead of first come, first
+served.
+
+The priority class and session of the current tool call travel in context
+variables, set by PriorityMiddleware for tool calls and by background tasks
+for their own requests.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Optional
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from scale_mcp_server.utils.helpers import request_meta
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+DEFAULT_WEIGHTS = {INTERACTIVE: 8.0, BULK: 1.0}
+
+request_priority: ContextVar[str] = ContextVar("request_priority", default=INTERACTIVE)
+request_session: ContextVar[Optional[str]] = ContextVar("request_session", default=None)
+
+
+@dataclass(order=True)
+class _Waiter:
+    tag: float
+    seq: int
+    start: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class RequestScheduler:
+    """Weighted fair queue in front of a fixed number of request slots."""
+
+    def __init__(self, capacity: int = 16, weights: Optional[dict[str, float]] = None):
+        """Initialize the scheduler.
+
+        Args:
+            capacity: Maximum number of requests in flight
+            weights: Relative share per priority class (default: interactive 8,
+                bulk 1); unknown classes get weight 1
+        """
+        self._capacity = max(1, capacity)
+        self.weights = dict(weights or DEFAULT_WEIGHTS)
+        self.in_flight = 0
+        self.virtual_time = 0.0
+        self._finish: dict[tuple[str, Optional[str]], float] = {}
+        self._queue: list[_Waiter] = []
+        self._seq = itertools.count()
+        self.dispatched: dict[str, int] = {}
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of requests in flight."""
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value: int) -> None:
+        self._capacity = max(1, int(value))
+        while self._queue and self.in_flight < self._capacity:
+            if self._wake_next():
+                self.in_flight += 1
+
+    @property
+    def waiting(self) -> int:
+        """Number of queued requests."""
+        return sum(1 for waiter in self._queue if not waiter.future.done())
+
+    def _tag(self, priority: str, session: Optional[str]) -> tuple[float, float]:
+        """Compute the start and finish tags of a new request of a flow."""
+        flow = (priority, session)
+        start = max(self.virtual_time, self._finish.get(flow, 0.0))
+        finish = start + 1.0 / self.weights.get(priority, 1.0)
+        self._finish[flow] = finish
+        if len(self._finish) > 1024:
+            # Idle flows carry no credit; forget them
+            self._finish = {
+                f: tag for f, tag in self._finish.items() if tag > self.virtual_time
+            }
+        return start, finish
+
+    def _wake_next(self) -> bool:
+        """Hand a slot to the queued request with the smallest finish tag."""
+        while self._queue:
+            waiter = heapq.heappop(self._queue)
+            if not waiter.future.done():
+                self.virtual_time = max(self.virtual_time, waiter.start)
+                waiter.future.set_result(None)
+                return True
+        return False
+
+    async def acquire(
+        self, priority: Optional[str] = None, session: Optional[str] = None
+    ) -> None:
+        """Wait for a request slot.
+
+        Args:
+            priority: Priority class (default: from the request context)
+            session: Session identifier (default: from the request context)
+        """
+        priority = priority or request_priority.get()
+        session = session if session is not None else request_session.get()
+        start, finish = self._tag(priority, session)
+        self.dispatched[priority] = self.dispatched.get(priority, 0) + 1
+
+        if self.in_flight < self._capacity and not self._queue:
+            self.in_flight += 1
+            self.virtual_time = max(self.virtual_time, start)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, _Waiter(finish, next(self._seq), start, future))
+        # The queue may only hold cancelled waiters while slots are free
+        while self.in_flight < self._capacity and self._wake_next():
+            self.in_flight += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot may have been handed over right before the cancellation
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Return a request slot, passing it on to the next queued request."""
+        if self.in_flight > self._capacity or not self._wake_next():
+            self.in_flight -= 1
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: Optional[str] = None, session: Optional[str] = None
+    ) -> AsyncIterator[None]:
+        """Hold a request slot for the duration of the block."""
+        await self.acquire(priority, session)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> dict[str, Any]:
+        """Get the current scheduler state."""
+        return {
+            "capacity": self._capacity,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "dispatched": dict(self.dispatched),
+        }
+
+
+_schedulers: dict[str, RequestScheduler] = {}
+
+
+def get_scheduler(
+    key: str, capacity: int = 16, weights: Optional[dict[str, float]] = None
+) -> RequestScheduler:
+    """Get the scheduler of an upstream endpoint, creating it on first use.
+
+    Args:
+        key: Upstream identifier, e.g. the base URL
+        capacity: Slots of a newly created scheduler
+        weights: Class weights of a newly created scheduler
+
+    Returns:
+        The shared RequestScheduler for key
+    """
+    scheduler = _schedulers.get(key)
+    if scheduler is None:
+        scheduler = _schedulers[key] = RequestScheduler(capacity, weights)
+        logger.debug(f"Created request scheduler for {key} with capacity {capacity}")
+    return scheduler
+
+
+def schedulers() -> dict[str, RequestScheduler]:
+    """Get the schedulers of all upstream endpoints, keyed by endpoint."""
+    return dict(_schedulers)
+
+
+def parse_weights(value: Optional[str]) -> dict[str, float]:
+    """Parse class weights such as 'interactive:8, bulk:1'.
+
+    Args:
+        value: Comma-separated class:weight pairs
+
+    Returns:
+        Weights merged over the defaults
+    """
+    weights = dict(DEFAULT_WEIGHTS)
+    for item in (value or "").split(","):
+        name, _, weight = item.partition(":")
+        if name.strip() and weight.strip():
+            weights[name.strip()] = max(float(weight), 0.001)
+    return weights
+
+
+class PriorityMiddleware(Middleware):
+    """Set the priority class and session of each tool call.
+
+    Tools tagged 'bulk' run at bulk priority and all others at interactive
+    priority. A client can override the class per call with a 'priority' key
+    in the request _meta.
+    """
+
+    def __init__(self) -> None:
+        self._tags: dict[str, set[str]] = {}
+
+    async def _tool_tags(self, context: MiddlewareContext, name: str) -> set[str]:
+        if name not in self._tags:
+            tags: set[str] = set()
+            if context.fastmcp_context is not None:
+                try:
+                    tool = await context.fastmcp_context.fastmcp.get_tool(name)
+                    tags = set(tool.tags) if tool else set()
+                except Exception:
+                    pass
+            self._tags[name] = tags
+        return self._tags[name]
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: Any) -> Any:
+        priority = request_meta(context, "priority")
+        if not priority:
+            tags = await self._tool_tags(context, context.message.name)
+            priority = BULK if BULK in tags else INTERACTIVE
+
+        session = None
+        if context.fastmcp_context is not None:
+            try:
+                session = context.fastmcp_context.session_id
+            except Exception:
+                pass
+
+        priority_token = request_priority.set(str(priority))
+        session_token = request_session.set(session)
+        try:
+            return await call_next(context)
+        finally:
+            request_priority.reset(priority_token)
+            request_session.reset(session_token)
@@ -0,0 +1,74 @@
+"""JSON serialization helpers.
+
+Large REST listings (tens of thousands of filesets or snapshots) make JSON
+decoding one of the hottest paths of the server. This module picks the fastest
+available backend at import time: orjson, then msgspec, then the standard
+library json module. Neither third-party package is required; install one of
+them to enable it.
+
+List tools that forward a REST response unchanged can skip decoding entirely:
+the client returns the raw response body and raw_result wraps it as the tool
+result without building a Python object graph.
+"""
+
+import json
+from typing import Any, Union
+
+from fastmcp.tools import ToolResult
+from mcp.types import TextContent
+
+try:
+    import orjson
+
+    JSON_BACKEND = "orjson"
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode a JSON document."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Encode an object as compact JSON."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+except ImportError:
+    try:
+        import msgspec
+
+        JSON_BACKEND = "msgspec"
+        _decoder = msgspec.json.Decoder()
+        _encoder = msgspec.json.Encoder(enc_hook=str)
+
+        def loads(data: Union[bytes, str]) -> Any:
+            """Decode a JSON document."""
+            return _decoder.decode(data)
+
+        def dumps(obj: Any) -> str:
+            """Encode an object as compact JSON."""
+            return _encoder.encode(obj).decode()
+
+    except ImportError:
+        JSON_BACKEND = "json"
+
+        def loads(data: Union[bytes, str]) -> Any:
+            """Decode a JSON document."""
+            return json.loads(data)
+
+        def dumps(obj: Any) -> str:
+            """Encode an object as compact JSON."""
+            return json.dumps(obj, default=str, separators=(",", ":"))
+
+
+def raw_result(data: Union[bytes, str]) -> ToolResult:
+    """Wrap an undecoded JSON response body as a tool result.
+
+    The body is forwarded as text content as is. No structured content is
+    attached, since that would require decoding it.
+
+    Args:
+        data: Raw JSON response body
+
+    Returns:
+        ToolResult with a single text content block
+    """
+    text = data.decode() if isinstance(data, bytes) else data
+    return ToolResult(content=[TextContent(type="text", text=text)])
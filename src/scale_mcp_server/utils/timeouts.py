@@ -0,0 +1,228 @@
+"""Timeout profiles for REST requests and CLI commands.
+
+A single timeout does not fit every request: a GET of one fileset should give
+up on an unreachable node after a few seconds, while listing 50k filesets or
+mounting all filesystems legitimately takes much longer. Requests are
+therefore classified, and each class has its own connect, read, write and
+pool timeouts:
+
+- read: GET of a single resource
+- list: GET of a collection, e.g. all filesets of a filesystem
+- mutation: POST, PUT, PATCH and DELETE
+- long_running: operations run as background jobs, e.g. mounting all
+  filesystems
+- cli: commands run over SSH (only the read timeout is used, as the command
+  timeout)
+
+Profiles are set in the [timeouts] section of scale_config.ini as
+comma-separated phase:seconds pairs, e.g. 'list = read:120'. Phases that are
+not set default to [scale_api] timeout for read requests and to the built-in
+defaults below otherwise.
+
+A tool call can pass a 'timeout' in the request _meta: it becomes the deadline
+of the call, and every request made on its behalf is cut short when the
+deadline passes. 'timeouts' in the _meta overrides phases of all profiles for
+that call, e.g. {"read": 120}.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from scale_mcp_server.utils.helpers import request_meta
+
+PHASES = ("connect", "read", "write", "pool")
+
+READ = "read"
+LIST = "list"
+MUTATION = "mutation"
+LONG_RUNNING = "long_running"
+CLI = "cli"
+
+DEFAULT_PROFILES = {
+    LIST: {"connect": 3.0, "read": 60.0, "write": 10.0, "pool": 10.0},
+    MUTATION: {"connect": 3.0, "read": 30.0, "write": 10.0, "pool": 10.0},
+    LONG_RUNNING: {"connect": 3.0, "read": 900.0, "write": 30.0, "pool": 30.0},
+    CLI: {"connect": 10.0, "read": 600.0, "write": 10.0, "pool": 10.0},
+}
+
+# Last path segments of collection endpoints
+_COLLECTIONS = frozenset(
+    (
+        "clusters",
+        "config",
+        "events",
+        "filesets",
+        "filesystems",
+        "nodes",
+        "nsds",
+        "quotas",
+        "remote",
+        "snapshots",
+        "states",
+        "status",
+        "storagepools",
+        "trust",
+    )
+)
+
+# Monotonic deadline of the current tool call and its phase overrides
+request_deadline: ContextVar[Optional[float]] = ContextVar(
+    "request_deadline", default=None
+)
+request_timeouts: ContextVar[Optional[dict[str, float]]] = ContextVar(
+    "request_timeouts", default=None
+)
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the deadline of a tool call has passed."""
+
+    pass
+
+
+def parse_phases(value: Optional[str]) -> dict[str, float]:
+    """Parse phase timeouts such as 'connect:3, read:60'.
+
+    Args:
+        value: Comma-separated phase:seconds pairs; a bare number sets all
+            phases
+
+    Returns:
+        Dictionary of phase to seconds
+    """
+    phases: dict[str, float] = {}
+    for item in (value or "").split(","):
+        name, sep, seconds = item.partition(":")
+        if not sep and name.strip():
+            phases.update(dict.fromkeys(PHASES, float(name)))
+        elif name.strip() in PHASES and seconds.strip():
+            phases[name.strip()] = float(seconds)
+    return phases
+
+
+def load_profiles(config: dict) -> dict[str, httpx.Timeout]:
+    """Build the timeout profiles from a scale_config.ini dictionary.
+
+    Args:
+        config: Configuration as returned by read_config
+
+    Returns:
+        Dictionary of profile name to httpx.Timeout
+    """
+    api_config = config.get("scale_api", {})
+    base = float(api_config.get("timeout", 5.0))
+    defaults = {READ: {"connect": min(base, 3.0), "read": base}, **DEFAULT_PROFILES}
+
+    timeouts_config = config.get("timeouts", {})
+    profiles = {}
+    for name, phases in defaults.items():
+        merged = {**dict.fromkeys(PHASES, base), **phases}
+        merged.update(parse_phases(timeouts_config.get(name)))
+        profiles[name] = httpx.Timeout(**merged)
+    return profiles
+
+
+def endpoint_class(method: str, endpoint: str) -> str:
+    """Classify a request into a timeout profile.
+
+    Args:
+        method: HTTP method
+        endpoint: Endpoint path, optionally with a query string
+
+    Returns:
+        'read', 'list' or 'mutation'
+    """
+    if method != "GET":
+        return MUTATION
+    segment = endpoint.split("?", 1)[0].rstrip("/").rsplit("/", 1)[-1]
+    return LIST if segment in _COLLECTIONS else READ
+
+
+def remaining() -> Optional[float]:
+    """Seconds left until the deadline of the current tool call, if any."""
+    deadline = request_deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def shortened() -> bool:
+    """Whether the current tool call sets a deadline or timeout overrides."""
+    return request_deadline.get() is not None or bool(request_timeouts.get())
+
+
+def effective_timeout(profile: httpx.Timeout) -> httpx.Timeout:
+    """Apply the phase overrides and deadline of the current tool call.
+
+    Args:
+        profile: Timeout profile of the request
+
+    Returns:
+        Timeout with every phase cut to the remaining time of the call
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed
+    """
+    overrides = request_timeouts.get()
+    left = remaining()
+    if not overrides and left is None:
+        return profile
+    if left is not None and left <= 0:
+        raise DeadlineExceeded("Deadline of the tool call exceeded")
+    phases = {phase: getattr(profile, phase) for phase in PHASES}
+    phases.update(overrides or {})
+    if left is not None:
+        phases = {
+            phase: left if seconds is None else min(seconds, left)
+            for phase, seconds in phases.items()
+        }
+    return httpx.Timeout(**phases)
+
+
+@asynccontextmanager
+async def deadline_scope() -> AsyncIterator[None]:
+    """Cancel the enclosed block when the deadline of the tool call passes.
+
+    Raises:
+        DeadlineExceeded: If the deadline passes inside the block
+    """
+    left = remaining()
+    if left is None:
+        yield
+        return
+    if left <= 0:
+        raise DeadlineExceeded("Deadline of the tool call exceeded")
+    try:
+        async with asyncio.timeout(left):
+            yield
+    except TimeoutError as e:
+        raise DeadlineExceeded("Deadline of the tool call exceeded") from e
+
+
+class DeadlineMiddleware(Middleware):
+    """Set the deadline and timeout overrides of each tool call from _meta."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: Any) -> Any:
+        timeout = request_meta(context, "timeout")
+        overrides = request_meta(context, "timeouts")
+        deadline = time.monotonic() + float(timeout) if timeout else None
+        if isinstance(overrides, dict):
+            overrides = {
+                phase: float(seconds)
+                for phase, seconds in overrides.items()
+                if phase in PHASES
+            }
+        else:
+            overrides = None
+
+        deadline_token = request_deadline.set(deadline)
+        timeouts_token = request_timeouts.set(overrides)
+        try:
+            return await call_next(context)
+        finally:
+            request_deadline.reset(deadline_token)
+            request_timeouts.reset(timeouts_token)
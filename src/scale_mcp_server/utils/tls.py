@@ -0,0 +1,86 @@
+"""TLS contexts shared by all clients of the process.
+
+httpx builds a new SSLContext for every client it creates, loading the whole
+CA bundle each time, which costs milliseconds per StorageScaleClient. The
+contexts here are built once per verification setting and shared by the v2
+and v3 clients, their connection pools and the health probes of the
+endpoint router.
+
+Verification is configured in the [authorization] section:
+
+- allow_insecure: Do not verify the server certificate
+- ca_bundle: PEM file or directory of CA certificates to verify against,
+  e.g. the CA that signed the certificate of the management GUI (default:
+  SSL_CERT_FILE or SSL_CERT_DIR from the environment, else the certifi bundle)
+
+httpcore sets the ALPN protocols on the context of each connection, so
+HTTP/1.1 and HTTP/2 clients get separate contexts. Connections do not resume
+TLS sessions of earlier connections, since httpcore does not pass a session
+to the handshake; pooled connections avoid repeated handshakes instead.
+"""
+
+import os
+import ssl
+import threading
+from typing import Optional
+
+import certifi
+
+# (verify, CA bundle, http2) -> context
+_contexts: dict[tuple[bool, Optional[str], bool], ssl.SSLContext] = {}
+_lock = threading.Lock()
+
+
+def _create_context(verify: bool, ca_bundle: Optional[str]) -> ssl.SSLContext:
+    if not verify:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return context
+    if ca_bundle is None:
+        # Same default as httpx
+        if os.environ.get("SSL_CERT_FILE"):
+            return ssl.create_default_context(cafile=os.environ["SSL_CERT_FILE"])
+        if os.environ.get("SSL_CERT_DIR"):
+            return ssl.create_default_context(capath=os.environ["SSL_CERT_DIR"])
+        return ssl.create_default_context(cafile=certifi.where())
+    if os.path.isdir(ca_bundle):
+        return ssl.create_default_context(capath=ca_bundle)
+    return ssl.create_default_context(cafile=ca_bundle)
+
+
+def ssl_context(
+    verify: bool = True, ca_bundle: Optional[str] = None, http2: bool = False
+) -> ssl.SSLContext:
+    """Get the shared TLS context of a verification setting.
+
+    Args:
+        verify: Verify the server certificate
+        ca_bundle: CA certificate file or directory (ignored without verify)
+        http2: The context is used by HTTP/2 clients
+
+    Returns:
+        SSLContext to pass as verify to httpx
+
+    Raises:
+        OSError: If the CA bundle cannot be read
+        ssl.SSLError: If the CA bundle holds no valid certificates
+    """
+    if ca_bundle and verify:
+        ca_bundle = os.path.abspath(os.path.expanduser(ca_bundle))
+    else:
+        ca_bundle = None
+    key = (verify, ca_bundle, http2)
+    context = _contexts.get(key)
+    if context is None:
+        with _lock:
+            context = _contexts.get(key)
+            if context is None:
+                context = _contexts[key] = _create_context(verify, ca_bundle)
+    return context
+
+
+def clear_contexts() -> None:
+    """Forget the shared contexts, e.g. after the CA bundle was replaced."""
+    with _lock:
+        _contexts.clear()